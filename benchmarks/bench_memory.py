@@ -0,0 +1,148 @@
+"""Compare session deck memory: ORM ``Word`` instances vs ``WordRecord`` tuples.
+
+Also reports what each ``SessionManager`` session adds on top of the shared
+snapshot after ``--answers`` cards. Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_memory.py --rows 100000 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from tak_flashcard.constants import Direction, Mode
+from tak_flashcard.db import repo
+from tak_flashcard.db.models import Word, normalized_columns
+from tak_flashcard.db.session import create_sqlite_engine, init_db
+from tak_flashcard.features.flashcard.manager import SessionManager, VocabularySnapshot
+
+PARTS = ["noun", "verb", "adjective", "adverb", "phrase"]
+
+
+def _row(idx: int, rng: random.Random) -> dict[str, object]:
+    """Build one synthetic word row, including its lookup columns."""
+
+    english, vietnamese, part = f"word_{idx}", f"nghia_{idx}", rng.choice(PARTS)
+    return {
+        "english": english,
+        "vietnamese": vietnamese,
+        "part_of_speech": part,
+        "display_count": rng.randint(0, 20),
+        "correct_count": 0,
+        "difficulty": rng.random(),
+        **normalized_columns(english, vietnamese, part),
+    }
+
+
+def _populate(path: Path, rows: int, seed: int) -> None:
+    """Create a database at path holding the requested number of rows."""
+
+    engine = create_sqlite_engine(path)
+    init_db(engine)
+    rng = random.Random(seed)
+    stmt = insert(Word.__table__)
+    with engine.begin() as connection:
+        for start in range(0, rows, 50_000):
+            connection.execute(stmt, [
+                _row(idx, rng) for idx in range(start, min(start + 50_000, rows))
+            ])
+    engine.dispose()
+
+
+def _measure(factory: sessionmaker, loader: Callable[[Session], list]) -> tuple[float, float]:
+    """Return (seconds, MiB retained) for loading the deck with ``loader``.
+
+    Time is measured on an untraced load, since tracemalloc itself slows
+    allocation-heavy code considerably.
+    """
+
+    db = factory()
+    started = time.perf_counter()
+    deck = loader(db)
+    elapsed = time.perf_counter() - started
+    assert deck
+    del deck
+    db.close()
+
+    db = factory()
+    gc.collect()
+    tracemalloc.start()
+    deck = loader(db)
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    db.close()
+    return elapsed, retained / (1024 * 1024)
+
+
+def _measure_sessions(db: Session, sessions: int, answers: int) -> float:
+    """Return the bytes each managed session retains after ``answers`` cards.
+
+    The shared snapshot and its samplers, including anything they cache on
+    their first draw, are built before tracing starts, so only per-session
+    state is counted.
+    """
+
+    snapshot = VocabularySnapshot.load(db)
+    rng = random.Random(7)
+    manager = SessionManager(snapshot, rng=rng)
+    levels = range(1, 6)
+    for level in levels:
+        snapshot.sampler_for(level).sample(rng)
+    gc.collect()
+    tracemalloc.start()
+    for idx in range(sessions):
+        token = manager.start(Mode.ENDLESS, Direction.MIXED, levels[idx % len(levels)]).token
+        for _ in range(answers):
+            manager.next_card(token)
+            manager.submit(token, "")
+    manager.take_answers()
+    gc.collect()
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / sessions
+
+
+def main() -> None:
+    """Run the benchmark for each requested deck size and print a table."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--sessions", type=int, default=2000,
+                        help="managed sessions for the per-session figure")
+    parser.add_argument("--answers", type=int, default=20,
+                        help="cards each managed session answers")
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'loader':>8} {'seconds':>9} {'MiB':>9} {'bytes/row':>10}")
+    for rows in args.rows:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "bench.db"
+            _populate(path, rows, args.seed)
+            engine = create_sqlite_engine(path)
+            factory = sessionmaker(bind=engine, expire_on_commit=False)
+            for name, loader in (("orm", repo.list_words), ("records", repo.list_word_records)):
+                seconds, mib = _measure(factory, loader)
+                per_row = mib * 1024 * 1024 / rows
+                print(f"{rows:>9,} {name:>8} {seconds:>9.2f} {mib:>9.1f} {per_row:>10.0f}")
+            db = factory()
+            per_session = _measure_sessions(db, args.sessions, args.answers)
+            db.close()
+            print(f"{rows:>9,} {'session':>8} {'':>9} {'':>9} {per_session:>10.0f}"
+                  f"  (bytes per session after {args.answers} answers)")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compare FTS5 and LIKE dictionary search on synthetic decks.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_search.py --rows 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from tak_flashcard.db import fts, repo
+from tak_flashcard.db.models import Word, normalized_columns
+from tak_flashcard.db.session import create_sqlite_engine, init_db
+
+SYLLABLES_EN = ["ka", "lo", "mi", "ter", "son", "bra", "del", "quo", "vin", "ap", "ex", "ul"]
+SYLLABLES_VN = ["đường", "phố", "nhà", "cửa", "học", "sinh", "bàn", "ghế", "nước", "mắm", "trời", "đất"]
+QUERIES = ["kalo", "ter son", "duong", "đường phố", "hoc sinh", "nuoc"]
+
+
+def _make_rows(count: int, rng: random.Random):
+    """Yield synthetic word rows with multi-syllable text."""
+
+    for idx in range(count):
+        # The numeric suffix keeps (english, vietnamese) pairs unique.
+        english = "".join(rng.choices(SYLLABLES_EN, k=3)) + str(idx)
+        vietnamese = " ".join(rng.choices(SYLLABLES_VN, k=2))
+        yield {
+            "english": english,
+            "vietnamese": vietnamese,
+            "part_of_speech": "noun",
+            "display_count": 0,
+            "correct_count": 0,
+            "difficulty": 0.5,
+            **normalized_columns(english, vietnamese, "noun"),
+        }
+
+
+def _populate(path: Path, rows: int, seed: int) -> None:
+    """Create a database at path holding the requested number of rows."""
+
+    engine = create_sqlite_engine(path)
+    init_db(engine)
+    rng = random.Random(seed)
+    stmt = insert(Word.__table__)
+    generator = _make_rows(rows, rng)
+    with engine.begin() as connection:
+        while True:
+            chunk = [row for _, row in zip(range(50_000), generator)]
+            if not chunk:
+                break
+            connection.execute(stmt, chunk)
+    engine.dispose()
+
+
+def _time_queries(search, db, repeats: int) -> dict[str, float]:
+    """Return the median latency in milliseconds per query."""
+
+    results: dict[str, float] = {}
+    for query in QUERIES:
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            search(db, query)
+            samples.append((time.perf_counter() - started) * 1000)
+        results[query] = statistics.median(samples)
+    return results
+
+
+def run(rows: int, repeats: int, limit: int, seed: int) -> None:
+    """Benchmark both search paths on a deck of ``rows`` words."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        started = time.perf_counter()
+        _populate(path, rows, seed)
+        build_seconds = time.perf_counter() - started
+        engine = create_sqlite_engine(path)
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
+        if not fts.is_available(db):
+            print(f"{rows} rows: FTS5 unavailable, only LIKE timings are meaningful")
+
+        def fts_search(session, query):
+            """Search through the FTS index."""
+
+            match = fts.build_match(query)
+            return repo.search_words_fts(session, match, limit) if match else []
+
+        def like_search(session, query):
+            """Search with LIKE scans."""
+
+            return repo.search_words_like(session, query, limit)
+
+        fts_times = _time_queries(fts_search, db, repeats)
+        like_times = _time_queries(like_search, db, repeats)
+        db.close()
+        engine.dispose()
+
+    print(f"\n{rows:,} rows (built in {build_seconds:.1f}s, limit={limit})")
+    print(f"{'query':<14}{'fts ms':>10}{'like ms':>10}{'speedup':>10}")
+    for query in QUERIES:
+        speedup = like_times[query] / fts_times[query] if fts_times[query] else float("inf")
+        print(f"{query:<14}{fts_times[query]:>10.2f}{like_times[query]:>10.2f}{speedup:>9.1f}x")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark for each deck size."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    for rows in args.rows:
+        run(rows, args.repeats, args.limit, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Load-test the session server with many concurrent simulated learners.
+
+Starts ``python -m tak_flashcard.server`` on a temporary database (or uses
+``--url``), runs every learner on its own keep-alive connection, and prints
+client-side and server-side p50/p99 latency per endpoint. Client figures
+include the generator's own queueing, so on a machine with few cores they
+grow with ``--learners`` while the server's stay flat. Run from the
+repository root:
+
+    PYTHONPATH=src python benchmarks/bench_server.py --learners 1000 --cards 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from tak_flashcard.utils.timing import LatencyStats
+
+
+class Connection:
+    """Keep-alive HTTP/1.1 client connection speaking JSON."""
+
+    def __init__(self, host: str, port: int):
+        """Remember the server address; ``open`` connects."""
+
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def open(self) -> None:
+        """Connect to the server."""
+
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+
+    async def request(self, method: str, path: str, payload: Any = None) -> tuple[int, Any]:
+        """Send one request and return (status, decoded JSON body)."""
+
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length)) if length else None
+
+    async def close(self) -> None:
+        """Close the connection."""
+
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def _learner(host: str, port: int, cards: int, reveal_rate: float,
+                   rng: random.Random, latency: LatencyStats) -> int:
+    """Play one session of ``cards`` cards; returns the number answered."""
+
+    connection = Connection(host, port)
+    await connection.open()
+
+    async def call(name: str, path: str, payload: Any = None) -> Any:
+        """Time one request under the endpoint's name."""
+
+        started = time.perf_counter()
+        status, body = await connection.request("POST", path, payload)
+        latency.add(name, time.perf_counter() - started)
+        if status >= 400:
+            raise RuntimeError(f"{name} failed with {status}: {body}")
+        return body
+
+    answered = 0
+    try:
+        started = await call("start", "/sessions", {
+            "mode": "testing", "question_count": cards, "direction": "mixed",
+            "difficulty": rng.randint(1, 5)})
+        base = f"/sessions/{started['session']}"
+        while True:
+            card = (await call("next", f"{base}/next"))["card"]
+            if card is None:
+                break
+            if rng.random() < reveal_rate:
+                await call("reveal", f"{base}/reveal")
+            await call("submit", f"{base}/submit", {"answer": rng.choice(card["choices"])})
+            answered += 1
+        await call("finish", f"{base}/finish")
+    finally:
+        await connection.close()
+    return answered
+
+
+async def _run(host: str, port: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Run every learner concurrently and collect both sides' latencies."""
+
+    latency = LatencyStats(window=1_000_000)
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    answered = await asyncio.gather(*(
+        _learner(host, port, args.cards, args.reveal_rate, random.Random(rng.random()), latency)
+        for _ in range(args.learners)))
+    elapsed = time.perf_counter() - started
+    connection = Connection(host, port)
+    await connection.open()
+    _status, server_stats = await connection.request("GET", "/stats")
+    await connection.close()
+    requests = sum(latency.counts.values())
+    return {
+        "learners": args.learners,
+        "answers": sum(answered),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(requests / elapsed, 1),
+        "client": latency.summary(),
+        "server": server_stats["endpoints"],
+    }
+
+
+def _start_server(db_path: Path) -> tuple[subprocess.Popen, str, int]:
+    """Launch the server on a free port and wait for its address."""
+
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [
+        str(Path(__file__).resolve().parents[1] / "src"), os.environ.get("PYTHONPATH")]))}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "tak_flashcard.server", "--port", "0", "--db", str(db_path)],
+        stdout=subprocess.PIPE, text=True, env=env)
+    line = process.stdout.readline()
+    if not line:
+        raise RuntimeError("Server exited before it started listening")
+    address = urlsplit(line.split()[-1])
+    return process, address.hostname, address.port
+
+
+def _print_table(result: dict[str, Any]) -> None:
+    """Print client and server percentiles side by side."""
+
+    print(f"{result['learners']} learners, {result['answers']} answers in "
+          f"{result['seconds']}s ({result['requests_per_second']} requests/s)")
+    print(f"{'endpoint':>9} {'count':>8} {'client p50':>11} {'client p99':>11} "
+          f"{'server p50':>11} {'server p99':>11}  (ms)")
+    for name, client in result["client"].items():
+        server = result["server"].get(name, {})
+        print(f"{name:>9} {client['count']:>8} {client['p50_ms']:>11.3f} {client['p99_ms']:>11.3f} "
+              f"{server.get('p50_ms', 0.0):>11.3f} {server.get('p99_ms', 0.0):>11.3f}")
+
+
+def main() -> None:
+    """Parse arguments, run the load test and print the report."""
+
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--learners", type=int, default=500)
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--reveal-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--url", help="existing server, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        if args.url:
+            address = urlsplit(args.url)
+            host, port = address.hostname, address.port
+        else:
+            process, host, port = _start_server(Path(tmp) / "bench.db")
+        try:
+            result = asyncio.run(_run(host, port, args))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        _print_table(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""Drive ``FlashcardService`` with synthetic learners and report end-to-end throughput.
+
+Every deck size gets a fresh temporary database. Simulated learners run
+sessions through ``start_session``/``next_card``/``submit_answer``. Each
+learner answers correctly with a probability that falls with the word's
+difficulty, and takes a log-normally distributed time to answer. That time
+is recorded in the review log, not slept, so the run measures the
+flashcard loop itself. The report covers cards per second, commits,
+selection and submit latency histograms, and database growth. It is also
+written as JSON so runs can be compared across commits. Run from the
+repository root:
+
+    PYTHONPATH=src python benchmarks/bench_simulation.py --words 1000 100000 1000000 \\
+        --output simulation.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from tak_flashcard.constants import DIFFICULTY_LEVELS, Direction, Mode
+from tak_flashcard.core.difficulty import difficulty_score, effective_difficulty
+from tak_flashcard.db.models import Word, normalized_columns
+from tak_flashcard.db.session import create_sqlite_engine, init_db
+from tak_flashcard.db.storage import PROFILES, get_profile, optimize
+from tak_flashcard.features.flashcard.deck import clear_deck_cache
+from tak_flashcard.features.flashcard.probe import ProbeDeck
+from tak_flashcard.features.flashcard.service import FlashcardService, answer_text
+from tak_flashcard.features.flashcard.states import ShowAnswerConfig
+from tak_flashcard.utils.timing import percentile
+
+PARTS = ["noun", "verb", "adjective", "adverb", "phrase"]
+# Upper bounds of the latency histogram buckets, in microseconds; one more bucket catches the rest.
+HISTOGRAM_BOUNDS_US = (10, 20, 50, 100, 200, 500, 1_000, 2_000, 5_000, 10_000, 20_000,
+                       50_000, 100_000)
+# Modes whose sessions are driven card by card; Speed mode is ended by a UI timer.
+SIMULATED_MODES = (Mode.ENDLESS, Mode.TESTING, Mode.WEAK, Mode.REVIEW)
+DECK_CHOICES = {"auto": None, "memory": False, "probe": True}
+
+
+@dataclass(frozen=True)
+class LearnerModel:
+    """How a synthetic learner answers.
+
+    Accuracy falls linearly from ``easy_accuracy`` for a word of difficulty
+    0 to ``hard_accuracy`` at difficulty 1. Answer time is log-normal with
+    median ``latency_median_ms``.
+    """
+
+    name: str
+    easy_accuracy: float
+    hard_accuracy: float
+    latency_median_ms: float
+    latency_sigma: float
+    reveal_rate: float
+
+    def accuracy(self, difficulty: Optional[float]) -> float:
+        """Return the chance of answering a word of this difficulty correctly."""
+
+        share = effective_difficulty(difficulty)
+        return self.easy_accuracy + (self.hard_accuracy - self.easy_accuracy) * share
+
+    def latency(self, rng: random.Random) -> float:
+        """Draw one answer time in seconds."""
+
+        return rng.lognormvariate(math.log(self.latency_median_ms / 1000), self.latency_sigma)
+
+    def answer(self, choices: Sequence[str], correct: str, difficulty: Optional[float],
+               rng: random.Random) -> str:
+        """Pick the correct choice with the modelled accuracy, otherwise a wrong one."""
+
+        wrong = [choice for choice in choices if choice != correct]
+        if not wrong or rng.random() < self.accuracy(difficulty):
+            return correct
+        return rng.choice(wrong)
+
+
+LEARNERS = {
+    model.name: model
+    for model in (
+        LearnerModel("novice", 0.65, 0.20, 4000, 0.7, 0.15),
+        LearnerModel("average", 0.85, 0.45, 2500, 0.6, 0.05),
+        LearnerModel("expert", 0.97, 0.75, 1200, 0.4, 0.01),
+    )
+}
+
+
+class Histogram:
+    """Latency samples with fixed log-spaced buckets and exact percentiles."""
+
+    def __init__(self) -> None:
+        """Create an empty histogram."""
+
+        self.samples: list[float] = []
+
+    def add(self, seconds: float) -> None:
+        """Record one duration."""
+
+        self.samples.append(seconds)
+
+    def report(self) -> dict[str, Any]:
+        """Return count, p50/p99/max in milliseconds and bucket counts."""
+
+        if not self.samples:
+            return {"count": 0}
+        ordered = sorted(self.samples)
+        counts = [0] * (len(HISTOGRAM_BOUNDS_US) + 1)
+        for seconds in ordered:
+            counts[bisect.bisect_left(HISTOGRAM_BOUNDS_US, seconds * 1_000_000)] += 1
+        return {
+            "count": len(ordered),
+            "p50_ms": round(percentile(ordered, 0.50) * 1000, 4),
+            "p99_ms": round(percentile(ordered, 0.99) * 1000, 4),
+            "max_ms": round(ordered[-1] * 1000, 4),
+            "histogram_us": [{"le": bound, "count": count}
+                             for bound, count in zip((*HISTOGRAM_BOUNDS_US, None), counts)],
+        }
+
+
+def _row(idx: int, rng: random.Random) -> dict[str, object]:
+    """Build one synthetic word row with consistent statistics."""
+
+    english, vietnamese, part = f"word_{idx}", f"nghia_{idx}", rng.choice(PARTS)
+    display_count = rng.randint(0, 20)
+    correct_count = rng.randint(0, display_count)
+    return {
+        "english": english,
+        "vietnamese": vietnamese,
+        "part_of_speech": part,
+        "display_count": display_count,
+        "correct_count": correct_count,
+        "difficulty": difficulty_score(display_count, correct_count) if display_count else 0.0,
+        **normalized_columns(english, vietnamese, part),
+    }
+
+
+def _populate(path: Path, profile: str, rows: int, seed: int) -> None:
+    """Create a database at path holding the requested number of rows."""
+
+    engine = create_sqlite_engine(path, get_profile(profile))
+    init_db(engine)
+    rng = random.Random(seed)
+    stmt = insert(Word.__table__)
+    with engine.begin() as connection:
+        for start in range(0, rows, 50_000):
+            connection.execute(stmt, [
+                _row(idx, rng) for idx in range(start, min(start + 50_000, rows))
+            ])
+    optimize(engine)
+    engine.dispose()
+
+
+def _database_bytes(path: Path) -> tuple[int, int]:
+    """Return (file bytes including the write-ahead log, bytes in used pages).
+
+    Used pages exclude the free list, so they grow with the data even while
+    the file itself is reusing pages freed earlier.
+    """
+
+    wal = path.with_name(path.name + "-wal")
+    file_bytes = path.stat().st_size + (wal.stat().st_size if wal.exists() else 0)
+    connection = sqlite3.connect(path)
+    try:
+        page_size, page_count, free_pages = (
+            connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+            for pragma in ("page_size", "page_count", "freelist_count"))
+    finally:
+        connection.close()
+    return file_bytes, page_size * (page_count - free_pages)
+
+
+def _simulate(words: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Populate a fresh database, run every session on it and measure the loop."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "simulation.db"
+        started = time.perf_counter()
+        _populate(path, args.profile, words, args.seed)
+        populate_seconds = time.perf_counter() - started
+
+        engine = create_sqlite_engine(path, get_profile(args.profile))
+        commits = 0
+
+        def count_commit(_connection: Any) -> None:
+            """Count one committed transaction."""
+
+            nonlocal commits
+            commits += 1
+
+        event.listen(engine, "commit", count_commit)
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
+        service = FlashcardService(db, DECK_CHOICES[args.deck])
+        rng = random.Random(args.seed)
+        random.seed(args.seed)
+        learners = [LEARNERS[name] for name in args.learners]
+        mode = Mode(args.mode)
+        timings = {name: Histogram() for name in ("start", "select", "submit")}
+        file_before, used_before = _database_bytes(path)
+        cards = correct = revealed = 0
+        think_seconds = 0.0
+
+        started = time.perf_counter()
+        for session in range(args.sessions):
+            learner = learners[session % len(learners)]
+            level = DIFFICULTY_LEVELS[session % len(DIFFICULTY_LEVELS)]
+            begun = time.perf_counter()
+            service.start_session(
+                mode, Direction(args.direction), level, ShowAnswerConfig(),
+                question_limit=args.cards if mode == Mode.TESTING else None)
+            timings["start"].add(time.perf_counter() - begun)
+            for _ in range(args.cards):
+                begun = time.perf_counter()
+                word = service.next_card()
+                timings["select"].add(time.perf_counter() - begun)
+                if word is None:
+                    break
+                state = service.state
+                if rng.random() < learner.reveal_rate:
+                    service.show_answer_penalty()
+                    revealed += 1
+                think = learner.latency(rng)
+                think_seconds += think
+                # Backdate the card so the review log records the simulated answer time.
+                state.current_shown_at -= think
+                expected = answer_text(word, state.current_direction or state.direction)
+                answer = learner.answer(state.current_choices, expected, word.difficulty, rng)
+                begun = time.perf_counter()
+                result = service.submit_answer(answer)
+                timings["submit"].add(time.perf_counter() - begun)
+                cards += 1
+                correct += int(result.is_correct)
+            service.end_session()
+        elapsed = time.perf_counter() - started
+
+        out_of_core = isinstance(service.deck, ProbeDeck)
+        db.close()
+        engine.dispose()
+        clear_deck_cache()
+        file_after, used_after = _database_bytes(path)
+    return {
+        "words": words,
+        "deck": "probe" if out_of_core else "memory",
+        "populate_seconds": round(populate_seconds, 3),
+        "sessions": args.sessions,
+        "cards": cards,
+        "seconds": round(elapsed, 3),
+        "cards_per_second": round(cards / elapsed, 1) if elapsed else None,
+        "commits": commits,
+        "commits_per_second": round(commits / elapsed, 1) if elapsed else None,
+        "cards_per_commit": round(cards / commits, 2) if commits else None,
+        "accuracy": round(correct / cards, 4) if cards else None,
+        "revealed": revealed,
+        "simulated_study_hours": round(think_seconds / 3600, 2),
+        "latency": {name: histogram.report() for name, histogram in timings.items()},
+        "db_bytes": {
+            "file_before": file_before,
+            "file_after": file_after,
+            "used_before": used_before,
+            "used_after": used_after,
+            "used_growth": used_after - used_before,
+            "used_growth_per_card": round((used_after - used_before) / cards, 1) if cards else None,
+        },
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Return the commit of the working tree, if it is a git checkout."""
+
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).resolve().parent,
+            capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_run(run: dict[str, Any]) -> None:
+    """Print one deck size's headline numbers."""
+
+    select, submit = run["latency"]["select"], run["latency"]["submit"]
+    print(f"{run['words']:>9,} {run['deck']:>6} {run['cards']:>7} {run['cards_per_second']:>9} "
+          f"{run['commits']:>7} {select.get('p50_ms', 0):>9.3f} {select.get('p99_ms', 0):>9.3f} "
+          f"{submit.get('p50_ms', 0):>9.3f} {submit.get('p99_ms', 0):>9.3f} "
+          f"{run['db_bytes']['used_growth'] / 1024:>9.0f}")
+
+
+def main() -> None:
+    """Run the simulation for each deck size, print a table and write the JSON report."""
+
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--words", type=int, nargs="+", default=[1_000, 100_000])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--cards", type=int, default=40, help="cards per session")
+    parser.add_argument("--mode", choices=[mode.value for mode in SIMULATED_MODES],
+                        default=Mode.TESTING.value)
+    parser.add_argument("--direction", choices=[direction.value for direction in Direction],
+                        default=Direction.MIXED.value)
+    parser.add_argument("--learners", nargs="+", choices=sorted(LEARNERS),
+                        default=sorted(LEARNERS), help="learner models, used in turn")
+    parser.add_argument("--deck", choices=sorted(DECK_CHOICES), default="auto",
+                        help="in-memory deck, probe deck, or chosen by size")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="balanced")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", type=Path, help="write the JSON report here")
+    args = parser.parse_args()
+
+    print(f"{'words':>9} {'deck':>6} {'cards':>7} {'cards/s':>9} {'commits':>7} "
+          f"{'sel p50':>9} {'sel p99':>9} {'sub p50':>9} {'sub p99':>9} {'grow KiB':>9}")
+    runs = []
+    for words in args.words:
+        run = _simulate(words, args)
+        _print_run(run)
+        runs.append(run)
+
+    report = {
+        "commit": _git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "config": {**vars(args), "output": str(args.output) if args.output else None},
+        "learners": {name: asdict(LEARNERS[name]) for name in args.learners},
+        "runs": runs,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare answer-commit and search latency under each storage profile.
+
+Run from the repository root:
+
+    PYTHONPATH=src python benchmarks/bench_storage.py --rows 100000 --commits 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from tak_flashcard.db import repo
+from tak_flashcard.db.models import Word, normalized_columns
+from tak_flashcard.db.session import create_sqlite_engine, init_db
+from tak_flashcard.db.storage import PROFILES, get_profile, optimize
+
+QUERIES = ["word_12", "nghia 345", "word_9999", "nghia_1"]
+
+
+def _row(idx: int, rng: random.Random) -> dict[str, object]:
+    """Build one synthetic word row, including its lookup columns."""
+
+    english, vietnamese, part = f"word_{idx}", f"nghia_{idx}", "noun"
+    return {
+        "english": english,
+        "vietnamese": vietnamese,
+        "part_of_speech": part,
+        "display_count": 0,
+        "correct_count": 0,
+        "difficulty": rng.random(),
+        **normalized_columns(english, vietnamese, part),
+    }
+
+
+def _populate(path: Path, profile: str, rows: int, seed: int) -> None:
+    """Create a database at path with the requested number of rows."""
+
+    engine = create_sqlite_engine(path, get_profile(profile))
+    init_db(engine)
+    rng = random.Random(seed)
+    stmt = insert(Word.__table__)
+    with engine.begin() as connection:
+        for start in range(0, rows, 50_000):
+            connection.execute(stmt, [
+                _row(idx, rng) for idx in range(start, min(start + 50_000, rows))
+            ])
+    optimize(engine)
+    engine.dispose()
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    """Return (p50, p99) of samples in milliseconds."""
+
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return statistics.median(ordered) * 1000, p99 * 1000
+
+
+def _run_profile(profile: str, rows: int, commits: int, seed: int) -> dict[str, float]:
+    """Measure one profile on a fresh database."""
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        _populate(path, profile, rows, seed)
+        engine = create_sqlite_engine(path, get_profile(profile))
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
+        rng = random.Random(seed)
+
+        commit_samples = []
+        for _ in range(commits):
+            word_id = rng.randint(1, rows)
+            started = time.perf_counter()
+            repo.apply_stat_deltas(db, [{"word_id": word_id, "display_delta": 1,
+                                         "correct_delta": rng.randint(0, 1)}])
+            db.commit()
+            commit_samples.append(time.perf_counter() - started)
+
+        search_samples = []
+        for _ in range(10):
+            for query in QUERIES:
+                started = time.perf_counter()
+                repo.search_words(db, query, limit=200)
+                search_samples.append(time.perf_counter() - started)
+            db.rollback()
+
+        db.close()
+        engine.dispose()
+    commit_p50, commit_p99 = _percentiles(commit_samples)
+    search_p50, search_p99 = _percentiles(search_samples)
+    return {"commit_p50": commit_p50, "commit_p99": commit_p99,
+            "search_p50": search_p50, "search_p99": search_p99}
+
+
+def main() -> None:
+    """Run every profile and print a latency table."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--commits", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--profiles", nargs="+", default=list(PROFILES))
+    args = parser.parse_args()
+
+    print(f"{'profile':>15} {'commit p50':>11} {'commit p99':>11} {'search p50':>11} {'search p99':>11}  (ms)")
+    for profile in args.profiles:
+        result = _run_profile(profile, args.rows, args.commits, args.seed)
+        print(f"{profile:>15} {result['commit_p50']:>11.3f} {result['commit_p99']:>11.3f} "
+              f"{result['search_p50']:>11.3f} {result['search_p99']:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""Run a headless flashcard session: ``python -m tak_flashcard``."""
+
+from tak_flashcard.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
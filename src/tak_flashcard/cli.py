@@ -0,0 +1,165 @@
+"""Headless command-line flashcard sessions.
+
+Run ``python -m tak_flashcard --help``. Importing this module only builds
+the argument parser; the data layer is imported once a session starts,
+and no GUI toolkit is imported at all.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Sequence
+
+from tak_flashcard.constants import (
+    DEFAULT_DIFFICULTY_LEVEL,
+    DEFAULT_DIRECTION,
+    DEFAULT_FLASHCARD_MODE,
+    DEFAULT_QUESTION_COUNT,
+    DEFAULT_TIME_LIMIT,
+    DIFFICULTY_LEVELS,
+    Direction,
+    Mode,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from tak_flashcard.features.flashcard.runner import AnswerSource, SessionSummary
+
+ANSWER_SOURCES = ("console", "script", "simulated")
+# Modes that only end when the answer source stops.
+OPEN_ENDED_MODES = (Mode.ENDLESS.value, Mode.WEAK.value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tak_flashcard",
+        description="Run a flashcard session in the terminal or from a script.")
+    parser.add_argument("--mode", choices=[mode.value for mode in Mode],
+                        default=DEFAULT_FLASHCARD_MODE.value)
+    parser.add_argument("--direction", choices=[direction.value for direction in Direction],
+                        default=DEFAULT_DIRECTION.value)
+    parser.add_argument("--difficulty", type=int, choices=DIFFICULTY_LEVELS,
+                        default=DEFAULT_DIFFICULTY_LEVEL)
+    parser.add_argument("--count", type=int, default=DEFAULT_QUESTION_COUNT,
+                        help="cards in a testing session")
+    parser.add_argument("--time-limit", type=int, default=DEFAULT_TIME_LIMIT,
+                        help="seconds in a speed session")
+    parser.add_argument("--max-cards", type=int,
+                        help="stop after this many cards in any mode")
+    parser.add_argument("--part-of-speech", help="part of speech to drill in weak mode")
+    parser.add_argument("--db", type=Path,
+                        help="database file; the application database when omitted")
+    parser.add_argument("--answers", choices=ANSWER_SOURCES, default="console",
+                        help="who answers: the terminal, a script file, or a simulated learner")
+    parser.add_argument("--script", type=Path,
+                        help="file with one input per line for --answers script; stdin when omitted")
+    parser.add_argument("--accuracy", type=float, default=0.7,
+                        help="probability a simulated learner answers correctly")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="seconds a simulated learner waits before answering")
+    parser.add_argument("--seed", type=int, help="random seed for a simulated learner")
+    parser.add_argument("--json", action="store_true",
+                        help="print the session summary as JSON")
+    return parser
+
+
+def open_database(path: Optional[Path] = None) -> Session:
+    """Prepare a database and return a session on it with no open transaction.
+
+    Parameters:
+        path: Database file; the application database, installed from the
+            template on first use like the GUI does, when omitted.
+    """
+
+    from tak_flashcard.data.seed.importer import ensure_seed_data
+    from tak_flashcard.db.session import (
+        create_sqlite_engine,
+        get_session_factory,
+        init_db,
+        make_session_factory,
+    )
+
+    if path is None:
+        from tak_flashcard.data.seed.template import install_template
+
+        install_template()
+        init_db()
+        db = get_session_factory()()
+    else:
+        engine = create_sqlite_engine(path)
+        init_db(engine)
+        db = make_session_factory(engine)()
+    ensure_seed_data(db)
+    db.rollback()
+    return db
+
+
+def make_source(args: argparse.Namespace) -> AnswerSource:
+    """Build the answer source selected on the command line."""
+
+    from tak_flashcard.features.flashcard.runner import (
+        ConsoleAnswers,
+        ScriptedAnswers,
+        SimulatedLearner,
+    )
+
+    if args.answers == "simulated":
+        return SimulatedLearner(args.accuracy, random.Random(args.seed), args.think)
+    if args.answers == "script":
+        if args.script is None:
+            return ScriptedAnswers(line for line in sys.stdin)
+        return ScriptedAnswers(args.script.read_text(encoding="utf-8").splitlines())
+    return ConsoleAnswers()
+
+
+def format_summary(summary: SessionSummary) -> str:
+    """Describe a finished session in one line."""
+
+    ending = " (time up)" if summary.timed_out else ""
+    return (f"{summary.mode.name.title()}: {summary.correct}/{summary.answered} correct "
+            f"({summary.accuracy:.1%}), score {summary.score}, "
+            f"{summary.seconds:.1f}s{ending}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run one session from the command line and print its summary.
+
+    Returns:
+        The process exit status.
+    """
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.answers == "simulated" and args.mode in OPEN_ENDED_MODES and args.max_cards is None:
+        parser.error(f"--max-cards is required for a simulated learner in {args.mode} mode")
+
+    from tak_flashcard.features.flashcard.controller import FlashcardController
+    from tak_flashcard.features.flashcard.runner import SessionRunner
+
+    db = open_database(args.db)
+    try:
+        summary = SessionRunner(FlashcardController(db), make_source(args)).run(
+            Mode(args.mode),
+            Direction(args.direction),
+            args.difficulty,
+            question_count=args.count,
+            time_limit=args.time_limit,
+            max_cards=args.max_cards,
+            part_of_speech=args.part_of_speech,
+        )
+    finally:
+        db.close()
+    if args.json:
+        print(json.dumps({**asdict(summary), "mode": summary.mode.value,
+                          "accuracy": summary.accuracy}))
+    else:
+        print(format_summary(summary))
+    return 0
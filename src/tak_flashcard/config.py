@@ -9,9 +9,53 @@ PACKAGE_ROOT = Path(__file__).resolve().parent
 DATA_DIR = PACKAGE_ROOT / "data"
 VOCAB_PATH = DATA_DIR / "vocab" / "vocab_source.csv"
 DB_PATH = DATA_DIR / "flashcard.db"
+TEMPLATE_PATH = DATA_DIR / "seed" / "template.db"
 SETTINGS_PATH = DATA_DIR / "user_settings.json"
+FONT_CACHE_PATH = DATA_DIR / "font_cache.json"
 MIN_WORDS_REQUIRED = 1000
 
+IMPORT_CHUNK_SIZE = 5000
+
+STATS_FLUSH_EVERY = 20
+STATS_FLUSH_SECONDS = 5.0
+
+STORAGE_PROFILE = "balanced"
+STORAGE_PROFILE_ENV = "TAK_FLASHCARD_STORAGE_PROFILE"
+MAINTENANCE_INTERVAL_SECONDS = 600.0
+
+PREFETCH_DEPTH = 3
+
+# Decks at least this large are sampled from the database instead of loaded.
+OUT_OF_CORE_MIN_WORDS = 500_000
+
+# Weak-words drill: words in the working set, and hardest-next words queued
+# behind it to replace words that become easy.
+WEAK_SET_SIZE = 50
+WEAK_SET_RESERVE = 50
+
+# Never-reviewed words introduced per spaced-repetition review session.
+SRS_NEW_PER_SESSION = 20
+
+# Statistics screen: days in the rolling-accuracy window, and study days shown.
+ANALYTICS_WINDOW_DAYS = 7
+ANALYTICS_CURVE_DAYS = 60
+
+# Session server: default address (local only unless --host says otherwise),
+# answers per database write, write batches allowed in flight at once,
+# review-log session numbers reserved per commit, seconds without a
+# request before an unfinished session is closed, and seconds between
+# re-reads of the vocabulary that new sessions start on.
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_WRITE_BATCH = 200
+SERVER_MAX_PENDING_WRITES = 4
+SERVER_SESSION_ID_BLOCK = 1024
+SERVER_SESSION_IDLE_SECONDS = 30 * 60
+SERVER_SNAPSHOT_REFRESH_SECONDS = 60
+
+BOOTSTRAP_POLL_MS = 30
+STARTUP_REPORT_ENV = "TAK_FLASHCARD_STARTUP_REPORT"
+
 WINDOW_WIDTH = 960
 WINDOW_HEIGHT = 640
 
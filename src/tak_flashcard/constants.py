@@ -9,6 +9,8 @@ class Mode(str, Enum):
     ENDLESS = "endless"
     SPEED = "speed"
     TESTING = "testing"
+    WEAK = "weak"
+    REVIEW = "review"
 
 
 class Direction(str, Enum):
@@ -19,8 +21,24 @@ class Direction(str, Enum):
     MIXED = "mixed"
 
 
+# Integer codes stored in the review log. Append new members; never renumber.
+MODE_CODES = {
+    Mode.ENDLESS: 1,
+    Mode.SPEED: 2,
+    Mode.TESTING: 3,
+    Mode.WEAK: 4,
+    Mode.REVIEW: 5,
+}
+DIRECTION_CODES = {
+    Direction.ENG_TO_VN: 1,
+    Direction.VN_TO_ENG: 2,
+}
+
 DIFFICULTY_LEVELS = [1, 2, 3, 4, 5]
 
+# Suggestions for the weak-words part-of-speech filter; any value is accepted.
+PARTS_OF_SPEECH = ("noun", "verb", "adjective", "adverb", "interjection")
+
 DEFAULT_QUESTION_COUNT = 20
 DEFAULT_TIME_LIMIT = 300
 DEFAULT_DIFFICULTY_LEVEL = 3
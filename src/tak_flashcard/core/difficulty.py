@@ -2,9 +2,65 @@
 
 from __future__ import annotations
 
+from tak_flashcard.constants import DIFFICULTY_LEVELS
+
+MIN_SELECTION_WEIGHT = 0.01
+DIFFICULTY_BUCKETS = 20
+
 
 def difficulty_score(display_count: int, correct_count: int) -> float:
     """Calculate difficulty based on correct ratio."""
 
     epsilon = 1e-6
     return 1.0 - (correct_count / (display_count + epsilon))
+
+
+def effective_difficulty(difficulty: float | None) -> float:
+    """Return the difficulty used for weighting; unset values count as 0.5."""
+
+    return difficulty or 0.5
+
+
+def difficulty_bucket(difficulty: float | None) -> int:
+    """Return the histogram bucket of a difficulty, 0 to ``DIFFICULTY_BUCKETS - 1``.
+
+    Mirrors the generated ``words.difficulty_bucket`` column; see
+    ``BUCKET_EXPRESSION`` in ``db.models``.
+    """
+
+    return min(int(effective_difficulty(difficulty) * DIFFICULTY_BUCKETS), DIFFICULTY_BUCKETS - 1)
+
+
+def bucket_bounds(bucket: int) -> tuple[float, float]:
+    """Return the [low, high) difficulty range covered by a bucket."""
+
+    return bucket / DIFFICULTY_BUCKETS, (bucket + 1) / DIFFICULTY_BUCKETS
+
+
+def clamp_level(difficulty_level: int) -> int:
+    """Clamp a requested difficulty level into the supported 1-5 range."""
+
+    return max(min(difficulty_level, max(DIFFICULTY_LEVELS)), min(DIFFICULTY_LEVELS))
+
+
+def selection_weight(difficulty: float | None, difficulty_level: int) -> float:
+    """Return the sampling weight of a word for a session difficulty level.
+
+    Parameters:
+        difficulty: Stored difficulty of the word; falsy values count as 0.5.
+        difficulty_level: Session difficulty level, already clamped to 1-5.
+
+    Returns:
+        A positive weight; higher levels favour words with higher difficulty.
+    """
+
+    base = effective_difficulty(difficulty)
+    if difficulty_level <= 2:
+        weight = 1.0 - base
+    elif difficulty_level == 3:
+        weight = 1.0
+    elif difficulty_level == 4:
+        weight = 0.5 + base
+    else:
+        weight = 1.0 + base
+    return max(weight, MIN_SELECTION_WEIGHT)
@@ -0,0 +1,168 @@
+"""Incremental weighted sampling over a session deck."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Generic, Protocol, Sequence, TypeVar
+
+from tak_flashcard.core.difficulty import clamp_level, selection_weight
+
+
+class SamplableWord(Protocol):
+    """Minimal word shape required by the samplers."""
+
+    id: Any
+    difficulty: Any
+
+
+W = TypeVar("W", bound=SamplableWord)
+
+
+class WordSampler(Protocol[W]):
+    """Interface shared by the session sampler backends."""
+
+    level: int
+
+    def __len__(self) -> int:
+        """Return the number of words in the sampler."""
+
+    @property
+    def total_weight(self) -> float:
+        """Return the sum of all selection weights."""
+
+    def weight_of(self, word_id: object) -> float:
+        """Return the current selection weight of a word, or 0.0 if unknown."""
+
+    def update(self, word: W) -> None:
+        """Re-weight a word after its difficulty has changed."""
+
+    def sample(self, rng: random.Random | None = None) -> W | None:
+        """Draw one word with probability proportional to its weight."""
+
+    def sample_many(self, count: int, rng: random.Random | None = None) -> list[W]:
+        """Draw ``count`` words independently with replacement."""
+
+
+class FenwickSampler(Generic[W]):
+    """Weighted word sampler backed by a Fenwick (binary indexed) tree.
+
+    The tree stores the selection weight of every word for one difficulty
+    level, so drawing a word and re-weighting a single word after its
+    difficulty changes both cost O(log n) instead of rebuilding the weight
+    list for the whole deck.
+    """
+
+    def __init__(self, words: Sequence[W], difficulty_level: int):
+        """Build the tree for the given words and difficulty level.
+
+        Parameters:
+            words: Deck to sample from; order defines the tree positions.
+            difficulty_level: Session difficulty level from 1 to 5.
+        """
+
+        self.level = clamp_level(difficulty_level)
+        self._words: list[W] = list(words)
+        self._positions = {word.id: idx for idx, word in enumerate(self._words)}
+        self._weights = [selection_weight(word.difficulty, self.level)
+                         for word in self._words]
+        self._tree = self._build(self._weights)
+        self._total = sum(self._weights)
+        self._top_bit = 1 << (len(self._words).bit_length() - 1) if self._words else 0
+
+    @staticmethod
+    def _build(weights: Sequence[float]) -> list[float]:
+        """Construct the 1-indexed Fenwick array in linear time."""
+
+        size = len(weights)
+        tree = [0.0] * (size + 1)
+        for idx, weight in enumerate(weights, start=1):
+            tree[idx] += weight
+            parent = idx + (idx & -idx)
+            if parent <= size:
+                tree[parent] += tree[idx]
+        return tree
+
+    def __len__(self) -> int:
+        """Return the number of words in the sampler."""
+
+        return len(self._words)
+
+    def __contains__(self, word_id: object) -> bool:
+        """Return whether a word id is tracked by the sampler."""
+
+        return word_id in self._positions
+
+    @property
+    def total_weight(self) -> float:
+        """Return the sum of all selection weights."""
+
+        return self._total
+
+    def weight_of(self, word_id: object) -> float:
+        """Return the current selection weight of a word, or 0.0 if unknown."""
+
+        position = self._positions.get(word_id)
+        if position is None:
+            return 0.0
+        return self._weights[position]
+
+    def update(self, word: W) -> None:
+        """Re-weight a word after its difficulty has changed.
+
+        Parameters:
+            word: The word to re-weight; it replaces the stored instance.
+        """
+
+        position = self._positions.get(word.id)
+        if position is None:
+            return
+        self._words[position] = word
+        weight = selection_weight(word.difficulty, self.level)
+        delta = weight - self._weights[position]
+        if not delta:
+            return
+        self._weights[position] = weight
+        self._total += delta
+        idx = position + 1
+        size = len(self._words)
+        while idx <= size:
+            self._tree[idx] += delta
+            idx += idx & -idx
+
+    def _find(self, target: float) -> int:
+        """Return the position whose cumulative weight range contains target."""
+
+        position = 0
+        step = self._top_bit
+        size = len(self._words)
+        while step:
+            nxt = position + step
+            if nxt <= size and self._tree[nxt] <= target:
+                position = nxt
+                target -= self._tree[nxt]
+            step >>= 1
+        return min(position, size - 1)
+
+    def sample(self, rng: random.Random | None = None) -> W | None:
+        """Draw one word with probability proportional to its weight.
+
+        Parameters:
+            rng: Optional random source; defaults to the module generator.
+
+        Returns:
+            The chosen word, or None when the deck is empty.
+        """
+
+        if not self._words:
+            return None
+        draw = (rng or random).random() * self._total
+        return self._words[self._find(draw)]
+
+    def sample_many(self, count: int, rng: random.Random | None = None) -> list[W]:
+        """Draw ``count`` words independently with replacement."""
+
+        if not self._words or count <= 0:
+            return []
+        source = rng or random
+        return [self._words[self._find(source.random() * self._total)]
+                for _ in range(count)]
@@ -2,14 +2,93 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Optional, Sequence
 
 from tak_flashcard.constants import Direction
+from tak_flashcard.core.sampler import FenwickSampler, WordSampler
+from tak_flashcard.core.snapshot import HAS_NUMPY, WordSnapshot
 from tak_flashcard.db.models import Word
 from tak_flashcard.db.repo import choose_weighted_word
 
+SAMPLER_BACKENDS = ("auto", "numpy", "fenwick")
 
-def select_next_word(words: Sequence[Word], difficulty_level: int, direction: Direction) -> Word | None:
-    """Select the next word for a session with weighted difficulty."""
 
+def build_sampler(
+    words: Sequence[Word],
+    difficulty_level: int,
+    backend: str = "auto",
+) -> WordSampler[Word]:
+    """Create a session sampler for a deck at a difficulty level.
+
+    Parameters:
+        words: Deck to sample from.
+        difficulty_level: Session difficulty level from 1 to 5.
+        backend: ``"numpy"`` for the column-store snapshot, ``"fenwick"`` for
+            the pure-Python tree, or ``"auto"`` for the tree. Sessions
+            re-weight a word after every answer, which the tree does in
+            O(log n) while the snapshot recomputes its cumulative array.
+
+    Returns:
+        A sampler exposing ``sample``, ``sample_many`` and ``update``.
+    """
+
+    if backend not in SAMPLER_BACKENDS:
+        raise ValueError(f"Unknown sampler backend: {backend}")
+    if backend == "numpy":
+        return WordSnapshot(words, difficulty_level)
+    return FenwickSampler(words, difficulty_level)
+
+
+def build_batch_sampler(words: Sequence[Word], difficulty_level: int) -> WordSampler[Word]:
+    """Create a sampler for drawing one large batch, preferring NumPy when installed."""
+
+    return build_sampler(words, difficulty_level, "numpy" if HAS_NUMPY else "fenwick")
+
+
+def select_next_word(
+    words: Sequence[Word],
+    difficulty_level: int,
+    direction: Direction,
+    sampler: Optional[WordSampler[Word]] = None,
+) -> Word | None:
+    """Select the next word for a session with weighted difficulty.
+
+    Parameters:
+        words: Deck to select from when no sampler is supplied.
+        difficulty_level: Session difficulty level from 1 to 5.
+        direction: Active translation direction for the card.
+        sampler: Session-owned sampler; avoids rebuilding weights per call.
+
+    Returns:
+        The selected word, or None when the deck is empty.
+    """
+
+    if sampler is not None:
+        return sampler.sample()
     return choose_weighted_word(words, difficulty_level, direction)
+
+
+def select_words(
+    words: Sequence[Word],
+    difficulty_level: int,
+    count: int,
+    sampler: Optional[WordSampler[Word]] = None,
+) -> list[Word]:
+    """Select several words at once with weighted difficulty.
+
+    Parameters:
+        words: Deck to select from when no sampler is supplied.
+        difficulty_level: Session difficulty level from 1 to 5.
+        count: Number of words to draw, with replacement.
+        sampler: Session-owned sampler; without one a batch sampler is
+            built, which draws all words in one vectorized call under NumPy.
+
+    Returns:
+        The drawn words in draw order.
+    """
+
+    if sampler is None:
+        if not words:
+            return []
+        sampler = build_batch_sampler(words, difficulty_level)
+    return sampler.sample_many(count)
@@ -9,8 +9,6 @@ from typing import Any
 
 from tak_flashcard.config import SETTINGS_PATH, ensure_data_dirs
 
-ensure_data_dirs()
-
 
 @dataclass
 class AppearanceSettings:
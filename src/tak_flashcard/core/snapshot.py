@@ -0,0 +1,185 @@
+"""NumPy column-store snapshot of a deck for vectorized sampling.
+
+NumPy is optional; ``HAS_NUMPY`` reports whether this backend can be used and
+``core.selectors`` falls back to the pure-Python sampler when it is False.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Generic, Sequence
+
+from tak_flashcard.core.difficulty import MIN_SELECTION_WEIGHT, clamp_level
+from tak_flashcard.core.sampler import W
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
+
+HAS_NUMPY = np is not None
+
+
+def vectorized_weights(difficulty: Any, difficulty_level: int) -> Any:
+    """Compute selection weights for a whole difficulty column at once.
+
+    Parameters:
+        difficulty: Float array of stored word difficulties.
+        difficulty_level: Session difficulty level from 1 to 5.
+
+    Returns:
+        A float array matching ``core.difficulty.selection_weight`` per item.
+    """
+
+    level = clamp_level(difficulty_level)
+    base = np.where(difficulty == 0.0, 0.5, difficulty)
+    if level <= 2:
+        weights = 1.0 - base
+    elif level == 3:
+        weights = np.ones_like(base)
+    elif level == 4:
+        weights = 0.5 + base
+    else:
+        weights = 1.0 + base
+    return np.maximum(weights, MIN_SELECTION_WEIGHT)
+
+
+class WordSnapshot(Generic[W]):
+    """Contiguous-array view of a deck that draws many cards per call.
+
+    Ids, difficulty, display and correct counts live in NumPy arrays. The
+    cumulative weight array is computed lazily and reused until a word is
+    re-weighted, so drawing ``k`` cards is one ``searchsorted`` call. Each
+    re-weight invalidates it, so sessions that update after every answer use
+    ``FenwickSampler`` instead; ``total_weight`` is kept as a running sum
+    and never forces the recomputation.
+    """
+
+    def __init__(self, words: Sequence[W], difficulty_level: int, seed: int | None = None):
+        """Capture the deck columns and compute weights for the level.
+
+        Parameters:
+            words: Deck to snapshot; order defines the array positions.
+            difficulty_level: Session difficulty level from 1 to 5.
+            seed: Optional seed for the snapshot's random generator.
+        """
+
+        if not HAS_NUMPY:
+            raise RuntimeError("WordSnapshot requires NumPy")
+        self.level = clamp_level(difficulty_level)
+        self._words: list[W] = list(words)
+        size = len(self._words)
+        self._positions = {word.id: idx for idx, word in enumerate(self._words)}
+        self.ids = np.fromiter((word.id for word in self._words),
+                               dtype=np.int64, count=size)
+        self.difficulty = np.fromiter(
+            (word.difficulty or 0.0 for word in self._words), dtype=np.float64, count=size)
+        self.display_count = np.fromiter(
+            (getattr(word, "display_count", 0) or 0 for word in self._words),
+            dtype=np.int64, count=size)
+        self.correct_count = np.fromiter(
+            (getattr(word, "correct_count", 0) or 0 for word in self._words),
+            dtype=np.int64, count=size)
+        self._weights = vectorized_weights(self.difficulty, self.level)
+        self._total = float(self._weights.sum())
+        self._cumulative: Any = None
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """Return the number of words in the snapshot."""
+
+        return len(self._words)
+
+    def __contains__(self, word_id: object) -> bool:
+        """Return whether a word id is tracked by the snapshot."""
+
+        return word_id in self._positions
+
+    @property
+    def total_weight(self) -> float:
+        """Return the sum of all selection weights."""
+
+        return self._total
+
+    def weights(self, difficulty_level: int | None = None) -> Any:
+        """Return the weight array for a level without touching the cache."""
+
+        if difficulty_level is None or clamp_level(difficulty_level) == self.level:
+            return self._weights
+        return vectorized_weights(self.difficulty, difficulty_level)
+
+    def weight_of(self, word_id: object) -> float:
+        """Return the current selection weight of a word, or 0.0 if unknown."""
+
+        position = self._positions.get(word_id)
+        if position is None:
+            return 0.0
+        return float(self._weights[position])
+
+    def update(self, word: W) -> None:
+        """Refresh one word's columns and weight after its stats changed."""
+
+        position = self._positions.get(word.id)
+        if position is None:
+            return
+        self._words[position] = word
+        self.difficulty[position] = word.difficulty or 0.0
+        self.display_count[position] = getattr(word, "display_count", 0) or 0
+        self.correct_count[position] = getattr(word, "correct_count", 0) or 0
+        weight = vectorized_weights(self.difficulty[position:position + 1], self.level)[0]
+        self._total += float(weight - self._weights[position])
+        self._weights[position] = weight
+        self._cumulative = None
+
+    def _cumulative_weights(self) -> Any:
+        """Return the cached cumulative weights, recomputing after updates."""
+
+        if self._cumulative is None:
+            self._cumulative = np.cumsum(self._weights)
+        return self._cumulative
+
+    def sample_indices(self, count: int) -> Any:
+        """Draw ``count`` positions with replacement in one vectorized call."""
+
+        cumulative = self._cumulative_weights()
+        draws = self._rng.random(count) * cumulative[-1]
+        positions = np.searchsorted(cumulative, draws, side="right")
+        return np.minimum(positions, len(self._words) - 1)
+
+    def sample(self, rng: random.Random | None = None) -> W | None:
+        """Draw one word with probability proportional to its weight.
+
+        Parameters:
+            rng: Optional Python random source; when given it supplies the
+                uniform draw so seeded callers stay reproducible.
+
+        Returns:
+            The chosen word, or None when the snapshot is empty.
+        """
+
+        if not self._words:
+            return None
+        if rng is None:
+            return self._words[int(self.sample_indices(1)[0])]
+        cumulative = self._cumulative_weights()
+        target = rng.random() * cumulative[-1]
+        position = int(np.searchsorted(cumulative, target, side="right"))
+        return self._words[min(position, len(self._words) - 1)]
+
+    def sample_many(self, count: int, rng: random.Random | None = None) -> list[W]:
+        """Draw ``count`` words independently with replacement.
+
+        Parameters:
+            count: Number of words to draw.
+            rng: Optional Python random source used instead of the snapshot
+                generator, at the cost of one Python draw per word.
+
+        Returns:
+            The drawn words in draw order.
+        """
+
+        if not self._words or count <= 0:
+            return []
+        if rng is not None:
+            return [self.sample(rng) for _ in range(count)]  # type: ignore[misc]
+        return [self._words[position] for position in self.sample_indices(count).tolist()]
@@ -0,0 +1,68 @@
+"""SM-2 spaced-repetition scheduling."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+DAY_SECONDS = 86_400
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+# A lapsed card comes back within the same sitting before its 1-day interval.
+RELEARN_SECONDS = 600
+CORRECT_QUALITY = 4
+WRONG_QUALITY = 1
+
+
+@dataclass(frozen=True)
+class ReviewState:
+    """Schedule of one word.
+
+    ``due`` is a Unix timestamp in whole seconds; ``interval`` is in days.
+    """
+
+    word_id: int
+    due: int
+    interval: float = 0.0
+    ease: float = DEFAULT_EASE
+    repetitions: int = 0
+    lapses: int = 0
+
+
+def quality_for(is_correct: bool) -> int:
+    """Map a multiple-choice outcome onto SM-2's 0-5 recall quality."""
+
+    return CORRECT_QUALITY if is_correct else WRONG_QUALITY
+
+
+def review(state: Optional[ReviewState], word_id: int, quality: int, now: float) -> ReviewState:
+    """Return a word's schedule after one review.
+
+    Parameters:
+        state: Current schedule, or None for a word seen for the first time.
+        word_id: Id of the reviewed word.
+        quality: Recall quality from 0 (blackout) to 5 (perfect).
+        now: Review time as a Unix timestamp.
+
+    Returns:
+        The new schedule. Failed recalls (quality below 3) reset the
+        repetition count and come back after ``RELEARN_SECONDS`` with a
+        one-day interval; successful ones grow the interval by the ease
+        factor, which itself moves with the quality as in SM-2.
+    """
+
+    quality = max(0, min(quality, 5))
+    current = state or ReviewState(word_id, int(now))
+    ease = max(MIN_EASE, current.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    if quality < 3:
+        return ReviewState(word_id, int(now) + RELEARN_SECONDS, 1.0, ease,
+                           0, current.lapses + (1 if current.repetitions else 0))
+    repetitions = current.repetitions + 1
+    if repetitions == 1:
+        interval = 1.0
+    elif repetitions == 2:
+        interval = 6.0
+    else:
+        interval = round(current.interval * current.ease, 2)
+    return ReviewState(word_id, int(now + interval * DAY_SECONDS), interval, ease,
+                       repetitions, current.lapses)
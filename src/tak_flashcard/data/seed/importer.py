@@ -1,37 +1,132 @@
-"""CSV importer and bootstrap seeding for vocabulary."""
+"""Streaming vocabulary importer and bootstrap seeding.
+
+Rows are read lazily from CSV, TSV or JSON Lines files and written in
+fixed-size chunks inside one transaction, so memory use does not depend on
+the size of the source file. Existing (english, vietnamese) pairs are merged
+instead of duplicated.
+"""
 
 from __future__ import annotations
 
+import argparse
 import csv
+import json
 import random
+import time
+import unicodedata
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence
 
 from sqlalchemy.orm import Session
 
-from tak_flashcard.config import MIN_WORDS_REQUIRED, VOCAB_PATH
-from tak_flashcard.db.repo import bulk_insert_words, get_word_count
+from tak_flashcard.config import IMPORT_CHUNK_SIZE, MIN_WORDS_REQUIRED, VOCAB_PATH
+from tak_flashcard.db.repo import get_word_count, upsert_words
 
 PARTS = ["noun", "verb", "adjective", "adverb", "phrase"]
+TSV_SUFFIXES = {".tsv", ".tab"}
+JSONL_SUFFIXES = {".jsonl", ".ndjson"}
+
+
+@dataclass
+class ImportProgress:
+    """Running totals reported while an import is in progress."""
+
+    rows_read: int = 0
+    rows_written: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return the read throughput so far."""
+
+        return self.rows_read / self.elapsed if self.elapsed > 0 else 0.0
+
+
+ProgressCallback = Callable[[ImportProgress], None]
+
+
+def _word_row(english: str, vietnamese: str, part_of_speech: Optional[str]) -> dict[str, object]:
+    """Build an insertable word mapping with fresh statistics."""
+
+    return {
+        "english": english,
+        "vietnamese": vietnamese,
+        "part_of_speech": part_of_speech,
+        "display_count": 0,
+        "correct_count": 0,
+        "difficulty": 0.5,
+    }
+
+
+def iter_placeholder_words(count: int = MIN_WORDS_REQUIRED, start: int = 1) -> Iterator[dict[str, object]]:
+    """Yield placeholder vocabulary entries numbered from ``start``."""
+
+    for idx in range(start, start + count):
+        yield _word_row(f"word_{idx}", f"nghia_{idx}", random.choice(PARTS))
 
 
 def generate_placeholder_words(count: int = MIN_WORDS_REQUIRED) -> list[dict[str, object]]:
     """Generate placeholder vocabulary entries to satisfy minimum requirements."""
 
-    words: list[dict[str, object]] = []
-    for idx in range(count):
-        base = f"word_{idx + 1}"
-        words.append(
-            {
-                "english": base,
-                "vietnamese": f"nghia_{idx + 1}",
-                "part_of_speech": random.choice(PARTS),
-                "display_count": 0,
-                "correct_count": 0,
-                "difficulty": 0.5,
-            }
-        )
-    return words
+    return list(iter_placeholder_words(count))
+
+
+def _text_field(record: Mapping[str, object], name: str) -> str:
+    """Return a stripped, NFC-normalized text field from a source record."""
+
+    value = record.get(name)
+    return unicodedata.normalize("NFC", str(value).strip()) if value is not None else ""
+
+
+def _clean_row(record: Mapping[str, object]) -> Optional[dict[str, object]]:
+    """Validate and normalize one source record, or return None to skip it."""
+
+    english = _text_field(record, "english")
+    vietnamese = _text_field(record, "vietnamese")
+    if not english or not vietnamese:
+        return None
+    return _word_row(english, vietnamese, _text_field(record, "part_of_speech") or None)
+
+
+def _iter_records(path: Path) -> Iterator[Mapping[str, object]]:
+    """Yield raw records from a CSV, TSV or JSON Lines file."""
+
+    suffix = path.suffix.lower()
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        if suffix in JSONL_SUFFIXES:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+            return
+        delimiter = "\t" if suffix in TSV_SUFFIXES else ","
+        yield from csv.DictReader(handle, delimiter=delimiter)
+
+
+def iter_vocab_rows(path: Path = VOCAB_PATH) -> Iterator[dict[str, object]]:
+    """Stream validated vocabulary rows from a source file.
+
+    Parameters:
+        path: CSV (default), TSV (``.tsv``/``.tab``) or JSON Lines
+            (``.jsonl``/``.ndjson``) file with ``english``, ``vietnamese``
+            and optional ``part_of_speech`` fields.
+
+    Yields:
+        Insertable word mappings; invalid records are skipped.
+    """
+
+    for record in _iter_records(path):
+        row = _clean_row(record)
+        if row is not None:
+            yield row
 
 
 def read_vocab_file(path: Path = VOCAB_PATH) -> Sequence[dict[str, object]]:
@@ -39,37 +134,125 @@ def read_vocab_file(path: Path = VOCAB_PATH) -> Sequence[dict[str, object]]:
 
     if not path.exists():
         return generate_placeholder_words()
-    with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        rows: list[dict[str, object]] = []
-        for row in reader:
-            english = row.get("english", "").strip()
-            vietnamese = row.get("vietnamese", "").strip()
-            part_of_speech = row.get("part_of_speech", "").strip() or None
-            if not english or not vietnamese:
-                continue
-            rows.append(
-                {
-                    "english": english,
-                    "vietnamese": vietnamese,
-                    "part_of_speech": part_of_speech,
-                    "display_count": 0,
-                    "correct_count": 0,
-                    "difficulty": 0.5,
-                }
-            )
-        if len(rows) < MIN_WORDS_REQUIRED:
-            rows.extend(generate_placeholder_words(
-                MIN_WORDS_REQUIRED - len(rows)))
-        return rows
-
-
-def ensure_seed_data(db: Session) -> None:
-    """Ensure the database contains at least the minimum number of words."""
+    rows = list(iter_vocab_rows(path))
+    if len(rows) < MIN_WORDS_REQUIRED:
+        rows.extend(generate_placeholder_words(MIN_WORDS_REQUIRED - len(rows)))
+    return rows
+
+
+def import_rows(
+    db: Session,
+    rows: Iterable[dict[str, object]],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    update_existing: bool = True,
+) -> ImportProgress:
+    """Write rows in fixed-size chunks within the session's transaction.
+
+    Parameters:
+        db: Session to write through; the caller commits.
+        rows: Word mappings, consumed lazily.
+        chunk_size: Number of rows per executemany.
+        progress: Called after every chunk with running totals.
+        update_existing: Refresh existing pairs instead of skipping them.
+
+    Returns:
+        Final totals for the import.
+    """
+
+    report = ImportProgress()
+    started = time.perf_counter()
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, max(chunk_size, 1)))
+        if not chunk:
+            break
+        report.rows_written += upsert_words(db, chunk, update_existing)
+        report.rows_read += len(chunk)
+        report.elapsed = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def import_vocab(
+    db: Session,
+    path: Path = VOCAB_PATH,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    update_existing: bool = True,
+) -> ImportProgress:
+    """Stream a vocabulary file into the database in one transaction.
+
+    Parameters:
+        db: Session to write through.
+        path: Source file; see ``iter_vocab_rows`` for supported formats.
+        chunk_size: Number of rows per executemany.
+        progress: Called after every chunk with running totals.
+        update_existing: Refresh existing pairs instead of skipping them.
+
+    Returns:
+        Final totals for the import.
+    """
+
+    try:
+        report = import_rows(db, iter_vocab_rows(path), chunk_size,
+                             progress, update_existing)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return report
+
+
+def ensure_seed_data(db: Session, source: Path = VOCAB_PATH) -> None:
+    """Ensure the database contains at least the minimum number of words.
+
+    Parameters:
+        db: Session to seed through.
+        source: Vocabulary file imported before padding with placeholders.
+    """
 
     current = get_word_count(db)
     if current >= MIN_WORDS_REQUIRED:
         return
-    rows = read_vocab_file()
-    bulk_insert_words(db, rows)
-    db.commit()
+    if source.exists():
+        import_vocab(db, source)
+        current = get_word_count(db)
+    if current < MIN_WORDS_REQUIRED:
+        import_rows(db, iter_placeholder_words(
+            MIN_WORDS_REQUIRED - current, start=current + 1), update_existing=False)
+        db.commit()
+
+
+def _print_progress(report: ImportProgress) -> None:
+    """Print a one-line progress update for the command-line importer."""
+
+    print(f"\r{report.rows_read:,} rows read, {report.rows_written:,} written "
+          f"({report.rows_per_second:,.0f} rows/s)", end="", flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Import a vocabulary file into the application database from the command line."""
+
+    from tak_flashcard.db.session import get_session_factory, init_db
+
+    parser = argparse.ArgumentParser(description="Import a vocabulary file.")
+    parser.add_argument("path", type=Path, help="CSV, TSV or JSONL vocabulary file")
+    parser.add_argument("--chunk-size", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--skip-existing", action="store_true",
+                        help="leave existing pairs untouched instead of updating them")
+    args = parser.parse_args(argv)
+    init_db()
+    db = get_session_factory()()
+    try:
+        report = import_vocab(db, args.path, args.chunk_size, _print_progress,
+                              not args.skip_existing)
+    finally:
+        db.close()
+    print(f"\nImported {report.rows_read:,} rows in {report.elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
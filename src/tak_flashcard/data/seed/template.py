@@ -0,0 +1,162 @@
+"""Prebuilt template database for instant first launch.
+
+``build_template`` imports the vocabulary source into a fresh database,
+builds every index, runs ANALYZE and records a hash of the source file and
+the schema version. On first launch ``install_template`` copies it into
+place with SQLite's online backup API instead of importing row by row. A
+template built from a different source file or schema is ignored, and the
+caller falls back to the importer.
+
+Build the template from the repository root:
+
+    PYTHONPATH=src python -m tak_flashcard.data.seed.template
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional, Sequence
+
+from sqlalchemy.orm import sessionmaker
+
+from tak_flashcard.config import DB_PATH, MIN_WORDS_REQUIRED, TEMPLATE_PATH, VOCAB_PATH
+from tak_flashcard.data.seed.importer import ensure_seed_data
+from tak_flashcard.db.migrations import MIGRATIONS
+from tak_flashcard.db.session import create_sqlite_engine, init_db
+
+INFO_TABLE = "template_info"
+
+
+def source_hash(source: Path = VOCAB_PATH) -> str:
+    """Return a digest of everything that determines the template's contents.
+
+    Covers the vocabulary file bytes (or its absence), the placeholder
+    padding target and the schema version.
+    """
+
+    digest = hashlib.sha256(f"{MIN_WORDS_REQUIRED}:{len(MIGRATIONS)}:".encode())
+    if source.exists():
+        with source.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+    else:
+        digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def template_hash(template: Path = TEMPLATE_PATH) -> Optional[str]:
+    """Return the source hash recorded in a template, or None if unusable."""
+
+    if not template.exists():
+        return None
+    try:
+        connection = sqlite3.connect(f"file:{template}?mode=ro", uri=True)
+        try:
+            row = connection.execute(f"SELECT source_hash FROM {INFO_TABLE}").fetchone()
+        finally:
+            connection.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
+
+
+def is_template_current(template: Path = TEMPLATE_PATH, source: Path = VOCAB_PATH) -> bool:
+    """Return whether a template exists and was built from ``source``."""
+
+    recorded = template_hash(template)
+    return recorded is not None and recorded == source_hash(source)
+
+
+def build_template(output: Path = TEMPLATE_PATH, source: Path = VOCAB_PATH) -> Path:
+    """Build an indexed, analyzed template database from a vocabulary source.
+
+    Parameters:
+        output: Where to write the template; replaced atomically.
+        source: Vocabulary file to import.
+
+    Returns:
+        The path of the written template.
+    """
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    staging = output.with_suffix(".building")
+    staging.unlink(missing_ok=True)
+    engine = create_sqlite_engine(staging)
+    try:
+        init_db(engine)
+        db = sessionmaker(bind=engine, expire_on_commit=False)()
+        try:
+            ensure_seed_data(db, source)
+        finally:
+            db.close()
+    finally:
+        engine.dispose()
+
+    connection = sqlite3.connect(staging)
+    try:
+        connection.execute(f"CREATE TABLE {INFO_TABLE} (source_hash TEXT NOT NULL)")
+        connection.execute(f"INSERT INTO {INFO_TABLE} VALUES (?)", (source_hash(source),))
+        connection.commit()
+        connection.execute("ANALYZE")
+        connection.execute("PRAGMA optimize")
+        connection.commit()
+        # A single self-contained file; the app's storage profile picks the
+        # journal mode again once the copy is opened.
+        connection.execute("PRAGMA journal_mode = DELETE")
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    os.replace(staging, output)
+    return output
+
+
+def install_template(
+    db_path: Path = DB_PATH,
+    template: Path = TEMPLATE_PATH,
+    source: Path = VOCAB_PATH,
+) -> bool:
+    """Copy a current template into ``db_path`` if no database exists yet.
+
+    Parameters:
+        db_path: Application database location.
+        template: Prebuilt template database.
+        source: Vocabulary file the template must have been built from.
+
+    Returns:
+        True when the template was installed; False when a database already
+        exists or the template is missing or stale.
+    """
+
+    if db_path.exists() or not is_template_current(template, source):
+        return False
+    staging = db_path.with_suffix(".installing")
+    staging.unlink(missing_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    reader = sqlite3.connect(f"file:{template}?mode=ro", uri=True)
+    writer = sqlite3.connect(staging)
+    try:
+        reader.backup(writer)
+    finally:
+        writer.close()
+        reader.close()
+    os.replace(staging, db_path)
+    return True
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Build the template database from the command line."""
+
+    parser = argparse.ArgumentParser(description="Build the first-launch template database.")
+    parser.add_argument("--source", type=Path, default=VOCAB_PATH)
+    parser.add_argument("--output", type=Path, default=TEMPLATE_PATH)
+    args = parser.parse_args(argv)
+    path = build_template(args.output, args.source)
+    print(f"Wrote {path} ({path.stat().st_size:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""SQLite FTS5 shadow index for dictionary search.
+
+``words_fts`` mirrors the English and Vietnamese text of every word in raw
+and accent-folded form, keyed by the word id. Triggers on ``words`` keep it
+in sync by copying the stored ``english_fold``/``vietnamese_fold`` columns,
+so they use only built-in SQL and work from any SQLite connection; rows
+written without those columns are indexed lower-cased instead. SQLite
+builds without FTS5 simply skip the index and ``repo.search_words`` falls
+back to LIKE scans.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from tak_flashcard.utils.text import fold_text
+
+FTS_TABLE = "words_fts"
+# Raw columns outrank folded ones so typing the exact tone marks wins ties.
+RANK_EXPRESSION = f"bm25({FTS_TABLE}, 4.0, 4.0, 1.0, 1.0)"
+
+_CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+    english, vietnamese, english_folded, vietnamese_folded,
+    tokenize = 'unicode61 remove_diacritics 0',
+    prefix = '1 2 3'
+)
+"""
+
+# Folded text of a row, falling back to lower() for writers that left it empty.
+_FOLDED = ("coalesce(nullif({row}.english_fold, ''), lower({row}.english)), "
+           "coalesce(nullif({row}.vietnamese_fold, ''), lower({row}.vietnamese))")
+
+# Trigger names; migrations drop older definitions so ``install`` recreates them.
+TRIGGER_NAMES = ("words_fts_ai", "words_fts_ad", "words_fts_au")
+
+_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_ai AFTER INSERT ON words BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, english, vietnamese, english_folded, vietnamese_folded)
+        VALUES (new.id, new.english, new.vietnamese, {_FOLDED.format(row="new")});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_ad AFTER DELETE ON words BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS words_fts_au
+    AFTER UPDATE OF english, vietnamese, english_fold, vietnamese_fold ON words BEGIN
+        DELETE FROM {FTS_TABLE} WHERE rowid = old.id;
+        INSERT INTO {FTS_TABLE}(rowid, english, vietnamese, english_folded, vietnamese_folded)
+        VALUES (new.id, new.english, new.vietnamese, {_FOLDED.format(row="new")});
+    END
+    """,
+)
+
+_BACKFILL = f"""
+INSERT INTO {FTS_TABLE}(rowid, english, vietnamese, english_folded, vietnamese_folded)
+SELECT id, english, vietnamese, {_FOLDED.format(row="words")} FROM words
+"""
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_availability: dict[str, bool] = {}
+
+
+def _table_exists(connection: Connection) -> bool:
+    """Return whether the FTS table is present in the schema."""
+
+    return connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": FTS_TABLE}
+    ).first() is not None
+
+
+def install(engine: Engine) -> bool:
+    """Create and backfill the FTS index and its triggers if missing.
+
+    Parameters:
+        engine: Engine of the database to index.
+
+    Returns:
+        True when the index is usable, False when FTS5 is not compiled in.
+    """
+
+    key = str(engine.url)
+    with engine.begin() as connection:
+        if not _table_exists(connection):
+            try:
+                connection.execute(text(_CREATE_TABLE))
+            except OperationalError:
+                _availability[key] = False
+                return False
+            connection.execute(text(_BACKFILL))
+        for trigger in _TRIGGERS:
+            connection.execute(text(trigger))
+    _availability[key] = True
+    return True
+
+
+def is_available(db: Session) -> bool:
+    """Return whether the session's database has a usable FTS index."""
+
+    bind = db.get_bind()
+    key = str(bind.url)
+    available = _availability.get(key)
+    if available is None:
+        available = _table_exists(db.connection())
+        _availability[key] = available
+    return available
+
+
+def build_match(query: str) -> str | None:
+    """Translate free text into an FTS5 MATCH expression.
+
+    Every token becomes a prefix query; all tokens must match, either in the
+    raw columns or in the accent-folded columns.
+
+    Parameters:
+        query: User-entered search text.
+
+    Returns:
+        The MATCH expression, or None if the query has no word characters.
+    """
+
+    tokens = _TOKEN.findall(query)
+    if not tokens:
+        return None
+    raw = " AND ".join(f'"{token}"*' for token in tokens)
+    folded = " AND ".join(f'"{fold_text(token)}"*' for token in tokens)
+    return (
+        f"{{english vietnamese}} : ({raw}) OR "
+        f"{{english_folded vietnamese_folded}} : ({folded})"
+    )
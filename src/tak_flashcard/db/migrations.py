@@ -0,0 +1,170 @@
+"""Schema migrations for existing databases.
+
+``Base.metadata.create_all`` builds new databases with the current schema but
+never alters tables that already exist. Each step here brings an older
+database forward and must be idempotent, because fresh databases run every
+step too. Progress is tracked in SQLite's ``PRAGMA user_version``.
+"""
+
+from __future__ import annotations
+
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from tak_flashcard.db.fts import TRIGGER_NAMES
+from tak_flashcard.db.models import BUCKET_EXPRESSION
+
+
+def _dedupe_word_pairs(connection: Connection) -> None:
+    """Merge duplicate (english, vietnamese) rows and enforce uniqueness."""
+
+    connection.execute(text("""
+        UPDATE words SET
+            display_count = (SELECT sum(d.display_count) FROM words AS d
+                             WHERE d.english = words.english AND d.vietnamese = words.vietnamese),
+            correct_count = (SELECT sum(d.correct_count) FROM words AS d
+                             WHERE d.english = words.english AND d.vietnamese = words.vietnamese)
+        WHERE id IN (SELECT min(id) FROM words GROUP BY english, vietnamese HAVING count(*) > 1)
+    """))
+    connection.execute(text("""
+        DELETE FROM words WHERE id NOT IN (SELECT min(id) FROM words GROUP BY english, vietnamese)
+    """))
+    connection.execute(text("""
+        UPDATE words SET difficulty = 1.0 - (correct_count / (display_count + 1e-6))
+        WHERE display_count > 0
+    """))
+    connection.execute(text(
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_words_english_vietnamese ON words (english, vietnamese)"))
+
+
+def _add_word_revisions(connection: Connection) -> None:
+    """Add the ``revision`` column, the data version counter and its delete trigger."""
+
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_info(words)"))}
+    if "revision" not in columns:
+        connection.execute(text(
+            "ALTER TABLE words ADD COLUMN revision INTEGER NOT NULL DEFAULT 0"))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_words_revision ON words (revision)"))
+    connection.execute(text(
+        "INSERT OR IGNORE INTO app_meta (key, value) VALUES ('data_version', 0)"))
+    # Deleted rows leave no revision behind, so count them as a new version.
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS words_version_ad AFTER DELETE ON words BEGIN
+            UPDATE app_meta SET value = value + 1 WHERE key = 'data_version';
+        END
+    """))
+
+
+def _add_normalized_columns(connection: Connection) -> None:
+    """Add and backfill the normalized lookup columns and their indexes."""
+
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_info(words)"))}
+    for name, ddl in (
+        ("english_norm", "VARCHAR NOT NULL DEFAULT ''"),
+        ("vietnamese_norm", "VARCHAR NOT NULL DEFAULT ''"),
+        ("vietnamese_fold", "VARCHAR NOT NULL DEFAULT ''"),
+        ("pos_norm", "VARCHAR"),
+    ):
+        if name not in columns:
+            connection.execute(text(f"ALTER TABLE words ADD COLUMN {name} {ddl}"))
+    connection.execute(text("""
+        UPDATE words SET
+            english_norm = normalize_text(english),
+            vietnamese_norm = normalize_text(vietnamese),
+            vietnamese_fold = fold_text(vietnamese),
+            pos_norm = nullif(normalize_text(part_of_speech), '')
+    """))
+    for index, column_list in (
+        ("ix_words_english_norm", "english_norm"),
+        ("ix_words_vietnamese_norm", "vietnamese_norm"),
+        ("ix_words_vietnamese_fold", "vietnamese_fold"),
+        ("ix_words_pos_norm_english", "pos_norm, english"),
+    ):
+        connection.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {index} ON words ({column_list})"))
+
+
+def _add_difficulty_index(connection: Connection) -> None:
+    """Index words hardest first for top-K drills and difficulty ordering."""
+
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_words_difficulty_display "
+        "ON words (difficulty DESC, display_count)"))
+
+
+def _add_difficulty_buckets(connection: Connection) -> None:
+    """Add the generated difficulty bucket column and its probe index."""
+
+    # table_info hides generated columns; table_xinfo lists them.
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_xinfo(words)"))}
+    if "difficulty_bucket" not in columns:
+        connection.execute(text(
+            "ALTER TABLE words ADD COLUMN difficulty_bucket INTEGER "
+            f"GENERATED ALWAYS AS ({BUCKET_EXPRESSION}) VIRTUAL"))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_words_bucket_id "
+        "ON words (difficulty_bucket, id, difficulty)"))
+
+
+def _add_review_cleanup(connection: Connection) -> None:
+    """Drop a word's review schedule when the word is deleted.
+
+    SQLite leaves foreign keys unenforced by default, so the cascade is a
+    trigger rather than an ``ON DELETE`` clause.
+    """
+
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS words_review_ad AFTER DELETE ON words BEGIN
+            DELETE FROM review_schedule WHERE word_id = old.id;
+        END
+    """))
+
+
+def _add_english_fold(connection: Connection) -> None:
+    """Store folded English text and drop search triggers that folded it in SQL.
+
+    ``fts.install`` recreates the triggers afterwards, copying the stored
+    folded columns instead of calling the ``fold_text`` function, which
+    only connections opened by ``db.session`` have.
+    """
+
+    columns = {row[1] for row in connection.execute(text("PRAGMA table_info(words)"))}
+    if "english_fold" not in columns:
+        connection.execute(text(
+            "ALTER TABLE words ADD COLUMN english_fold VARCHAR NOT NULL DEFAULT ''"))
+    connection.execute(text(
+        "UPDATE words SET english_fold = fold_text(english) WHERE english_fold = ''"))
+    for trigger in TRIGGER_NAMES:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+
+MIGRATIONS: list[Callable[[Connection], None]] = [
+    _dedupe_word_pairs,
+    _add_word_revisions,
+    _add_normalized_columns,
+    _add_difficulty_index,
+    _add_difficulty_buckets,
+    _add_review_cleanup,
+    _add_english_fold,
+]
+
+
+def run_migrations(engine: Engine) -> int:
+    """Apply pending migrations in order.
+
+    Parameters:
+        engine: Engine of the database to upgrade.
+
+    Returns:
+        The schema version after migrating.
+    """
+
+    with engine.begin() as connection:
+        version = connection.execute(text("PRAGMA user_version")).scalar() or 0
+        for step, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(connection)
+            connection.execute(text(f"PRAGMA user_version = {step}"))
+        return max(version, len(MIGRATIONS))
@@ -2,16 +2,63 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Column, Float, Integer, String
+from typing import Callable, Optional
+
+from sqlalchemy import (
+    Column,
+    Computed,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    event,
+)
 from sqlalchemy.orm import declarative_base
 
+from tak_flashcard.core.difficulty import DIFFICULTY_BUCKETS
+from tak_flashcard.core.srs import DEFAULT_EASE
+from tak_flashcard.utils.text import fold_text, normalize_text
+
 Base = declarative_base()
 
+# SQL twin of core.difficulty.difficulty_bucket; unset difficulties count as 0.5.
+BUCKET_EXPRESSION = (
+    f"min(CAST((CASE WHEN difficulty > 0 THEN difficulty ELSE 0.5 END) * {DIFFICULTY_BUCKETS}"
+    f" AS INTEGER), {DIFFICULTY_BUCKETS - 1})"
+)
+
+
+def _derived_from(source: str, transform: Callable[[Optional[str]], Optional[str]]) -> Callable:
+    """Return a Core insert default computing a lookup column from ``source``.
+
+    The default reads the row's own parameters, so Core inserts and
+    executemany batches that omit the lookup columns still fill them in.
+    """
+
+    def default(context) -> Optional[str]:
+        """Compute the column from the row being inserted."""
+
+        return transform(context.get_current_parameters().get(source))
+
+    return default
+
+
+def _normalize_part(part_of_speech: Optional[str]) -> Optional[str]:
+    """Return the stored ``pos_norm`` of a part of speech."""
+
+    return normalize_text(part_of_speech) or None
+
 
 class Word(Base):
     """Represents a vocabulary word with performance metrics."""
 
     __tablename__ = "words"
+    __table_args__ = (
+        Index("ux_words_english_vietnamese", "english", "vietnamese", unique=True),
+        Index("ix_words_pos_norm_english", "pos_norm", "english"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     english = Column(String, nullable=False, index=True)
@@ -20,6 +67,20 @@ class Word(Base):
     display_count = Column(Integer, default=0, nullable=False)
     correct_count = Column(Integer, default=0, nullable=False)
     difficulty = Column(Float, default=0.0, nullable=False)
+    revision = Column(Integer, default=0, nullable=False, index=True)
+    # Lookup copies of the text columns; see normalized_columns. Inserts fill
+    # them through these defaults, ORM updates through _normalize_word, and a
+    # Core UPDATE of a text column must set them from normalized_columns.
+    english_norm = Column(String, nullable=False, index=True,
+                          default=_derived_from("english", normalize_text))
+    english_fold = Column(String, nullable=False, default=_derived_from("english", fold_text))
+    vietnamese_norm = Column(String, nullable=False, index=True,
+                             default=_derived_from("vietnamese", normalize_text))
+    vietnamese_fold = Column(String, nullable=False, index=True,
+                             default=_derived_from("vietnamese", fold_text))
+    pos_norm = Column(String, nullable=True, default=_derived_from("part_of_speech", _normalize_part))
+    # Computed by SQLite on read, so no write path has to maintain it.
+    difficulty_bucket = Column(Integer, Computed(BUCKET_EXPRESSION, persisted=False))
 
     def to_dict(self) -> dict[str, str | int | float | None]:
         """Convert the word record to a dictionary for UI display."""
@@ -33,3 +94,136 @@ class Word(Base):
             "correct_count": self.correct_count,
             "difficulty": self.difficulty,
         }
+
+
+# Serves "hardest first" reads: the weak-words drill and the dictionary's
+# difficulty order walk this index instead of sorting the table.
+Index("ix_words_difficulty_display", Word.difficulty.desc(), Word.display_count)
+# Random rowid probes within a bucket; difficulty makes the histogram scan covering.
+Index("ix_words_bucket_id", Word.difficulty_bucket, Word.id, Word.difficulty)
+
+
+def normalized_columns(
+    english: Optional[str],
+    vietnamese: Optional[str],
+    part_of_speech: Optional[str],
+) -> dict[str, Optional[str]]:
+    """Return the stored lookup columns derived from a word's text fields.
+
+    English and Vietnamese are NFC-normalized and lower-cased, and also
+    accent-folded so searches work without tone marks; the full-text index
+    copies the folded columns.
+    """
+
+    return {
+        "english_norm": normalize_text(english),
+        "english_fold": fold_text(english),
+        "vietnamese_norm": normalize_text(vietnamese),
+        "vietnamese_fold": fold_text(vietnamese),
+        "pos_norm": _normalize_part(part_of_speech),
+    }
+
+
+@event.listens_for(Word, "before_insert")
+@event.listens_for(Word, "before_update")
+def _normalize_word(_mapper, _connection, word: Word) -> None:
+    """Refresh a word's lookup columns before the ORM writes it."""
+
+    for key, value in normalized_columns(
+            word.english, word.vietnamese, word.part_of_speech).items():
+        setattr(word, key, value)
+
+
+class ReviewSchedule(Base):
+    """Spaced-repetition schedule of one word.
+
+    Only words that have been reviewed at least once have a row. ``due`` is
+    a Unix timestamp; its index makes "next due card" an ``ORDER BY due
+    LIMIT 1`` seek.
+    """
+
+    __tablename__ = "review_schedule"
+
+    word_id = Column(Integer, ForeignKey("words.id"), primary_key=True)
+    due = Column(Integer, nullable=False, index=True)
+    interval = Column(Float, default=0.0, nullable=False)
+    ease = Column(Float, default=DEFAULT_EASE, nullable=False)
+    repetitions = Column(Integer, default=0, nullable=False)
+    lapses = Column(Integer, default=0, nullable=False)
+
+
+class Review(Base):
+    """One answered card in the append-only review log.
+
+    Enumerations are stored as the small integer codes of
+    ``constants.MODE_CODES`` and ``constants.DIRECTION_CODES``. Rows are
+    never updated; the log keeps entries for words deleted later, and
+    ``repo.rebuild_stats_from_log`` ignores them.
+    """
+
+    __tablename__ = "reviews"
+    __table_args__ = (
+        # Covers the per-word GROUP BY that rebuilds the word counters.
+        Index("ix_reviews_word_correct", "word_id", "correct"),
+        Index("ix_reviews_answered_at", "answered_at"),
+        Index("ix_reviews_session", "session_id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    word_id = Column(Integer, nullable=False)
+    session_id = Column(Integer, nullable=False)
+    answered_at = Column(Integer, nullable=False)  # Unix seconds
+    latency_ms = Column(Integer, nullable=False)
+    direction = Column(SmallInteger, nullable=False)
+    mode = Column(SmallInteger, nullable=False)
+    correct = Column(SmallInteger, nullable=False)
+
+
+class ReviewDaily(Base):
+    """Answer totals per local day, direction and mode.
+
+    Materialized from ``reviews`` by ``repo.refresh_review_summaries``, so
+    daily accuracy, streaks and learning curves read a few rows per study
+    day instead of the whole log. ``day`` counts local days since the Unix
+    epoch.
+    """
+
+    __tablename__ = "review_daily"
+
+    day = Column(Integer, primary_key=True)
+    direction = Column(SmallInteger, primary_key=True)
+    mode = Column(SmallInteger, primary_key=True)
+    answers = Column(Integer, default=0, nullable=False)
+    correct = Column(Integer, default=0, nullable=False)
+    latency_ms = Column(Integer, default=0, nullable=False)  # summed
+
+
+class ReviewPartTotal(Base):
+    """Answer totals per part of speech and direction, materialized from ``reviews``.
+
+    ``part`` is the answered word's ``pos_norm`` when its answer was rolled
+    up; answers for words deleted before then are not counted.
+    """
+
+    __tablename__ = "review_part_totals"
+
+    part = Column(String, primary_key=True)
+    direction = Column(SmallInteger, primary_key=True)
+    answers = Column(Integer, default=0, nullable=False)
+    correct = Column(Integer, default=0, nullable=False)
+
+
+class AppMeta(Base):
+    """Key/value counters describing the state of the database.
+
+    ``data_version`` is bumped by every write to ``words``; each written row
+    stores the new value in ``Word.revision`` so readers can fetch only the
+    rows changed since the version they last saw. ``session_seq`` numbers
+    flashcard sessions in the review log, and ``summary_review_id`` is the
+    last ``reviews.id`` folded into the summary tables.
+    """
+
+    __tablename__ = "app_meta"
+
+    key = Column(String, primary_key=True)
+    value = Column(Integer, default=0, nullable=False)
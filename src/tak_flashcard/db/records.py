@@ -0,0 +1,81 @@
+"""Compact read-only word records for in-memory session decks."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, NamedTuple, Optional, Sequence
+
+from tak_flashcard.core.difficulty import difficulty_score
+from tak_flashcard.db.models import Word
+
+RECORD_COLUMNS = (
+    Word.id,
+    Word.english,
+    Word.vietnamese,
+    Word.part_of_speech,
+    Word.display_count,
+    Word.correct_count,
+    Word.difficulty,
+)
+
+
+class WordRecord(NamedTuple):
+    """Immutable snapshot of one word row.
+
+    A plain tuple with named fields: no ORM instance state, identity-map
+    entry or attribute instrumentation. Statistics changes produce a new
+    record through ``answered``; the database is updated separately by id.
+    """
+
+    id: int
+    english: str
+    vietnamese: str
+    part_of_speech: Optional[str]
+    display_count: int
+    correct_count: int
+    difficulty: float
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> WordRecord:
+        """Build a record from a row selected with ``RECORD_COLUMNS``.
+
+        ``part_of_speech`` is interned, so the handful of distinct values
+        are shared by every record instead of stored once per row.
+        """
+
+        word_id, english, vietnamese, part, display, correct, difficulty = row
+        return cls(
+            word_id,
+            english,
+            vietnamese,
+            sys.intern(part) if part else None,
+            display or 0,
+            correct or 0,
+            difficulty or 0.0,
+        )
+
+    def answered(self, is_correct: bool) -> WordRecord:
+        """Return a copy with one more answer applied to its statistics."""
+
+        display_count = self.display_count + 1
+        correct_count = self.correct_count + (1 if is_correct else 0)
+        return self._replace(
+            display_count=display_count,
+            correct_count=correct_count,
+            difficulty=difficulty_score(display_count, correct_count),
+        )
+
+
+class ReviewEvent(NamedTuple):
+    """One answer waiting to be appended to the review log.
+
+    Field names match the ``reviews`` columns, so ``_asdict`` is an insert row.
+    """
+
+    word_id: int
+    session_id: int
+    answered_at: int
+    latency_ms: int
+    direction: int
+    mode: int
+    correct: int
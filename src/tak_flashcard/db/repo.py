@@ -3,14 +3,33 @@
 from __future__ import annotations
 
 import random
-from collections.abc import Iterable
+import time
+from collections.abc import Collection, Iterable
 from typing import Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, bindparam, case, exists, func, insert, select, text, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
-from tak_flashcard.constants import Direction, DIFFICULTY_LEVELS
-from tak_flashcard.db.models import Word
+from tak_flashcard.constants import Direction
+from tak_flashcard.core.difficulty import clamp_level, selection_weight
+from tak_flashcard.core.srs import DAY_SECONDS, ReviewState
+from tak_flashcard.db import fts
+from tak_flashcard.db.models import (
+    AppMeta,
+    Review,
+    ReviewDaily,
+    ReviewPartTotal,
+    ReviewSchedule,
+    Word,
+)
+from tak_flashcard.db.records import RECORD_COLUMNS, ReviewEvent, WordRecord
+from tak_flashcard.utils.text import fold_text, normalize_text
+
+
+DATA_VERSION_KEY = "data_version"
+SESSION_SEQUENCE_KEY = "session_seq"
+SUMMARY_WATERMARK_KEY = "summary_review_id"
 
 
 def get_word_count(db: Session) -> int:
@@ -19,10 +38,89 @@ def get_word_count(db: Session) -> int:
     return db.scalar(select(func.count()).select_from(Word)) or 0
 
 
+def get_data_version(db: Session) -> int:
+    """Return the current data version of the words table."""
+
+    return db.scalar(select(AppMeta.value).where(AppMeta.key == DATA_VERSION_KEY)) or 0
+
+
+def increment_counter(db: Session, key: str, step: int = 1) -> int:
+    """Increment an ``app_meta`` counter inside the current transaction.
+
+    Parameters:
+        db: Database session.
+        key: Counter name.
+        step: Amount to add, so a caller can reserve a block of values.
+
+    Returns:
+        The counter's new value; a missing counter starts at ``step``.
+    """
+
+    value = db.scalar(
+        sqlite_insert(AppMeta.__table__)
+        .values(key=key, value=step)
+        .on_conflict_do_update(
+            index_elements=["key"],
+            set_={"value": AppMeta.__table__.c.value + step})
+        .returning(AppMeta.__table__.c.value)
+    )
+    return int(value or 0)
+
+
+def bump_data_version(db: Session) -> int:
+    """Increment the data version inside the current transaction.
+
+    Every writer to ``words`` calls this once per statement batch and stamps
+    the rows it touches with the returned value.
+
+    Returns:
+        The new data version.
+    """
+
+    return increment_counter(db, DATA_VERSION_KEY)
+
+
 def bulk_insert_words(db: Session, words: Iterable[dict[str, object]]) -> None:
     """Insert multiple words into the database."""
 
-    db.bulk_insert_mappings(Word, list(words))
+    revision = bump_data_version(db)
+    db.bulk_insert_mappings(Word, [{**word, "revision": revision} for word in words])
+
+
+def upsert_words(db: Session, rows: Sequence[dict[str, object]], update_existing: bool = True) -> int:
+    """Insert a chunk of words, merging rows that already exist.
+
+    Parameters:
+        db: Active session; the statement joins its current transaction.
+        rows: Word mappings sharing the same keys, executed as one executemany.
+        update_existing: Refresh ``part_of_speech`` of existing
+            (english, vietnamese) pairs instead of skipping them. Learning
+            statistics of existing rows are never touched.
+
+    Returns:
+        The number of rows inserted or updated.
+    """
+
+    if not rows:
+        return 0
+    stmt = sqlite_insert(Word.__table__).values(revision=bump_data_version(db))
+    keys = ["english", "vietnamese"]
+    if update_existing:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={
+                "part_of_speech": func.coalesce(
+                    stmt.excluded.part_of_speech, Word.__table__.c.part_of_speech),
+                "pos_norm": func.coalesce(
+                    stmt.excluded.pos_norm, Word.__table__.c.pos_norm),
+                "revision": stmt.excluded.revision,
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=keys)
+    # The lookup columns come from Word's insert defaults, per row.
+    result = db.execute(stmt, list(rows))
+    return max(result.rowcount or 0, 0)
 
 
 def list_words(db: Session) -> list[Word]:
@@ -31,22 +129,284 @@ def list_words(db: Session) -> list[Word]:
     return list(db.scalars(select(Word).order_by(Word.english)).all())
 
 
-def search_words(db: Session, query: str) -> list[Word]:
-    """Search words by English or Vietnamese fields."""
+def list_word_records(db: Session) -> list[WordRecord]:
+    """Return all words as compact records ordered by English word.
+
+    Uses a single Core select of plain tuples, bypassing ORM instance
+    construction and the session identity map.
+    """
+
+    result = db.execute(select(*RECORD_COLUMNS).order_by(Word.english))
+    return [WordRecord.from_row(row) for row in result.tuples()]
 
-    pattern = f"%{query.lower()}%"
-    stmt = select(Word).where(
-        func.lower(Word.english).like(pattern) | func.lower(
-            Word.vietnamese).like(pattern)
-    ).order_by(Word.english)
+
+def list_word_records_since(db: Session, revision: int) -> list[WordRecord]:
+    """Return records for words written after a data version.
+
+    Parameters:
+        db: Active session.
+        revision: Data version the caller's copy of the deck reflects.
+
+    Returns:
+        Changed or inserted words, found through the ``revision`` index.
+    """
+
+    result = db.execute(select(*RECORD_COLUMNS).where(Word.revision > revision))
+    return [WordRecord.from_row(row) for row in result.tuples()]
+
+
+def list_words_page(
+    db: Session,
+    after: tuple[str, int] | None,
+    limit: int,
+) -> list[Word]:
+    """Return the next page of words in (english, id) order.
+
+    Parameters:
+        db: Active session.
+        after: Sort key of the last row already seen, or None for the start.
+        limit: Maximum number of rows to return.
+
+    Returns:
+        Up to ``limit`` words that sort strictly after ``after``.
+    """
+
+    stmt = select(Word).order_by(Word.english, Word.id).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(Word.english, Word.id) > tuple_(*after))
+    return list(db.scalars(stmt).all())
+
+
+def word_key_at(db: Session, offset: int) -> tuple[str, int] | None:
+    """Return the (english, id) sort key of the row at an absolute offset.
+
+    Used to re-anchor keyset pagination after a jump; the english index
+    covers the scan so no table rows are read.
+    """
+
+    row = db.execute(
+        select(Word.english, Word.id).order_by(
+            Word.english, Word.id).offset(offset).limit(1)
+    ).first()
+    return (row[0], row[1]) if row else None
+
+
+# Matches ix_words_difficulty_display column for column, so no sort step is needed.
+HARDEST_FIRST = (Word.difficulty.desc(), Word.display_count, Word.id)
+
+
+def hardest_word_records(db: Session, limit: int, part: str | None = None) -> list[WordRecord]:
+    """Return the ``limit`` hardest words as records, hardest first.
+
+    Parameters:
+        db: Active session.
+        limit: Number of words to return.
+        part: Optional part of speech to restrict the words to.
+
+    Returns:
+        Records ordered by difficulty descending, then fewest displays, read
+        by walking ``ix_words_difficulty_display`` and stopping after
+        ``limit`` matches.
+    """
+
+    stmt = select(*RECORD_COLUMNS).order_by(*HARDEST_FIRST).limit(limit)
+    if part:
+        # likely() tells SQLite the filter keeps most rows, so it walks the
+        # hardest-first index and stops at ``limit`` instead of seeking the
+        # (pos_norm, english) index and sorting every word of that part.
+        stmt = stmt.where(func.likely(Word.pos_norm == normalize_text(part)))
+    return [WordRecord.from_row(row) for row in db.execute(stmt).tuples()]
+
+
+def list_words_hardest_page(
+    db: Session,
+    after: tuple[float, int, int] | None,
+    limit: int,
+) -> list[Word]:
+    """Return the next page of words hardest first.
+
+    The order mixes descending and ascending columns, so a single row-value
+    comparison cannot express "after this key". The page is instead read as
+    up to three index range scans: the rest of the current (difficulty,
+    display_count) group, the rest of the current difficulty, then every
+    easier difficulty.
+
+    Parameters:
+        db: Active session.
+        after: (difficulty, display_count, id) of the last row already seen,
+            or None for the start.
+        limit: Maximum number of rows to return.
+
+    Returns:
+        Up to ``limit`` words that sort strictly after ``after``.
+    """
+
+    stmt = select(Word).order_by(*HARDEST_FIRST)
+    if after is None:
+        return list(db.scalars(stmt.limit(limit)).all())
+    difficulty, display_count, word_id = after
+    rows: list[Word] = []
+    for clause in (
+        (Word.difficulty == difficulty) & (Word.display_count == display_count) & (Word.id > word_id),
+        (Word.difficulty == difficulty) & (Word.display_count > display_count),
+        Word.difficulty < difficulty,
+    ):
+        if len(rows) >= limit:
+            break
+        rows.extend(db.scalars(stmt.where(clause).limit(limit - len(rows))).all())
+    return rows
+
+
+def hardest_key_at(db: Session, offset: int) -> tuple[float, int, int] | None:
+    """Return the (difficulty, display_count, id) key of the row at an offset.
+
+    The difficulty index covers the scan, like ``word_key_at`` for English order.
+    """
+
+    row = db.execute(
+        select(Word.difficulty, Word.display_count, Word.id).order_by(
+            *HARDEST_FIRST).offset(offset).limit(1)
+    ).first()
+    return (row[0], row[1], row[2]) if row else None
+
+
+def difficulty_histogram(db: Session) -> list[tuple[int, int, float, int, int]]:
+    """Summarize the words per difficulty bucket.
+
+    Returns:
+        (bucket, row count, sum of effective difficulty, lowest id, highest
+        id) per non-empty bucket, from one scan of ``ix_words_bucket_id``.
+    """
+
+    effective = case((Word.difficulty > 0, Word.difficulty), else_=0.5)
+    result = db.execute(
+        select(Word.difficulty_bucket, func.count(), func.total(effective),
+               func.min(Word.id), func.max(Word.id))
+        .group_by(Word.difficulty_bucket)
+    )
+    return [tuple(row) for row in result.tuples()]
+
+
+def word_record_in_bucket(db: Session, bucket: int, start_id: int) -> WordRecord | None:
+    """Return the first word of a difficulty bucket with an id of at least ``start_id``.
+
+    A seek on ``ix_words_bucket_id``; the caller wraps around to the start
+    of the bucket when this returns None.
+    """
+
+    row = db.execute(
+        select(*RECORD_COLUMNS)
+        .where(Word.difficulty_bucket == bucket, Word.id >= start_id)
+        .order_by(Word.difficulty_bucket, Word.id)
+        .limit(1)
+    ).first()
+    return WordRecord.from_row(row) if row else None
+
+
+def word_records_from(db: Session, start_id: int, limit: int) -> list[WordRecord]:
+    """Return up to ``limit`` consecutive records starting at ``start_id`` by rowid."""
+
+    result = db.execute(
+        select(*RECORD_COLUMNS).where(Word.id >= start_id).order_by(Word.id).limit(limit))
+    return [WordRecord.from_row(row) for row in result.tuples()]
+
+
+def word_id_range(db: Session) -> tuple[int, int] | None:
+    """Return the lowest and highest word ids, read from the ends of the rowid tree."""
+
+    low, high = db.execute(select(func.min(Word.id), func.max(Word.id))).one()
+    return (low, high) if low is not None else None
+
+
+def get_words_by_ids(db: Session, ids: Sequence[int]) -> list[Word]:
+    """Return words for the given ids, preserving the order of ``ids``."""
+
+    if not ids:
+        return []
+    found = {word.id: word for word in db.scalars(
+        select(Word).where(Word.id.in_(list(ids)))).all()}
+    return [found[word_id] for word_id in ids if word_id in found]
+
+
+def search_words(db: Session, query: str, limit: int | None = None) -> list[Word]:
+    """Search words by English or Vietnamese fields.
+
+    Uses the FTS5 index (token prefixes, tone marks optional, bm25 ranking)
+    when available and falls back to substring LIKE scans otherwise.
+    """
+
+    if fts.is_available(db):
+        match = fts.build_match(query)
+        if match is not None:
+            return search_words_fts(db, match, limit)
+    return search_words_like(db, query, limit)
+
+
+def search_word_ids(db: Session, query: str, limit: int | None = None) -> list[int]:
+    """Return ids of words matching a search, in the same order as ``search_words``."""
+
+    if fts.is_available(db):
+        match = fts.build_match(query)
+        if match is not None:
+            return list(db.scalars(_fts_statement("words.id", match, limit)).all())
+    stmt = select(Word.id).where(_like_clause(query)).order_by(
+        Word.english).limit(limit)
+    return list(db.scalars(stmt).all())
+
+
+def _like_clause(query: str):
+    """Build the substring filter used without FTS.
+
+    Matches the stored normalized columns, so rows are not lower-cased per
+    query, and Vietnamese also matches without tone marks.
+    """
+
+    pattern = f"%{normalize_text(query)}%"
+    return (Word.english_norm.like(pattern)
+            | Word.vietnamese_norm.like(pattern)
+            | Word.vietnamese_fold.like(f"%{fold_text(query)}%"))
+
+
+def _fts_statement(columns: str, match: str, limit: int | None):
+    """Build a relevance-ordered FTS5 query returning the given columns."""
+
+    sql = (
+        f"SELECT {columns} FROM {fts.FTS_TABLE} "
+        f"JOIN words ON words.id = {fts.FTS_TABLE}.rowid "
+        f"WHERE {fts.FTS_TABLE} MATCH :match "
+        f"ORDER BY {fts.RANK_EXPRESSION}, words.english"
+    )
+    params: dict[str, object] = {"match": match}
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = limit
+    return text(sql).bindparams(**params)
+
+
+def search_words_fts(db: Session, match: str, limit: int | None = None) -> list[Word]:
+    """Run an FTS5 MATCH expression and return words ordered by relevance."""
+
+    stmt = select(Word).from_statement(_fts_statement("words.*", match, limit))
+    return list(db.scalars(stmt).all())
+
+
+def search_words_like(db: Session, query: str, limit: int | None = None) -> list[Word]:
+    """Search words with case-insensitive substring matching."""
+
+    stmt = select(Word).where(_like_clause(query)).order_by(
+        Word.english).limit(limit)
     return list(db.scalars(stmt).all())
 
 
 def filter_by_part_of_speech(db: Session, part: str) -> list[Word]:
-    """Filter words by part of speech."""
+    """Filter words by part of speech in English order.
+
+    The (pos_norm, english) index yields the matching rowids already sorted,
+    so there is no scan or sort step; each full row is then read from the
+    table by rowid.
+    """
 
-    stmt = select(Word).where(func.lower(Word.part_of_speech)
-                              == part.lower()).order_by(Word.english)
+    stmt = select(Word).where(Word.pos_norm == normalize_text(part)).order_by(Word.english)
     return list(db.scalars(stmt).all())
 
 
@@ -61,9 +421,387 @@ def update_word_stats(db: Session, word_id: int, is_correct: bool) -> None:
         word.correct_count += 1
     word.difficulty = calculate_difficulty(
         word.display_count, word.correct_count)
+    word.revision = bump_data_version(db)
     db.add(word)
 
 
+_STATS_DELTA_UPDATE = (
+    update(Word.__table__)
+    .where(Word.__table__.c.id == bindparam("word_id", type_=Integer))
+    .values(
+        display_count=Word.__table__.c.display_count
+        + bindparam("display_delta", type_=Integer),
+        correct_count=Word.__table__.c.correct_count
+        + bindparam("correct_delta", type_=Integer),
+        difficulty=1.0
+        - (Word.__table__.c.correct_count + bindparam("correct_delta", type_=Integer))
+        / (Word.__table__.c.display_count + bindparam("display_delta", type_=Integer) + 1e-6),
+        revision=bindparam("revision", type_=Integer),
+    )
+)
+
+
+def apply_stat_deltas(db: Session, deltas: Iterable[dict[str, int]]) -> None:
+    """Apply accumulated display/correct deltas in one set-based UPDATE.
+
+    Parameters:
+        db: Active session; the statement joins its current transaction.
+        deltas: Mappings with ``word_id``, ``display_delta`` and
+            ``correct_delta`` keys, executed as a single executemany.
+    """
+
+    rows = list(deltas)
+    if rows:
+        revision = bump_data_version(db)
+        db.execute(_STATS_DELTA_UPDATE, [{**row, "revision": revision} for row in rows])
+
+
+REVIEW_COLUMNS = (
+    ReviewSchedule.word_id,
+    ReviewSchedule.due,
+    ReviewSchedule.interval,
+    ReviewSchedule.ease,
+    ReviewSchedule.repetitions,
+    ReviewSchedule.lapses,
+)
+
+
+def next_due_review(
+    db: Session,
+    now: int,
+    exclude: Collection[int] = (),
+) -> tuple[WordRecord, ReviewState] | None:
+    """Return the most overdue word and its schedule.
+
+    Parameters:
+        db: Active session.
+        now: Current Unix time; only rows due at or before it qualify.
+        exclude: Word ids already handed out or rescheduled but not yet
+            written; the seek steps over at most this many index entries.
+
+    Returns:
+        The word and its schedule, read with one seek on the ``due`` index
+        and a primary-key lookup, or None if nothing is due.
+    """
+
+    stmt = (
+        select(*RECORD_COLUMNS, *REVIEW_COLUMNS)
+        .join(Word, Word.id == ReviewSchedule.word_id)
+        .where(ReviewSchedule.due <= now)
+        .order_by(ReviewSchedule.due)
+        .limit(1)
+    )
+    if exclude:
+        stmt = stmt.where(ReviewSchedule.word_id.not_in(list(exclude)))
+    row = db.execute(stmt).first()
+    if row is None:
+        return None
+    split = len(RECORD_COLUMNS)
+    return WordRecord.from_row(row[:split]), ReviewState(*row[split:])
+
+
+def last_scheduled_word_id(db: Session) -> int:
+    """Return the highest word id with a review schedule, or 0."""
+
+    return db.scalar(select(func.max(ReviewSchedule.word_id))) or 0
+
+
+def next_new_word(db: Session, after_id: int) -> WordRecord | None:
+    """Return the first never-reviewed word with an id above ``after_id``.
+
+    Words are introduced in id order, so callers pass the highest id
+    introduced so far and the scan starts right where the last one ended.
+    """
+
+    stmt = (
+        select(*RECORD_COLUMNS)
+        .where(Word.id > after_id,
+               ~exists().where(ReviewSchedule.word_id == Word.id))
+        .order_by(Word.id)
+        .limit(1)
+    )
+    row = db.execute(stmt).first()
+    return WordRecord.from_row(row) if row else None
+
+
+def upsert_review_states(db: Session, states: Iterable[ReviewState]) -> None:
+    """Write review schedules, one row per word, in a single executemany."""
+
+    rows = [
+        {"word_id": state.word_id, "due": state.due, "interval": state.interval,
+         "ease": state.ease, "repetitions": state.repetitions, "lapses": state.lapses}
+        for state in states
+    ]
+    if not rows:
+        return
+    stmt = sqlite_insert(ReviewSchedule.__table__)
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["word_id"],
+            set_={key: stmt.excluded[key] for key in rows[0] if key != "word_id"},
+        ),
+        rows,
+    )
+
+
+def append_reviews(db: Session, events: Sequence[ReviewEvent]) -> None:
+    """Append answered cards to the review log in one executemany INSERT."""
+
+    if events:
+        db.execute(insert(Review.__table__), [event._asdict() for event in events])
+
+
+def rebuild_stats_from_log(db: Session, reset_unlogged: bool = False) -> int:
+    """Recompute word counters and difficulty from the review log.
+
+    One grouped pass over ``ix_reviews_word_correct`` feeds a single
+    ``UPDATE ... FROM`` that sets every logged word's counters to its logged
+    totals. A word whose counters exceed those totals was answered before
+    the log existed; rebuilding it would lose those answers, so unless
+    ``reset_unlogged`` is set the rebuild is refused before anything is
+    written. The caller commits.
+
+    Parameters:
+        db: Active session.
+        reset_unlogged: Discard every answer the log does not account for:
+            counters above the logged totals are lowered to them, and words
+            with no logged answers are reset to unseen. When off, words with
+            no logged answers keep their counters.
+
+    Returns:
+        The number of words updated.
+
+    Raises:
+        ValueError: If ``reset_unlogged`` is off and some word has more
+            answers, or more correct answers, than the log records.
+    """
+
+    words = Word.__table__
+    totals = (
+        select(Review.word_id,
+               func.count().label("shown"),
+               func.sum(Review.correct).label("right"))
+        .group_by(Review.word_id)
+        .subquery()
+    )
+    if not reset_unlogged:
+        ahead = db.scalar(
+            select(func.count())
+            .select_from(words.join(totals, words.c.id == totals.c.word_id))
+            .where((words.c.display_count > totals.c.shown)
+                   | (words.c.correct_count > totals.c.right))
+        )
+        if ahead:
+            raise ValueError(
+                f"{ahead} words have answers from before the review log; "
+                "pass reset_unlogged=True to discard them")
+    revision = bump_data_version(db)
+    updated = db.execute(
+        update(words)
+        .where(words.c.id == totals.c.word_id)
+        .values(
+            display_count=totals.c.shown,
+            correct_count=totals.c.right,
+            difficulty=1.0 - totals.c.right / (totals.c.shown + 1e-6),
+            revision=revision,
+        )
+    ).rowcount or 0
+    if reset_unlogged:
+        updated += db.execute(
+            update(words)
+            .where(~exists().where(Review.word_id == words.c.id))
+            # Same starting point as a freshly imported word.
+            .values(display_count=0, correct_count=0, difficulty=0.5, revision=revision)
+        ).rowcount or 0
+    return updated
+
+
+def local_utc_offset() -> int:
+    """Return the local time zone's current offset from UTC in seconds."""
+
+    return time.localtime().tm_gmtoff
+
+
+def local_day(timestamp: float, utc_offset: int | None = None) -> int:
+    """Return the ``review_daily.day`` number of a Unix timestamp."""
+
+    offset = local_utc_offset() if utc_offset is None else utc_offset
+    return int(timestamp + offset) // DAY_SECONDS
+
+
+def _set_counter(db: Session, key: str, value: int) -> None:
+    """Store an ``app_meta`` value inside the current transaction."""
+
+    db.execute(
+        sqlite_insert(AppMeta.__table__)
+        .values(key=key, value=value)
+        .on_conflict_do_update(index_elements=["key"], set_={"value": value})
+    )
+
+
+def _accumulate(stmt, table, keys: Sequence[str]):
+    """Turn an INSERT ... SELECT into an upsert that adds to existing totals."""
+
+    return stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={
+            column.name: column + stmt.excluded[column.name]
+            for column in table.c if column.name not in keys
+        },
+    )
+
+
+def refresh_review_summaries(db: Session, utc_offset: int | None = None) -> int:
+    """Fold review-log rows not yet summarized into the summary tables.
+
+    Only rows above the ``summary_review_id`` watermark are read, through
+    the rowid, and each summary is advanced by one grouped INSERT ...
+    SELECT upsert, so the cost follows the new rows rather than the size
+    of the log. The caller commits; committing together with the rows'
+    own insert keeps the summaries exactly in step with the log.
+
+    Parameters:
+        db: Active session.
+        utc_offset: Seconds added to ``answered_at`` before cutting days;
+            defaults to the local time zone.
+
+    Returns:
+        The number of review rows folded in.
+    """
+
+    watermark = db.scalar(
+        select(AppMeta.value).where(AppMeta.key == SUMMARY_WATERMARK_KEY)) or 0
+    high = db.scalar(select(func.max(Review.id)))
+    if high is None or high <= watermark:
+        return 0
+    offset = local_utc_offset() if utc_offset is None else utc_offset
+    window = Review.id.between(watermark + 1, high)
+    day = ((Review.answered_at + offset) // DAY_SECONDS).label("day")
+    daily = ReviewDaily.__table__
+    stmt = sqlite_insert(daily).from_select(
+        ["day", "direction", "mode", "answers", "correct", "latency_ms"],
+        select(day, Review.direction, Review.mode, func.count(),
+               func.sum(Review.correct), func.sum(Review.latency_ms))
+        .where(window)
+        .group_by(day, Review.direction, Review.mode),
+    )
+    db.execute(_accumulate(stmt, daily, ("day", "direction", "mode")))
+    parts = ReviewPartTotal.__table__
+    stmt = sqlite_insert(parts).from_select(
+        ["part", "direction", "answers", "correct"],
+        select(Word.pos_norm, Review.direction, func.count(), func.sum(Review.correct))
+        .join(Word, Word.id == Review.word_id)
+        .where(window)
+        .group_by(Word.pos_norm, Review.direction),
+    )
+    db.execute(_accumulate(stmt, parts, ("part", "direction")))
+    folded = db.scalar(select(func.count()).select_from(Review).where(window)) or 0
+    _set_counter(db, SUMMARY_WATERMARK_KEY, high)
+    return folded
+
+
+def rebuild_review_summaries(db: Session, utc_offset: int | None = None) -> int:
+    """Recompute the summary tables from the whole review log; the caller commits."""
+
+    db.execute(ReviewDaily.__table__.delete())
+    db.execute(ReviewPartTotal.__table__.delete())
+    _set_counter(db, SUMMARY_WATERMARK_KEY, 0)
+    return refresh_review_summaries(db, utc_offset)
+
+
+def answer_totals_by_direction(db: Session) -> list[tuple[int, int, int]]:
+    """Return (direction code, answers, correct) per direction from the daily summary."""
+
+    result = db.execute(
+        select(ReviewDaily.direction, func.sum(ReviewDaily.answers), func.sum(ReviewDaily.correct))
+        .group_by(ReviewDaily.direction)
+        .order_by(ReviewDaily.direction)
+    )
+    return [tuple(row) for row in result.tuples()]
+
+
+def answer_totals_by_mode(db: Session) -> list[tuple[int, int, int, int]]:
+    """Return (mode code, answers, correct, summed latency in ms) per mode."""
+
+    result = db.execute(
+        select(ReviewDaily.mode, func.sum(ReviewDaily.answers), func.sum(ReviewDaily.correct),
+               func.sum(ReviewDaily.latency_ms))
+        .group_by(ReviewDaily.mode)
+        .order_by(ReviewDaily.mode)
+    )
+    return [tuple(row) for row in result.tuples()]
+
+
+def answer_totals_by_part(db: Session) -> list[tuple[str, int, int]]:
+    """Return (part of speech, answers, correct) over both directions, most answered first."""
+
+    answers = func.sum(ReviewPartTotal.answers)
+    result = db.execute(
+        select(ReviewPartTotal.part, answers, func.sum(ReviewPartTotal.correct))
+        .group_by(ReviewPartTotal.part)
+        .order_by(answers.desc(), ReviewPartTotal.part)
+    )
+    return [tuple(row) for row in result.tuples()]
+
+
+def learning_curve(db: Session, window_days: int, limit: int | None = None) -> list[tuple[int, ...]]:
+    """Return daily totals with rolling and running sums, oldest day first.
+
+    Window functions over the per-day totals do the smoothing in SQL.
+
+    Parameters:
+        db: Active session.
+        window_days: Calendar days in the rolling window, today included.
+        limit: Keep only this many most recent study days.
+
+    Returns:
+        (day, answers, correct, rolling answers, rolling correct, running
+        answers, running correct) per study day.
+    """
+
+    answers = func.sum(ReviewDaily.answers)
+    correct = func.sum(ReviewDaily.correct)
+    rolling = {"order_by": ReviewDaily.day, "range_": (-(max(window_days, 1) - 1), 0)}
+    running = {"order_by": ReviewDaily.day, "rows": (None, 0)}
+    curve = (
+        select(
+            ReviewDaily.day.label("day"),
+            answers.label("answers"),
+            correct.label("correct"),
+            func.sum(answers).over(**rolling).label("rolling_answers"),
+            func.sum(correct).over(**rolling).label("rolling_correct"),
+            func.sum(answers).over(**running).label("running_answers"),
+            func.sum(correct).over(**running).label("running_correct"),
+        )
+        .group_by(ReviewDaily.day)
+        .subquery()
+    )
+    stmt = select(curve).order_by(curve.c.day.desc())
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return [tuple(row) for row in reversed(db.execute(stmt).all())]
+
+
+def study_runs(db: Session) -> list[tuple[int, int]]:
+    """Return (first day, last day) of every run of consecutive study days, latest first.
+
+    Days minus their ``ROW_NUMBER`` are constant within a run, which groups
+    the runs in one pass over the daily summary.
+    """
+
+    days = select(ReviewDaily.day).distinct().subquery()
+    numbered = select(
+        days.c.day,
+        (days.c.day - func.row_number().over(order_by=days.c.day)).label("run"),
+    ).subquery()
+    result = db.execute(
+        select(func.min(numbered.c.day), func.max(numbered.c.day))
+        .group_by(numbered.c.run)
+        .order_by(func.max(numbered.c.day).desc())
+    )
+    return [tuple(row) for row in result.tuples()]
+
+
 def calculate_difficulty(display_count: int, correct_count: int) -> float:
     """Compute difficulty score based on counts."""
 
@@ -77,20 +815,7 @@ def choose_weighted_word(words: Sequence[Word], difficulty_level: int, direction
     if not words:
         return None
 
-    clamped = max(min(difficulty_level, max(DIFFICULTY_LEVELS)),
-                  min(DIFFICULTY_LEVELS))
-    weights: list[float] = []
-    for word in words:
-        base = word.difficulty or 0.5
-        if clamped <= 2:
-            weight = 1.0 - base
-        elif clamped == 3:
-            weight = 1.0
-        elif clamped == 4:
-            weight = 0.5 + base
-        else:
-            weight = 1.0 + base
-        weights.append(max(weight, 0.01))
-
+    clamped = clamp_level(difficulty_level)
+    weights = [selection_weight(word.difficulty, clamped) for word in words]
     chosen = random.choices(words, weights=weights, k=1)[0]
     return chosen
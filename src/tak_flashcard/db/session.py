@@ -2,20 +2,110 @@
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine
+import os
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
-from tak_flashcard.config import DB_PATH, ensure_data_dirs
+from tak_flashcard.config import DB_PATH, STORAGE_PROFILE, STORAGE_PROFILE_ENV, ensure_data_dirs
+from tak_flashcard.db import fts
+from tak_flashcard.db.migrations import run_migrations
 from tak_flashcard.db.models import Base
+from tak_flashcard.db.storage import StorageProfile, apply_profile, get_profile
+from tak_flashcard.utils.text import fold_text, normalize_text
+
+_lock = threading.Lock()
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+
+
+def _register_functions(dbapi_connection, _connection_record) -> None:
+    """Register the SQL functions the schema's triggers and migrations rely on."""
+
+    dbapi_connection.create_function(
+        "fold_text", 1, fold_text, deterministic=True)
+    dbapi_connection.create_function(
+        "normalize_text", 1, normalize_text, deterministic=True)
+
+
+def create_sqlite_engine(path: Path, profile: Optional[StorageProfile] = None) -> Engine:
+    """Create an engine for a SQLite file with the app's SQL functions.
+
+    Parameters:
+        path: Location of the database file.
+        profile: Storage profile applied to every connection; ``balanced``
+            when omitted.
+
+    Returns:
+        A SQLAlchemy engine whose connections can run the search triggers.
+    """
+
+    profile = profile or get_profile()
+    engine = create_engine(f"sqlite:///{path}", echo=False, future=True)
+    event.listen(engine, "connect", _register_functions)
+    event.listen(engine, "connect",
+                 lambda dbapi_connection, _record: apply_profile(dbapi_connection, profile))
+    return engine
+
+
+def get_engine() -> Engine:
+    """Return the application database engine, creating it on first use.
+
+    The data directory is created here rather than at import, so importing
+    this module touches neither the filesystem nor the database.
+    """
+
+    global _engine
+    with _lock:
+        if _engine is None:
+            ensure_data_dirs()
+            _engine = create_sqlite_engine(
+                DB_PATH, get_profile(os.environ.get(STORAGE_PROFILE_ENV) or STORAGE_PROFILE))
+        return _engine
+
+
+def make_session_factory(engine: Engine) -> sessionmaker:
+    """Return a session factory configured the way the app uses sessions."""
+
+    # Buffered answer statistics are mirrored onto loaded instances, so commits
+    # must not expire them and force a reload of the whole deck.
+    return sessionmaker(
+        bind=engine, autoflush=False, autocommit=False, expire_on_commit=False, future=True)
+
+
+def get_session_factory() -> sessionmaker:
+    """Return the session factory bound to the application engine."""
+
+    global _session_factory
+    engine = get_engine()
+    with _lock:
+        if _session_factory is None:
+            _session_factory = make_session_factory(engine)
+        return _session_factory
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``ENGINE`` and ``SessionLocal`` lazily for existing callers."""
 
-ensure_data_dirs()
+    if name == "ENGINE":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-ENGINE = create_engine(f"sqlite:///{DB_PATH}", echo=False, future=True)
-SessionLocal = sessionmaker(
-    bind=ENGINE, autoflush=False, autocommit=False, future=True)
 
+def init_db(engine: Optional[Engine] = None) -> None:
+    """Create or upgrade the schema and install the search index.
 
-def init_db() -> None:
-    """Create database tables if they do not exist."""
+    Parameters:
+        engine: Database to prepare; the application database when omitted.
+    """
 
-    Base.metadata.create_all(bind=ENGINE)
+    engine = engine if engine is not None else get_engine()
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    fts.install(engine)
@@ -0,0 +1,138 @@
+"""Write-behind buffering of answer statistics and the review log."""
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.config import STATS_FLUSH_EVERY, STATS_FLUSH_SECONDS
+from tak_flashcard.db import repo
+from tak_flashcard.db.records import ReviewEvent
+
+
+class StatsBuffer:
+    """Accumulate per-word answer deltas and flush them in batches.
+
+    Rows are written back by id with one executemany UPDATE, every
+    ``flush_every`` answers or ``flush_seconds`` seconds, whichever comes
+    first, so a crash loses at most one flush window. Until then the deltas
+    are visible only through ``pending_for``; readers that query the
+    database, such as the dictionary, must flush first. ``generation``
+    counts successful flushes, so a reader holding loaded rows can tell
+    whether they went stale since it last looked, whoever flushed.
+    Review-log events recorded with the answers are appended, and rolled up
+    into the summary tables, in the same transaction.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        flush_every: int = STATS_FLUSH_EVERY,
+        flush_seconds: float = STATS_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a buffer bound to a session.
+
+        Parameters:
+            db: Session the deltas are flushed through.
+            flush_every: Number of buffered answers that forces a flush.
+            flush_seconds: Maximum age of the oldest buffered answer.
+            clock: Monotonic time source, injectable for callers that batch.
+        """
+
+        self.db = db
+        self.flush_every = max(flush_every, 1)
+        self.flush_seconds = flush_seconds
+        self._clock = clock
+        self._pending: dict[int, list[int]] = {}
+        self._events: list[ReviewEvent] = []
+        self._answers = 0
+        self._oldest: float | None = None
+        self.generation = 0
+
+    def __len__(self) -> int:
+        """Return the number of answers waiting to be flushed."""
+
+        return self._answers
+
+    def pending_for(self, word_id: int) -> tuple[int, int]:
+        """Return the buffered (display, correct) deltas for a word."""
+
+        display, correct = self._pending.get(word_id, (0, 0))
+        return display, correct
+
+    def record(
+        self,
+        word_id: int,
+        is_correct: bool,
+        event: Optional[ReviewEvent] = None,
+    ) -> None:
+        """Buffer one answer and flush if the batch window has closed.
+
+        Parameters:
+            word_id: Id of the answered word.
+            is_correct: Whether the answer was correct.
+            event: Review-log entry for the answer, if it should be logged.
+        """
+
+        delta = self._pending.setdefault(word_id, [0, 0])
+        delta[0] += 1
+        if is_correct:
+            delta[1] += 1
+        if event is not None:
+            self._events.append(event)
+        self._answers += 1
+        if self._oldest is None:
+            self._oldest = self._clock()
+        if self.due():
+            self.flush()
+
+    def due(self) -> bool:
+        """Return whether the buffer should be flushed now."""
+
+        if not self._answers:
+            return False
+        if self._answers >= self.flush_every:
+            return True
+        return self._oldest is not None and self._clock() - self._oldest >= self.flush_seconds
+
+    def flush(self) -> int:
+        """Write all buffered deltas in one transaction.
+
+        On failure the transaction is rolled back and the buffer is kept, so
+        a later flush retries the same answers exactly once.
+
+        Returns:
+            The number of distinct words updated.
+        """
+
+        if not self._pending and not self._events:
+            return 0
+        rows = [
+            {"word_id": word_id, "display_delta": display, "correct_delta": correct}
+            for word_id, (display, correct) in self._pending.items()
+        ]
+        try:
+            repo.apply_stat_deltas(self.db, rows)
+            repo.append_reviews(self.db, self._events)
+            if self._events:
+                repo.refresh_review_summaries(self.db)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        self.generation += 1
+        self._pending.clear()
+        self._events.clear()
+        self._answers = 0
+        self._oldest = None
+        return len(rows)
+
+    def flush_if_due(self) -> int:
+        """Flush only when the count or time window has closed."""
+
+        if self.due():
+            return self.flush()
+        return 0
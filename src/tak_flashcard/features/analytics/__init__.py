@@ -0,0 +1 @@
+"""Learner analytics feature package."""
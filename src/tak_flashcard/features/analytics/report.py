@@ -0,0 +1,67 @@
+"""Value types returned by the analytics service."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import NamedTuple, Optional
+
+
+class Accuracy(NamedTuple):
+    """Answer totals for one group of reviews."""
+
+    label: str
+    answers: int
+    correct: int
+    latency_ms: int = 0
+
+    @property
+    def rate(self) -> float:
+        """Return the share of correct answers, or 0.0 with no answers."""
+
+        return self.correct / self.answers if self.answers else 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        """Return the mean answer time, or 0.0 when it was not summed."""
+
+        return self.latency_ms / self.answers if self.answers else 0.0
+
+
+class BucketCount(NamedTuple):
+    """Number of words whose difficulty falls in ``[low, high)``."""
+
+    low: float
+    high: float
+    words: int
+
+
+class CurvePoint(NamedTuple):
+    """One study day of the learning curve."""
+
+    day: date
+    answers: int
+    correct: int
+    rolling_rate: float
+    running_rate: float
+
+
+class Streaks(NamedTuple):
+    """Consecutive-study-day streaks."""
+
+    current: int
+    longest: int
+    last_day: Optional[date]
+
+
+@dataclass
+class LearnerReport:
+    """Everything the statistics screen shows."""
+
+    total: Accuracy
+    streaks: Streaks
+    by_direction: list[Accuracy] = field(default_factory=list)
+    by_mode: list[Accuracy] = field(default_factory=list)
+    by_part: list[Accuracy] = field(default_factory=list)
+    buckets: list[BucketCount] = field(default_factory=list)
+    curve: list[CurvePoint] = field(default_factory=list)
@@ -0,0 +1,147 @@
+"""Learner statistics read from the review-log summary tables."""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.config import ANALYTICS_CURVE_DAYS, ANALYTICS_WINDOW_DAYS
+from tak_flashcard.constants import DIRECTION_CODES, MODE_CODES
+from tak_flashcard.core.difficulty import DIFFICULTY_BUCKETS, bucket_bounds
+from tak_flashcard.db import repo
+from tak_flashcard.features.analytics.report import (
+    Accuracy,
+    BucketCount,
+    CurvePoint,
+    LearnerReport,
+    Streaks,
+)
+from tak_flashcard.utils.formatters import format_direction
+
+EPOCH = date(1970, 1, 1)
+_MODE_NAMES = {code: mode.name.title() for mode, code in MODE_CODES.items()}
+_DIRECTION_NAMES = {code: format_direction(direction.value)
+                    for direction, code in DIRECTION_CODES.items()}
+
+
+def day_date(day: int) -> date:
+    """Convert a ``review_daily.day`` number to a calendar date."""
+
+    return EPOCH + timedelta(days=day)
+
+
+def streaks_from_runs(runs: list[tuple[int, int]], today: int) -> Streaks:
+    """Summarize study runs, latest first, as current and longest streaks.
+
+    A streak is still current when its last day is today or yesterday.
+    """
+
+    if not runs:
+        return Streaks(0, 0, None)
+    first, last = runs[0]
+    current = last - first + 1 if last >= today - 1 else 0
+    longest = max(end - start + 1 for start, end in runs)
+    return Streaks(current, longest, day_date(last))
+
+
+class AnalyticsService:
+    """Build learner reports from the materialized review summaries.
+
+    Every aggregate except the difficulty histogram reads the summary
+    tables, whose size grows with study days rather than with answers; the
+    histogram is one scan of ``ix_words_bucket_id``.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        window_days: int = ANALYTICS_WINDOW_DAYS,
+        curve_days: int = ANALYTICS_CURVE_DAYS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Create the service.
+
+        Parameters:
+            db: Session to read from.
+            window_days: Calendar days averaged by the rolling accuracy.
+            curve_days: Most recent study days kept in the learning curve.
+            clock: Wall-clock time source used to decide today's date.
+        """
+
+        self.db = db
+        self.window_days = window_days
+        self.curve_days = curve_days
+        self._clock = clock
+
+    def refresh(self) -> int:
+        """Roll up review-log rows the summaries have not seen yet.
+
+        Answers are rolled up as they are flushed, so this only has work
+        after upgrading a database that already had a review log.
+
+        Returns:
+            The number of review rows folded in.
+        """
+
+        folded = repo.refresh_review_summaries(self.db)
+        if folded:
+            self.db.commit()
+        return folded
+
+    def report(self) -> LearnerReport:
+        """Return all statistics, refreshing the summaries first."""
+
+        self.refresh()
+        by_direction = [
+            Accuracy(_DIRECTION_NAMES.get(code, str(code)), answers, correct)
+            for code, answers, correct in repo.answer_totals_by_direction(self.db)
+        ]
+        by_mode = [
+            Accuracy(_MODE_NAMES.get(code, str(code)), answers, correct, latency)
+            for code, answers, correct, latency in repo.answer_totals_by_mode(self.db)
+        ]
+        by_part = [
+            Accuracy(part or "(none)", answers, correct)
+            for part, answers, correct in repo.answer_totals_by_part(self.db)
+        ]
+        total = Accuracy(
+            "All",
+            sum(row.answers for row in by_mode),
+            sum(row.correct for row in by_mode),
+            sum(row.latency_ms for row in by_mode),
+        )
+        today = repo.local_day(self._clock())
+        return LearnerReport(
+            total=total,
+            streaks=streaks_from_runs(repo.study_runs(self.db), today),
+            by_direction=by_direction,
+            by_mode=by_mode,
+            by_part=by_part,
+            buckets=self.difficulty_buckets(),
+            curve=self.learning_curve(),
+        )
+
+    def difficulty_buckets(self) -> list[BucketCount]:
+        """Return the number of words in every difficulty bucket, empty ones included."""
+
+        counts = [0] * DIFFICULTY_BUCKETS
+        for bucket, count, *_rest in repo.difficulty_histogram(self.db):
+            counts[bucket] = count
+        return [BucketCount(*bucket_bounds(bucket), count) for bucket, count in enumerate(counts)]
+
+    def learning_curve(self) -> list[CurvePoint]:
+        """Return daily accuracy with rolling and running averages, oldest first."""
+
+        return [
+            CurvePoint(
+                day_date(day), answers, correct,
+                rolling_correct / rolling_answers if rolling_answers else 0.0,
+                running_correct / running_answers if running_answers else 0.0,
+            )
+            for (day, answers, correct, rolling_answers, rolling_correct,
+                 running_answers, running_correct)
+            in repo.learning_curve(self.db, self.window_days, self.curve_days)
+        ]
@@ -0,0 +1,161 @@
+"""Background dictionary search with cancellation of stale queries."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from tak_flashcard.db import repo
+
+
+@dataclass
+class SearchResult:
+    """Outcome of one background search request."""
+
+    generation: int
+    query: str
+    ids: list[int] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+class SearchWorker:
+    """Run dictionary searches on a thread with its own database session.
+
+    Every ``submit`` bumps a generation counter. Older requests still queued
+    are skipped, a query already running for an older generation is
+    interrupted through SQLite, and results that arrive late are dropped by
+    ``poll``, so only the newest query ever reaches the UI. Results travel
+    back through a thread-safe queue that the Tk thread drains with
+    ``after`` callbacks.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], limit: Optional[int] = None):
+        """Start the worker thread.
+
+        Parameters:
+            session_factory: Creates the worker's private session.
+            limit: Optional cap on the number of ids returned per query.
+        """
+
+        self._session_factory = session_factory
+        self._limit = limit
+        self._requests: queue.Queue[Optional[tuple[int, str]]] = queue.Queue()
+        self._results: queue.Queue[SearchResult] = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._running_generation = 0
+        self._connection: Any = None
+        self._thread = threading.Thread(
+            target=self._run, name="dictionary-search", daemon=True)
+        self._thread.start()
+
+    @property
+    def generation(self) -> int:
+        """Return the generation of the most recent request."""
+
+        return self._generation
+
+    def submit(self, query: str) -> int:
+        """Queue a search and cancel any older one that is still running.
+
+        Parameters:
+            query: Search text.
+
+        Returns:
+            The generation number identifying this request.
+        """
+
+        generation = self.cancel()
+        self._requests.put((generation, query))
+        return generation
+
+    def cancel(self) -> int:
+        """Invalidate every earlier request and interrupt the running one.
+
+        Returns:
+            The new current generation.
+        """
+
+        with self._lock:
+            self._generation += 1
+            if self._connection is not None and self._running_generation < self._generation:
+                self._connection.interrupt()
+            return self._generation
+
+    def poll(self) -> Optional[SearchResult]:
+        """Return the newest current result without blocking, if any."""
+
+        latest: Optional[SearchResult] = None
+        while True:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if result.generation == self._generation:
+                latest = result
+        return latest
+
+    def close(self) -> None:
+        """Stop the worker thread after interrupting any running query."""
+
+        self.cancel()
+        self._requests.put(None)
+        self._thread.join(timeout=1.0)
+
+    def _next_request(self) -> Optional[tuple[int, str]]:
+        """Block for a request, then skip ahead to the newest queued one."""
+
+        request = self._requests.get()
+        while request is not None:
+            try:
+                newer = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            request = newer
+        return request
+
+    def _run(self) -> None:
+        """Worker loop: execute the newest request and publish its result."""
+
+        db = self._session_factory()
+        try:
+            while True:
+                request = self._next_request()
+                if request is None:
+                    return
+                generation, query = request
+                if generation != self._generation:
+                    continue
+                self._execute(db, generation, query)
+        finally:
+            db.close()
+
+    def _execute(self, db: Session, generation: int, query: str) -> None:
+        """Run one query, publishing its ids unless it was superseded."""
+
+        started = time.perf_counter()
+        with self._lock:
+            self._running_generation = generation
+            self._connection = db.connection().connection.dbapi_connection
+        try:
+            ids = repo.search_word_ids(db, query, self._limit)
+            error = None
+        except OperationalError as exc:
+            db.rollback()
+            if generation != self._generation:
+                return
+            ids, error = [], str(exc.orig)
+        finally:
+            with self._lock:
+                self._connection = None
+        db.rollback()
+        if generation == self._generation:
+            self._results.put(SearchResult(
+                generation, query, ids, time.perf_counter() - started, error))
@@ -2,35 +2,112 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Iterable, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 from tak_flashcard.db import repo
 from tak_flashcard.db.models import Word
+from tak_flashcard.features.dictionary.search_worker import SearchWorker
+from tak_flashcard.features.dictionary.sources import IdListWordSource, KeysetWordSource, WordSource
 
 
 class DictionaryService:
-    """Provide search, filter, and list capabilities for words."""
+    """Provide search, filter, and list capabilities for words.
 
-    def __init__(self, db: Session):
-        """Create service with the provided database session."""
+    Answer statistics are buffered by the flashcard service, so every read
+    first calls ``sync_stats`` to write them. Whenever the returned flush
+    generation differs from the one seen last, by this call or any earlier
+    flush, words already loaded in the session get their counters expired
+    so the next access reads the update.
+    """
+
+    STAT_ATTRIBUTES = ("display_count", "correct_count", "difficulty")
+
+    def __init__(self, db: Session, sync_stats: Optional[Callable[[], int]] = None):
+        """Create service with the provided database session.
+
+        Parameters:
+            db: Session used for dictionary reads.
+            sync_stats: Writes buffered answer statistics and returns the
+                writer's flush generation, or None when nothing is buffered
+                outside the database.
+        """
 
         self.db = db
+        self.sync_stats = sync_stats
+        self._generation: Optional[int] = None
+
+    def _sync_pending(self) -> None:
+        """Flush buffered answers and expire counters written since the last read."""
+
+        if self.sync_stats is None:
+            return
+        generation = self.sync_stats()
+        if generation == self._generation:
+            return
+        self._generation = generation
+        for instance in list(self.db.identity_map.values()):
+            if isinstance(instance, Word):
+                self.db.expire(instance, self.STAT_ATTRIBUTES)
 
     def all_words(self) -> Iterable[Word]:
         """Return all words sorted by English text."""
 
+        self._sync_pending()
         return repo.list_words(self.db)
 
     def search(self, query: str) -> Iterable[Word]:
-        """Search for words containing the query in English or Vietnamese."""
+        """Search English and Vietnamese text, ranked by relevance.
+
+        Each query token matches as a prefix and Vietnamese tone marks are
+        optional when the database has the FTS index.
+        """
 
         if not query:
             return self.all_words()
+        self._sync_pending()
         return repo.search_words(self.db, query)
 
+    def browse_source(self, order: str = "english") -> WordSource:
+        """Return a paged source over all words.
+
+        Parameters:
+            order: ``"english"`` for alphabetical or ``"difficulty"`` for
+                hardest first; both are read straight from an index.
+        """
+
+        self._sync_pending()
+        return KeysetWordSource(self.db, order=order)
+
+    def search_source(self, query: str, order: str = "english") -> WordSource:
+        """Return a paged source over search results, or all words if empty.
+
+        ``order`` applies only to the unfiltered listing; search results keep
+        their relevance order.
+        """
+
+        if not query:
+            return self.browse_source(order)
+        self._sync_pending()
+        return IdListWordSource(self.db, repo.search_word_ids(self.db, query))
+
+    def id_source(self, ids: list[int]) -> WordSource:
+        """Return a paged source over precomputed result ids."""
+
+        self._sync_pending()
+        return IdListWordSource(self.db, ids)
+
+    def create_search_worker(self) -> SearchWorker:
+        """Start a background search worker with its own session on the same database."""
+
+        self._sync_pending()
+        factory = sessionmaker(bind=self.db.get_bind(), autoflush=False,
+                               expire_on_commit=False, future=True)
+        return SearchWorker(factory)
+
     def filter_part(self, part: str) -> Iterable[Word]:
         """Filter words by part of speech."""
 
+        self._sync_pending()
         return repo.filter_by_part_of_speech(self.db, part)
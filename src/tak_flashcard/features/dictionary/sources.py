@@ -0,0 +1,158 @@
+"""Paged row sources backing the virtualized dictionary list."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Protocol, Sequence
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.db import repo
+from tak_flashcard.db.models import Word
+
+
+class WordSource(Protocol):
+    """Random-access, paged view over an ordered list of words."""
+
+    def count(self) -> int:
+        """Return the total number of rows."""
+
+    def fetch(self, offset: int, limit: int) -> list[Word]:
+        """Return up to ``limit`` rows starting at ``offset``."""
+
+    def invalidate(self) -> None:
+        """Drop cached rows so the next fetch reads fresh data."""
+
+
+class WordOrder(NamedTuple):
+    """Repository hooks for one keyset-paginated sort order."""
+
+    page: Callable[[Session, Any, int], list[Word]]
+    key_at: Callable[[Session, int], Any]
+    key_of: Callable[[Word], Any]
+
+
+WORD_ORDERS: dict[str, WordOrder] = {
+    "english": WordOrder(repo.list_words_page, repo.word_key_at,
+                         lambda word: (word.english, word.id)),
+    "difficulty": WordOrder(repo.list_words_hardest_page, repo.hardest_key_at,
+                            lambda word: (word.difficulty, word.display_count, word.id)),
+}
+
+
+class KeysetWordSource:
+    """All words in a fixed order, paged with keyset pagination.
+
+    Pages are fetched with ``WHERE (english, id) > last_key`` (or its
+    hardest-first equivalent) so consecutive scrolling never re-reads
+    skipped rows. The last key of each fetched page is remembered as the
+    anchor of the next; jumping to an unseen page resolves its anchor once
+    through the covering index of the order.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        page_size: int = 100,
+        cached_pages: int = 16,
+        order: str = "english",
+    ):
+        """Create a source over the session's words.
+
+        Parameters:
+            db: Session used for page queries.
+            page_size: Rows fetched per query.
+            cached_pages: Number of recently used pages kept in memory.
+            order: A key of ``WORD_ORDERS``.
+        """
+
+        if order not in WORD_ORDERS:
+            raise ValueError(f"Unknown word order: {order}")
+        self.db = db
+        self.order = WORD_ORDERS[order]
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+        self._count: int | None = None
+        self._pages: OrderedDict[int, list[Word]] = OrderedDict()
+        self._anchors: dict[int, Any] = {0: None}
+
+    def count(self) -> int:
+        """Return the total number of words, cached until invalidated."""
+
+        if self._count is None:
+            self._count = repo.get_word_count(self.db)
+        return self._count
+
+    def invalidate(self) -> None:
+        """Forget cached pages, anchors and the row count."""
+
+        self._count = None
+        self._pages.clear()
+        self._anchors = {0: None}
+
+    def _anchor(self, page: int) -> Any:
+        """Return the sort key preceding the first row of a page."""
+
+        if page in self._anchors:
+            return self._anchors[page]
+        anchor = self.order.key_at(self.db, page * self.page_size - 1)
+        self._anchors[page] = anchor
+        return anchor
+
+    def _page(self, page: int) -> list[Word]:
+        """Return one page, fetching it by keyset if it is not cached."""
+
+        rows = self._pages.get(page)
+        if rows is not None:
+            self._pages.move_to_end(page)
+            return rows
+        anchor = self._anchor(page)
+        if page and anchor is None:
+            return []
+        rows = self.order.page(self.db, anchor, self.page_size)
+        self._pages[page] = rows
+        if len(rows) == self.page_size:
+            self._anchors[page + 1] = self.order.key_of(rows[-1])
+        while len(self._pages) > self.cached_pages:
+            self._pages.popitem(last=False)
+        return rows
+
+    def fetch(self, offset: int, limit: int) -> list[Word]:
+        """Return up to ``limit`` words starting at ``offset``."""
+
+        if limit <= 0:
+            return []
+        first = offset // self.page_size
+        last = (offset + limit - 1) // self.page_size
+        rows: list[Word] = []
+        for page in range(first, last + 1):
+            rows.extend(self._page(page))
+        start = offset - first * self.page_size
+        return rows[start:start + limit]
+
+
+class IdListWordSource:
+    """Words given by an ordered list of ids, such as search results.
+
+    Only the ids are held in memory; rows are loaded per window by primary
+    key, so a large result set costs one integer per match.
+    """
+
+    def __init__(self, db: Session, ids: Sequence[int]):
+        """Create a source over the given ids in display order."""
+
+        self.db = db
+        self.ids = list(ids)
+
+    def count(self) -> int:
+        """Return the number of ids."""
+
+        return len(self.ids)
+
+    def invalidate(self) -> None:
+        """Nothing is cached beyond the ids themselves."""
+
+    def fetch(self, offset: int, limit: int) -> list[Word]:
+        """Load the words for one window of ids."""
+
+        return repo.get_words_by_ids(self.db, self.ids[offset:offset + limit])
@@ -34,6 +34,7 @@ class FlashcardController:
         question_limit: Optional[int],
         time_limit: Optional[int],
         wrong_penalty: int = PENALTY_POINTS,
+        part_of_speech: Optional[str] = None,
     ) -> FlashcardState:
         """Start a new session with given parameters."""
 
@@ -45,6 +46,7 @@ class FlashcardController:
             question_limit,
             time_limit,
             wrong_penalty,
+            part_of_speech,
         )
 
     def next_card(self):
@@ -62,6 +64,22 @@ class FlashcardController:
 
         return self.service.show_answer_penalty()
 
+    def end(self) -> None:
+        """End the active session and persist buffered statistics."""
+
+        self.service.end_session()
+
+    def flush(self, force: bool = False) -> int:
+        """Flush buffered statistics; only when due unless forced."""
+
+        return self.service.flush_stats(force)
+
+    def sync_stats(self) -> int:
+        """Flush all buffered statistics and return the flush generation."""
+
+        self.service.flush_stats(force=True)
+        return self.service.stats.generation
+
     def finished(self) -> bool:
         """Return whether the session has ended."""
 
@@ -0,0 +1,140 @@
+"""Process-wide cache of session decks keyed by the database data version."""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.core.difficulty import clamp_level
+from tak_flashcard.core.sampler import WordSampler
+from tak_flashcard.core.selectors import build_sampler
+from tak_flashcard.db import repo
+from tak_flashcard.db.records import WordRecord
+from tak_flashcard.features.flashcard.distractors import DistractorPools
+
+
+class Deck:
+    """Word records of one database with their samplers and distractor pools.
+
+    ``version`` is the data version the records reflect. Sessions apply their
+    own answers through ``apply`` as they happen, so the deck may run ahead
+    of ``version`` until the next ``refresh``.
+    """
+
+    def __init__(self, records: list[WordRecord], version: int):
+        """Index a freshly loaded list of records.
+
+        Parameters:
+            records: Every word in the database.
+            version: Data version the records were read at.
+        """
+
+        self.records = records
+        self.version = version
+        self.positions = {record.id: idx for idx, record in enumerate(records)}
+        self.distractors = DistractorPools(records)
+        self._samplers: dict[int, WordSampler[WordRecord]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of words in the deck."""
+
+        return len(self.records)
+
+    def get(self, word_id: int) -> Optional[WordRecord]:
+        """Return the current record for a word id, if present."""
+
+        position = self.positions.get(word_id)
+        return self.records[position] if position is not None else None
+
+    def resolve(self, record: WordRecord) -> WordRecord:
+        """Return the deck's copy of a word read from the database, if it has one."""
+
+        return self.get(record.id) or record
+
+    def sampler_for(self, difficulty: int) -> WordSampler[WordRecord]:
+        """Return the sampler for a difficulty level, building it once."""
+
+        level = clamp_level(difficulty)
+        sampler = self._samplers.get(level)
+        if sampler is None:
+            sampler = build_sampler(self.records, level)
+            self._samplers[level] = sampler
+        return sampler
+
+    def active_sampler(self, difficulty: int) -> Optional[WordSampler[WordRecord]]:
+        """Return the sampler for a level only if it has already been built."""
+
+        return self._samplers.get(clamp_level(difficulty))
+
+    def apply(self, record: WordRecord) -> None:
+        """Replace a word's record and re-weight it in every built sampler."""
+
+        position = self.positions.get(record.id)
+        if position is None:
+            self.add(record)
+            return
+        previous = self.records[position]
+        self.records[position] = record
+        for sampler in self._samplers.values():
+            sampler.update(record)
+        if (previous.english, previous.vietnamese, previous.part_of_speech) != (
+                record.english, record.vietnamese, record.part_of_speech):
+            self.distractors.update(record)
+
+    def add(self, record: WordRecord) -> None:
+        """Append a new word; samplers are rebuilt on next use."""
+
+        self.positions[record.id] = len(self.records)
+        self.records.append(record)
+        self.distractors.add(record)
+        self._samplers.clear()
+
+    def refresh(self, db: Session, version: int) -> bool:
+        """Apply the rows written since ``self.version``.
+
+        Parameters:
+            db: Session to read changes through.
+            version: Current data version of the database.
+
+        Returns:
+            False when rows were deleted and the deck must be reloaded.
+        """
+
+        for record in repo.list_word_records_since(db, self.version):
+            self.apply(record)
+        if len(self.records) != repo.get_word_count(db):
+            return False
+        self.version = version
+        return True
+
+
+_decks: dict[str, Deck] = {}
+_decks_lock = threading.Lock()
+
+
+def load_deck(db: Session) -> Deck:
+    """Return the cached deck for the session's database, bringing it up to date.
+
+    Costs one counter lookup when nothing changed since the last call and a
+    query over the ``revision`` index when something did. The whole table
+    is read only the first time and after deletions.
+    """
+
+    key = str(db.get_bind().url)
+    version = repo.get_data_version(db)
+    with _decks_lock:
+        deck = _decks.get(key)
+        if deck is not None and (deck.version == version or deck.refresh(db, version)):
+            return deck
+        deck = Deck(repo.list_word_records(db), version)
+        _decks[key] = deck
+        return deck
+
+
+def clear_deck_cache() -> None:
+    """Forget every cached deck."""
+
+    with _decks_lock:
+        _decks.clear()
@@ -0,0 +1,235 @@
+"""Per-direction distractor pools for multiple-choice questions."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Iterable, Optional
+
+from tak_flashcard.constants import Direction
+
+ANY_PART = ""
+
+
+def _answer_key(text: str) -> str:
+    """Normalize an answer text the same way answers are compared."""
+
+    return text.strip().lower()
+
+
+def _part_key(part_of_speech: Optional[str]) -> str:
+    """Normalize a part of speech into a bucket key."""
+
+    return (part_of_speech or "").strip().lower()
+
+
+class _TextBucket:
+    """Distinct answer texts with O(1) add, remove and random access."""
+
+    __slots__ = ("texts", "keys", "slots", "owners")
+
+    def __init__(self) -> None:
+        """Create an empty bucket."""
+
+        self.texts: list[str] = []
+        self.keys: list[str] = []
+        self.slots: dict[str, int] = {}
+        self.owners: dict[str, set[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of distinct texts in the bucket."""
+
+        return len(self.texts)
+
+    def add(self, key: str, text: str, word_id: Any) -> None:
+        """Register a word as an owner of a text."""
+
+        owners = self.owners.get(key)
+        if owners is None:
+            self.owners[key] = {word_id}
+            self.slots[key] = len(self.texts)
+            self.texts.append(text)
+            self.keys.append(key)
+        else:
+            owners.add(word_id)
+
+    def discard(self, key: str, word_id: Any) -> None:
+        """Drop a word from a text, removing the text once it has no owners."""
+
+        owners = self.owners.get(key)
+        if owners is None:
+            return
+        owners.discard(word_id)
+        if owners:
+            return
+        del self.owners[key]
+        slot = self.slots.pop(key)
+        last_text = self.texts.pop()
+        last_key = self.keys.pop()
+        if slot < len(self.texts):
+            self.texts[slot] = last_text
+            self.keys[slot] = last_key
+            self.slots[last_key] = slot
+
+
+class DistractorIndex:
+    """Answer texts for one direction, bucketed by part of speech.
+
+    Each bucket keeps the distinct answer texts in a list plus an inverse map
+    from normalized text to the ids of words that translate to it, so
+    sampling is a handful of random list lookups and adding or editing a
+    word only touches that word's entries.
+    """
+
+    def __init__(self, direction: Direction, words: Iterable[Any] = ()):
+        """Create the index for a direction and load the initial words.
+
+        Parameters:
+            direction: Direction whose answer language the pool holds.
+            words: Initial words to index.
+        """
+
+        if direction == Direction.MIXED:
+            raise ValueError("Distractor pools need a concrete direction")
+        self.direction = direction
+        self._field = "vietnamese" if direction == Direction.ENG_TO_VN else "english"
+        self._all = _TextBucket()
+        self._parts: dict[str, _TextBucket] = {}
+        self._entries: dict[Any, tuple[str, str]] = {}
+        for word in words:
+            self.add(word)
+
+    def answer_for(self, word: Any) -> str:
+        """Return the answer text a word has in this direction."""
+
+        return str(getattr(word, self._field))
+
+    def add(self, word: Any) -> None:
+        """Index a new word; re-indexes it if the id is already present."""
+
+        if word.id in self._entries:
+            self.remove(word.id)
+        text = self.answer_for(word)
+        key = _answer_key(text)
+        if not key:
+            return
+        part = _part_key(word.part_of_speech)
+        self._entries[word.id] = (key, part)
+        self._all.add(key, text, word.id)
+        bucket = self._parts.get(part)
+        if bucket is None:
+            bucket = self._parts[part] = _TextBucket()
+        bucket.add(key, text, word.id)
+
+    def remove(self, word_id: Any) -> None:
+        """Remove a word from the index."""
+
+        entry = self._entries.pop(word_id, None)
+        if entry is None:
+            return
+        key, part = entry
+        self._all.discard(key, word_id)
+        bucket = self._parts.get(part)
+        if bucket is not None:
+            bucket.discard(key, word_id)
+            if not bucket:
+                del self._parts[part]
+
+    def update(self, word: Any) -> None:
+        """Re-index a word whose text or part of speech was edited."""
+
+        self.add(word)
+
+    def words_with_answer(self, text: str) -> frozenset[Any]:
+        """Return the ids of words whose answer matches the text."""
+
+        return frozenset(self._all.owners.get(_answer_key(text), ()))
+
+    @staticmethod
+    def _draw(
+        bucket: _TextBucket,
+        count: int,
+        excluded: set[str],
+        picked: list[str],
+        rng: random.Random,
+    ) -> None:
+        """Append up to ``count`` distinct texts whose keys are not excluded."""
+
+        available = len(bucket) - sum(1 for key in excluded if key in bucket.slots)
+        if available <= 0 or count <= 0:
+            return
+        if available <= count:
+            for slot, key in enumerate(bucket.keys):
+                if key not in excluded:
+                    excluded.add(key)
+                    picked.append(bucket.texts[slot])
+            return
+        needed = count
+        size = len(bucket)
+        while needed:
+            slot = rng.randrange(size)
+            key = bucket.keys[slot]
+            if key in excluded:
+                continue
+            excluded.add(key)
+            picked.append(bucket.texts[slot])
+            needed -= 1
+
+    def sample(self, word: Any, count: int = 3, rng: random.Random | None = None) -> list[str]:
+        """Sample distinct distractors for a word.
+
+        Parameters:
+            word: The word being asked; its answer text and synonyms that
+                share it are never returned.
+            count: Number of distractors wanted.
+            rng: Optional random source; defaults to the module generator.
+
+        Returns:
+            Up to ``count`` distinct texts, preferring the word's own part of
+            speech and topping up from the whole pool when that runs short.
+        """
+
+        source = rng or random
+        excluded = {_answer_key(self.answer_for(word))}
+        picked: list[str] = []
+        bucket = self._parts.get(_part_key(word.part_of_speech))
+        if bucket is not None:
+            self._draw(bucket, count, excluded, picked, source)
+        if len(picked) < count:
+            self._draw(self._all, count - len(picked), excluded, picked, source)
+        return picked
+
+
+class DistractorPools:
+    """Distractor indexes for both concrete directions of a session deck."""
+
+    def __init__(self, words: Iterable[Any] = ()):
+        """Build both direction indexes from the same words."""
+
+        items = list(words)
+        self._indexes = {
+            direction: DistractorIndex(direction, items)
+            for direction in (Direction.ENG_TO_VN, Direction.VN_TO_ENG)
+        }
+
+    def for_direction(self, direction: Direction) -> DistractorIndex:
+        """Return the index used for a concrete direction."""
+
+        return self._indexes[direction]
+
+    def add(self, word: Any) -> None:
+        """Index a newly added word in both directions."""
+
+        for index in self._indexes.values():
+            index.add(word)
+
+    def update(self, word: Any) -> None:
+        """Re-index an edited word in both directions."""
+
+        for index in self._indexes.values():
+            index.update(word)
+
+    def remove(self, word_id: Any) -> None:
+        """Remove a word from both directions."""
+
+        for index in self._indexes.values():
+            index.remove(word_id)
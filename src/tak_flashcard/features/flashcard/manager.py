@@ -0,0 +1,578 @@
+"""Many concurrent flashcard sessions over one shared vocabulary snapshot.
+
+``FlashcardService`` owns one session, a prefetch thread and a database
+session. A ``SessionManager`` instead keeps thousands of lightweight
+sessions in one process: they draw cards from the same read-only
+``VocabularySnapshot`` and hand their answers to the caller in batches, which
+writes them through a single ``SessionWriter``. Nothing here blocks on
+the database, so the manager can be driven straight from an event loop.
+
+Each session sees its own answers through a copy-on-write ``SessionDeck``:
+only the words it has answered are copied, so a session costs a few
+kilobytes whatever the size of the deck. Other sessions' answers reach it
+once the manager moves to a newer snapshot.
+"""
+
+from __future__ import annotations
+
+import random
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional, Sequence
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.constants import Direction, Mode
+from tak_flashcard.core.difficulty import clamp_level, selection_weight
+from tak_flashcard.core.sampler import WordSampler
+from tak_flashcard.core.scoring import PENALTY_POINTS
+from tak_flashcard.core.selectors import build_sampler
+from tak_flashcard.db import repo
+from tak_flashcard.db.records import ReviewEvent, WordRecord
+from tak_flashcard.db.writer import StatsBuffer
+from tak_flashcard.features.flashcard.distractors import DistractorPools
+from tak_flashcard.features.flashcard.service import (
+    answer_text,
+    review_event,
+    score_answer,
+    use_show_answer,
+)
+from tak_flashcard.features.flashcard.states import (
+    AnswerResult,
+    FlashcardState,
+    ShowAnswerConfig,
+    ShowAnswerOutcome,
+)
+
+# Modes whose cards come from the deck alone; Weak and Review query the database per card.
+MANAGED_MODES = (Mode.ENDLESS, Mode.SPEED, Mode.TESTING)
+
+# One buffered answer: (word id, correct, review-log entry).
+Answer = tuple[int, bool, ReviewEvent]
+
+# Draws from the shared sampler before a session deck falls back to an exact scan.
+MAX_REJECTIONS = 32
+
+
+class VocabularySnapshot:
+    """Read-only deck shared by every session of a ``SessionManager``.
+
+    Records, distractor pools and per-level samplers are built once and never
+    re-weighted, so any number of sessions can draw from them concurrently.
+    Answers still reach the database; a new snapshot picks them up.
+    """
+
+    def __init__(self, records: Sequence[WordRecord], version: int = 0):
+        """Index a list of records.
+
+        Parameters:
+            records: Every word the sessions may be asked.
+            version: Data version the records were read at.
+        """
+
+        self.records: tuple[WordRecord, ...] = tuple(records)
+        self.version = version
+        self.positions = {record.id: idx for idx, record in enumerate(self.records)}
+        self.distractors = DistractorPools(self.records)
+        self._samplers: dict[int, WordSampler[WordRecord]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, db: Session) -> VocabularySnapshot:
+        """Read every word of a database into a new snapshot."""
+
+        return cls(repo.list_word_records(db), repo.get_data_version(db))
+
+    def __len__(self) -> int:
+        """Return the number of words in the snapshot."""
+
+        return len(self.records)
+
+    def updated(self, db: Session) -> VocabularySnapshot:
+        """Return a snapshot of the database's current words.
+
+        Returns ``self`` when nothing changed. Otherwise the rows written since
+        ``version`` are copied into a new snapshot, which is reloaded in full
+        only after deletions; sessions still holding this one are unaffected.
+        Samplers already built here are built for the new snapshot too, so
+        the caller's thread pays for them rather than the next session start.
+        """
+
+        version = repo.get_data_version(db)
+        if version == self.version:
+            return self
+        records = list(self.records)
+        for record in repo.list_word_records_since(db, self.version):
+            position = self.positions.get(record.id)
+            if position is None:
+                records.append(record)
+            else:
+                records[position] = record
+        if len(records) != repo.get_word_count(db):
+            snapshot = VocabularySnapshot.load(db)
+        else:
+            snapshot = VocabularySnapshot(records, version)
+        for level in list(self._samplers):
+            snapshot.sampler_for(level)
+        return snapshot
+
+    def get(self, word_id: int) -> Optional[WordRecord]:
+        """Return the record for a word id, if present."""
+
+        position = self.positions.get(word_id)
+        return self.records[position] if position is not None else None
+
+    def sampler_for(self, difficulty: int) -> WordSampler[WordRecord]:
+        """Return the shared sampler for a difficulty level, building it once."""
+
+        level = clamp_level(difficulty)
+        sampler = self._samplers.get(level)
+        if sampler is None:
+            with self._lock:
+                sampler = self._samplers.get(level)
+                if sampler is None:
+                    sampler = self._samplers[level] = build_sampler(self.records, level)
+        return sampler
+
+
+class SessionDeck:
+    """One session's copy-on-write view of a ``VocabularySnapshot``.
+
+    Answered words are copied into ``overrides`` with the session's answers
+    applied; everything else is read from the shared snapshot. Draws use the
+    shared sampler and correct for the overrides: words whose weight went up
+    get their extra weight from a small side table, and words whose weight
+    went down are rejected with the matching probability, so every word is
+    drawn in proportion to its weight for this session.
+    """
+
+    __slots__ = ("snapshot", "level", "overrides", "_extra", "_extra_total")
+
+    def __init__(self, snapshot: VocabularySnapshot, difficulty: int):
+        """Create a view with no overrides.
+
+        Parameters:
+            snapshot: Shared deck to read through.
+            difficulty: Session difficulty level from 1 to 5.
+        """
+
+        self.snapshot = snapshot
+        self.level = clamp_level(difficulty)
+        self.overrides: dict[int, WordRecord] = {}
+        self._extra: dict[int, float] = {}
+        self._extra_total = 0.0
+
+    def get(self, word_id: int) -> Optional[WordRecord]:
+        """Return the session's record for a word id, if present."""
+
+        return self.overrides.get(word_id) or self.snapshot.get(word_id)
+
+    def weight_of(self, word_id: int) -> float:
+        """Return a word's selection weight for this session, or 0.0 if unknown."""
+
+        record = self.get(word_id)
+        return selection_weight(record.difficulty, self.level) if record is not None else 0.0
+
+    def apply(self, record: WordRecord) -> None:
+        """Replace the session's copy of a word, e.g. after an answer."""
+
+        self.overrides[record.id] = record
+        shared = self.snapshot.sampler_for(self.level).weight_of(record.id)
+        extra = max(selection_weight(record.difficulty, self.level) - shared, 0.0)
+        self._extra_total += extra - self._extra.pop(record.id, 0.0)
+        if extra:
+            self._extra[record.id] = extra
+        elif not self._extra:
+            self._extra_total = 0.0
+
+    def _draw_extra(self, rng: random.Random) -> WordRecord:
+        """Draw an override in proportion to its extra weight."""
+
+        target = rng.random() * self._extra_total
+        for word_id, extra in self._extra.items():
+            target -= extra
+            if target < 0:
+                return self.overrides[word_id]
+        return self.overrides[word_id]
+
+    def _scan(self, rng: random.Random) -> Optional[WordRecord]:
+        """Draw by walking every word's session weight; used only after repeated rejections."""
+
+        weights = [self.weight_of(record.id) for record in self.snapshot.records]
+        if not weights:
+            return None
+        (record,) = rng.choices(self.snapshot.records, weights)
+        return self.get(record.id)
+
+    def sample(self, rng: random.Random) -> Optional[WordRecord]:
+        """Draw one word with probability proportional to its session weight."""
+
+        sampler = self.snapshot.sampler_for(self.level)
+        if not self.overrides:
+            return sampler.sample(rng)
+        for _ in range(MAX_REJECTIONS):
+            if self._extra_total and (
+                    rng.random() * (sampler.total_weight + self._extra_total) < self._extra_total):
+                return self._draw_extra(rng)
+            word = sampler.sample(rng)
+            if word is None:
+                return None
+            override = self.overrides.get(word.id)
+            if override is None:
+                return word
+            shared = sampler.weight_of(word.id)
+            if rng.random() * shared < selection_weight(override.difficulty, self.level):
+                return override
+        return self._scan(rng)
+
+
+@dataclass
+class ManagedSession:
+    """One learner's session inside a ``SessionManager``.
+
+    ``deck`` keeps the snapshot the session started on. ``rng`` is the
+    manager's shared generator unless the session was started with a seed.
+    ``deadline`` is the monotonic time a Speed session ends at; reveals
+    with a time penalty move it earlier. ``last_used`` is the monotonic time
+    of the session's latest request.
+    """
+
+    token: str
+    state: FlashcardState
+    deck: SessionDeck
+    rng: random.Random
+    deadline: Optional[float] = None
+    last_used: float = 0.0
+
+
+class SessionManager:
+    """Run many sessions in one process over a shared ``VocabularySnapshot``.
+
+    Not thread-safe: call it from one thread, such as an event loop.
+    Answers accumulate until ``take_answers`` hands them to the writer.
+    Sessions are kept least recently used first, so ``evict_idle`` only
+    visits the sessions it closes.
+    """
+
+    def __init__(
+        self,
+        snapshot: VocabularySnapshot,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+        idle_seconds: Optional[float] = None,
+    ):
+        """Create a manager with no sessions.
+
+        Parameters:
+            snapshot: Deck new sessions draw from.
+            clock: Monotonic time source for deadlines and idle times.
+            rng: Generator shared by sessions started without a seed.
+            idle_seconds: Time without requests after which ``evict_idle``
+                closes a session; None keeps sessions until ``finish``.
+        """
+
+        self.snapshot = snapshot
+        self.idle_seconds = idle_seconds
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._sessions: OrderedDict[str, ManagedSession] = OrderedDict()
+        self._answers: list[Answer] = []
+
+    def __len__(self) -> int:
+        """Return the number of open sessions."""
+
+        return len(self._sessions)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of answers not yet taken by the writer."""
+
+        return len(self._answers)
+
+    def refresh(self, db: Session) -> bool:
+        """Start new sessions on the database's current words.
+
+        Open sessions keep the snapshot they started on. The server reads
+        the update on its writer thread and passes it to ``use_snapshot``.
+
+        Returns:
+            Whether the snapshot changed.
+        """
+
+        return self.use_snapshot(self.snapshot.updated(db))
+
+    def use_snapshot(self, snapshot: VocabularySnapshot) -> bool:
+        """Start new sessions on ``snapshot``; returns whether it differs."""
+
+        changed = snapshot is not self.snapshot
+        self.snapshot = snapshot
+        return changed
+
+    def start(
+        self,
+        mode: Mode,
+        direction: Direction,
+        difficulty: int,
+        show_config: Optional[ShowAnswerConfig] = None,
+        question_limit: Optional[int] = None,
+        time_limit: Optional[int] = None,
+        wrong_penalty: int = PENALTY_POINTS,
+        session_id: int = 0,
+        seed: Optional[int] = None,
+    ) -> ManagedSession:
+        """Open a session and return it.
+
+        Parameters:
+            mode: One of ``MANAGED_MODES``.
+            direction: Translation direction.
+            difficulty: Difficulty level from 1 to 5.
+            show_config: Show-answer rules; the defaults when omitted.
+            question_limit: Cards in a Testing session.
+            time_limit: Seconds in a Speed session.
+            wrong_penalty: Points deducted for a wrong answer.
+            session_id: Review-log session number, from ``SessionWriter``.
+            seed: Seed for a reproducible session with its own generator.
+
+        Raises:
+            ValueError: If the mode needs per-card database queries.
+        """
+
+        if mode not in MANAGED_MODES:
+            raise ValueError(f"Mode {mode.value!r} is not available in shared sessions")
+        state = FlashcardState(
+            mode=mode,
+            direction=direction,
+            difficulty=clamp_level(difficulty),
+            question_limit=question_limit if mode == Mode.TESTING else None,
+            time_limit=time_limit if mode == Mode.SPEED else None,
+            show_config=show_config or ShowAnswerConfig(),
+            wrong_answer_penalty=wrong_penalty,
+            session_id=session_id,
+        )
+        rng = random.Random(seed) if seed is not None else self._rng
+        now = self._clock()
+        session = ManagedSession(secrets.token_hex(8), state,
+                                 SessionDeck(self.snapshot, state.difficulty), rng,
+                                 last_used=now)
+        if state.time_limit:
+            session.deadline = now + state.time_limit
+        self._sessions[session.token] = session
+        return session
+
+    def get(self, token: str) -> ManagedSession:
+        """Return an open session and mark it as just used.
+
+        Raises:
+            KeyError: If no open session has this token.
+        """
+
+        session = self._sessions[token]
+        session.last_used = self._clock()
+        self._sessions.move_to_end(token)
+        return session
+
+    def evict_idle(self) -> int:
+        """Close sessions idle for ``idle_seconds`` or longer.
+
+        Their answers are already buffered, so nothing is lost but the
+        session itself.
+
+        Returns:
+            The number of sessions closed.
+        """
+
+        if self.idle_seconds is None:
+            return 0
+        cutoff = self._clock() - self.idle_seconds
+        evicted = 0
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if session.last_used > cutoff:
+                break
+            self.finish(session.token)
+            evicted += 1
+        return evicted
+
+    def _check_deadline(self, session: ManagedSession) -> bool:
+        """Finish a Speed session whose time is up; return whether it is still running."""
+
+        if session.deadline is not None and self._clock() >= session.deadline:
+            session.state.finished = True
+        return not session.state.finished
+
+    def next_card(self, token: str) -> Optional[WordRecord]:
+        """Draw the next card of a session, or return None once it has ended."""
+
+        session = self.get(token)
+        state = session.state
+        if not self._check_deadline(session):
+            return None
+        if state.question_limit and state.asked >= state.question_limit:
+            state.finished = True
+            return None
+        word = session.deck.sample(session.rng)
+        if word is None:
+            state.finished = True
+            return None
+        direction = state.direction
+        if direction == Direction.MIXED:
+            direction = session.rng.choice((Direction.ENG_TO_VN, Direction.VN_TO_ENG))
+        pool = session.deck.snapshot.distractors.for_direction(direction)
+        choices = [pool.answer_for(word), *pool.sample(word, 3, session.rng)]
+        session.rng.shuffle(choices)
+        state.current_word = word
+        state.current_direction = direction
+        state.current_choices = choices
+        state.current_prompt = str(word.english if direction == Direction.ENG_TO_VN else word.vietnamese)
+        state.current_shown_at = time.monotonic()
+        state.asked += 1
+        return word
+
+    def submit(self, token: str, answer: str) -> Optional[AnswerResult]:
+        """Check an answer to a session's current card and buffer it for writing.
+
+        Returns:
+            The outcome, or None if there is no card to answer.
+        """
+
+        session = self.get(token)
+        state = session.state
+        if state.current_word is None or not self._check_deadline(session):
+            return None
+        direction = state.current_direction or state.direction
+        correct_answer = answer_text(state.current_word, direction)
+        is_correct = answer.strip().lower() == correct_answer.strip().lower()
+        self._answers.append((state.current_word.id, is_correct,
+                              review_event(state, direction, is_correct)))
+        session.deck.apply(state.current_word.answered(is_correct))
+        state.current_word = None
+        result = score_answer(state, is_correct, correct_answer)
+        if state.question_limit and state.asked >= state.question_limit:
+            state.finished = True
+        return result
+
+    def reveal(self, token: str) -> ShowAnswerOutcome:
+        """Charge a show-answer use to a session and shorten its deadline if penalized."""
+
+        session = self.get(token)
+        if session.state.current_word is None or not self._check_deadline(session):
+            return ShowAnswerOutcome(False, 0, None, 0)
+        outcome = use_show_answer(session.state)
+        if outcome.time_penalty and session.deadline is not None:
+            session.deadline -= outcome.time_penalty
+        return outcome
+
+    def finish(self, token: str) -> FlashcardState:
+        """Close a session and return its final state."""
+
+        session = self._sessions.pop(token)
+        session.state.finished = True
+        return session.state
+
+    def take_answers(self) -> list[Answer]:
+        """Return and clear the answers buffered since the last call."""
+
+        answers, self._answers = self._answers, []
+        return answers
+
+
+class SessionWriter:
+    """Single writer for the answers and session numbers of many sessions.
+
+    Owns its own database session; call it from one thread at a time, such
+    as the single worker of an executor. Session numbers are reserved in
+    blocks, so starting a session rarely needs a commit; numbers left in a
+    block when the process exits are never used.
+    """
+
+    def __init__(self, db: Session, session_id_block: int = 1):
+        """Create a writer over a database session used by nothing else.
+
+        Parameters:
+            db: Database session owned by the writer.
+            session_id_block: Session numbers reserved per commit.
+        """
+
+        self.db = db
+        # Batches are sized by the caller; never flush in the middle of one.
+        self.stats = StatsBuffer(db, flush_every=sys.maxsize, flush_seconds=float("inf"))
+        self.session_id_block = max(1, session_id_block)
+        self._session_ids: deque[int] = deque()
+
+    @property
+    def reserved_session_ids(self) -> int:
+        """Return how many reserved session numbers are left."""
+
+        return len(self._session_ids)
+
+    def reserved_session_id(self) -> Optional[int]:
+        """Hand out a reserved session number without touching the database.
+
+        Returns:
+            The number, or None once the reservation is used up.
+        """
+
+        try:
+            return self._session_ids.popleft()
+        except IndexError:
+            return None
+
+    def reserve_session_ids(self) -> None:
+        """Reserve and commit another block of session numbers."""
+
+        last = repo.increment_counter(self.db, repo.SESSION_SEQUENCE_KEY, self.session_id_block)
+        self.db.commit()
+        self._session_ids.extend(range(last - self.session_id_block + 1, last + 1))
+
+    def next_session_id(self) -> int:
+        """Return a review-log session number, reserving a new block if needed."""
+
+        session_id = self.reserved_session_id()
+        while session_id is None:
+            self.reserve_session_ids()
+            session_id = self.reserved_session_id()
+        return session_id
+
+    @property
+    def pending(self) -> int:
+        """Return the number of answers kept from a failed write."""
+
+        return len(self.stats)
+
+    def updated_snapshot(self, snapshot: VocabularySnapshot) -> VocabularySnapshot:
+        """Return ``snapshot`` updated to the database's current words.
+
+        Ends the read transaction afterwards; nothing is buffered between
+        writes, so there is nothing else to commit.
+        """
+
+        try:
+            return snapshot.updated(self.db)
+        finally:
+            self.db.commit()
+
+    def write(self, answers: Iterable[Answer]) -> int:
+        """Write a batch of answers in one transaction.
+
+        If the write fails it is rolled back and the answers stay buffered,
+        so the next call writes them together with its own batch.
+
+        Returns:
+            The number of distinct words updated.
+        """
+
+        for word_id, is_correct, event in answers:
+            self.stats.record(word_id, is_correct, event)
+        return self.stats.flush()
+
+    def close(self) -> None:
+        """Write anything still buffered and close the database session."""
+
+        try:
+            self.stats.flush()
+        finally:
+            self.db.close()
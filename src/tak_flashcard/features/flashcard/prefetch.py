@@ -0,0 +1,171 @@
+"""Background pipeline of ready-to-render flashcards."""
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from tak_flashcard.constants import Direction
+
+
+@dataclass
+class PreparedCard:
+    """A card whose word, direction, choices and prompt are already resolved."""
+
+    word: Any
+    direction: Direction
+    prompt: str
+    choices: list[str] = field(default_factory=list)
+
+
+class CardPrefetcher:
+    """Keep the next few cards precomputed on a worker thread.
+
+    The worker calls ``prepare`` while holding the shared ``lock``, which the
+    session also holds whenever it changes sampler weights, so cards are
+    always drawn from a consistent sampler. Queued cards were drawn from the
+    weights in force at the time; ``reweight`` filters them with rejection
+    sampling after a weight changes, so every card that survives is
+    distributed exactly as a fresh draw from the new weights would be.
+    Every card dropped unseen is passed to ``discard``, so a source that
+    tracks the words it handed out can take them back.
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[], Optional[PreparedCard]],
+        lock: threading.RLock,
+        depth: int,
+        rng: Optional[random.Random] = None,
+        discard: Optional[Callable[[PreparedCard], None]] = None,
+    ):
+        """Create an idle prefetcher.
+
+        Parameters:
+            prepare: Builds one card from the current session state.
+            lock: Lock guarding the sampler and distractor pools.
+            depth: Number of cards to keep ready.
+            rng: Random source for acceptance tests.
+            discard: Called, under the lock, with each queued card dropped
+                without being shown.
+        """
+
+        self._prepare = prepare
+        self._lock = lock
+        self._ready = threading.Condition(lock)
+        self.depth = max(depth, 0)
+        self._rng = rng or random.Random()
+        self._discard = discard
+        self._queue: deque[PreparedCard] = deque()
+        self._active = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        """Return the number of cards ready to be shown."""
+
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Discard queued cards and begin filling the pipeline."""
+
+        with self._ready:
+            self._drop_queue()
+            self._active = self.depth > 0
+            if self._active and self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="card-prefetch", daemon=True)
+                self._thread.start()
+            self._ready.notify_all()
+
+    def stop(self) -> None:
+        """Pause the worker and discard queued cards."""
+
+        with self._ready:
+            self._active = False
+            self._drop_queue()
+
+    def close(self) -> None:
+        """Stop the worker thread permanently."""
+
+        with self._ready:
+            self._active = False
+            self._closed = True
+            self._drop_queue()
+            self._ready.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def take(self) -> Optional[PreparedCard]:
+        """Return the next card, preparing one inline if the queue is empty."""
+
+        with self._ready:
+            card = self._queue.popleft() if self._queue else self._prepare()
+            self._ready.notify_all()
+            return card
+
+    def reweight(
+        self,
+        word_id: Any,
+        old_weight: float,
+        new_weight: float,
+        old_total: float,
+        new_total: float,
+    ) -> None:
+        """Drop queued cards so the rest follow the updated weights.
+
+        A card for word ``i`` drawn with probability ``p(i)`` is kept with
+        probability ``(p'(i) / p(i)) / M``, where ``M`` bounds that ratio.
+        Only the re-weighted word changes its ratio; every other word scales
+        by ``old_total / new_total``. The caller should hold the lock across
+        the sampler update and this call so no card is drawn in between.
+
+        Parameters:
+            word_id: Id of the word whose weight changed.
+            old_weight: Its weight when the queued cards were drawn.
+            new_weight: Its weight now.
+            old_total: Sampler total weight before the change.
+            new_total: Sampler total weight after the change.
+        """
+
+        if old_weight <= 0 or new_total <= 0:
+            return
+        scale = old_total / new_total
+        changed = scale * new_weight / old_weight
+        bound = max(scale, changed)
+        with self._ready:
+            kept: deque[PreparedCard] = deque()
+            for card in self._queue:
+                if self._rng.random() * bound < (changed if card.word.id == word_id else scale):
+                    kept.append(card)
+                elif self._discard is not None:
+                    self._discard(card)
+            if len(kept) != len(self._queue):
+                self._queue = kept
+                self._ready.notify_all()
+
+    def _drop_queue(self) -> None:
+        """Discard every queued card; the caller holds the lock."""
+
+        if self._discard is not None:
+            for card in self._queue:
+                self._discard(card)
+        self._queue.clear()
+
+    def _run(self) -> None:
+        """Worker loop: top the queue up to ``depth`` whenever it drains."""
+
+        with self._ready:
+            while not self._closed:
+                if not self._active or len(self._queue) >= self.depth:
+                    self._ready.wait()
+                    continue
+                card = self._prepare()
+                if card is None:
+                    self._active = False
+                    continue
+                self._queue.append(card)
@@ -0,0 +1,350 @@
+"""Out-of-core card selection for decks too large to hold in memory.
+
+A ``ProbeDeck`` keeps only a difficulty histogram and a bounded cache of
+recently drawn records. Cards are drawn by picking a difficulty bucket in
+proportion to its word count times the largest weight a word in it can
+have, then seeking to a random rowid inside that bucket through
+``ix_words_bucket_id`` and accepting the row with probability weight over
+that bound. Bucket choice and acceptance together make the draw follow the
+per-word weights of ``choose_weighted_word``, assuming a probe picks every
+row of its bucket equally often. It does not quite: a probe lands on the
+first row of the bucket at or after a random id, so rows that follow a
+long run of ids outside the bucket (other buckets' words as well as
+deleted ids) are favoured. That is the price of never scanning the table.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.constants import Direction
+from tak_flashcard.core.difficulty import (
+    DIFFICULTY_BUCKETS,
+    MIN_SELECTION_WEIGHT,
+    bucket_bounds,
+    clamp_level,
+    difficulty_bucket,
+    effective_difficulty,
+    selection_weight,
+)
+from tak_flashcard.db import repo
+from tak_flashcard.db.records import WordRecord
+from tak_flashcard.features.flashcard.distractors import _answer_key, _part_key
+
+
+class BucketHistogram:
+    """Word count, difficulty sum and id range per difficulty bucket."""
+
+    def __init__(self, rows: list[tuple[int, int, float, int, int]]):
+        """Load the output of ``repo.difficulty_histogram``."""
+
+        self.counts = [0] * DIFFICULTY_BUCKETS
+        self.sums = [0.0] * DIFFICULTY_BUCKETS
+        self.lows: list[Optional[int]] = [None] * DIFFICULTY_BUCKETS
+        self.highs: list[Optional[int]] = [None] * DIFFICULTY_BUCKETS
+        for bucket, count, total, low, high in rows:
+            self.counts[bucket] = count
+            self.sums[bucket] = total
+            self.lows[bucket] = low
+            self.highs[bucket] = high
+
+    def __len__(self) -> int:
+        """Return the number of words counted."""
+
+        return sum(self.counts)
+
+    def weight(self, bucket: int, level: int) -> float:
+        """Return the summed selection weight of a bucket's words.
+
+        ``selection_weight`` is linear in difficulty for every level, so the
+        weight of the bucket's mean difficulty times its count equals the
+        sum of its words' weights.
+        """
+
+        count = self.counts[bucket]
+        if not count:
+            return 0.0
+        return count * selection_weight(self.sums[bucket] / count, level)
+
+    def add(self, record: WordRecord) -> None:
+        """Count a word in the bucket of its difficulty."""
+
+        bucket = difficulty_bucket(record.difficulty)
+        self.counts[bucket] += 1
+        self.sums[bucket] += effective_difficulty(record.difficulty)
+        low, high = self.lows[bucket], self.highs[bucket]
+        self.lows[bucket] = record.id if low is None else min(low, record.id)
+        self.highs[bucket] = record.id if high is None else max(high, record.id)
+
+    def move(self, old: WordRecord, new: WordRecord) -> None:
+        """Move a word between buckets after its difficulty changed."""
+
+        bucket = difficulty_bucket(old.difficulty)
+        if self.counts[bucket]:
+            self.counts[bucket] -= 1
+            self.sums[bucket] = max(self.sums[bucket] - effective_difficulty(old.difficulty), 0.0)
+        self.add(new)
+
+
+class BucketSampler:
+    """``WordSampler`` that draws from a ``ProbeDeck`` without loading it."""
+
+    def __init__(self, deck: ProbeDeck, difficulty_level: int, max_probes: int = 16):
+        """Create a sampler for one difficulty level.
+
+        Parameters:
+            deck: Deck whose histogram and probes are used.
+            difficulty_level: Session difficulty level from 1 to 5.
+            max_probes: Probes tried before accepting a rejected candidate.
+        """
+
+        self.level = clamp_level(difficulty_level)
+        self.deck = deck
+        self.max_probes = max(max_probes, 1)
+        self._buckets = range(DIFFICULTY_BUCKETS)
+        # Largest per-word weight inside each bucket; weights are linear in
+        # difficulty, so it sits at one of the bucket's edges.
+        self._bounds = [
+            max(selection_weight(max(low, MIN_SELECTION_WEIGHT), self.level),
+                selection_weight(high, self.level))
+            for low, high in map(bucket_bounds, self._buckets)
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of words in the deck."""
+
+        return len(self.deck)
+
+    @property
+    def total_weight(self) -> float:
+        """Return the summed selection weight of every bucket."""
+
+        return sum(self.deck.histogram.weight(bucket, self.level) for bucket in self._buckets)
+
+    def weight_of(self, word_id: object) -> float:
+        """Return the weight of a cached word, or 0.0 if it is not cached."""
+
+        record = self.deck.get(word_id)
+        return selection_weight(record.difficulty, self.level) if record else 0.0
+
+    def update(self, word: WordRecord) -> None:
+        """Nothing to do: ``ProbeDeck.apply`` moves the word in the shared histogram."""
+
+    def sample(self, rng: random.Random | None = None) -> WordRecord | None:
+        """Draw one word: a bucket by its weight envelope, then an accepted rowid probe.
+
+        Bucket ``b`` is chosen with probability proportional to
+        ``count_b * bound_b`` and a probed word of weight ``w`` is accepted
+        with probability ``w / bound_b``, so each attempt returns a word with
+        probability proportional to ``w``. Choosing buckets by their exact
+        weight instead would apply the bucket's mean acceptance rate twice.
+        """
+
+        source = rng or random
+        counts = self.deck.histogram.counts
+        envelopes = [counts[bucket] * self._bounds[bucket] for bucket in self._buckets]
+        if sum(envelopes) <= 0:
+            return None
+        candidate: Optional[WordRecord] = None
+        for _ in range(self.max_probes):
+            bucket = source.choices(self._buckets, envelopes)[0]
+            record = self.deck.probe(bucket, source)
+            if record is None:
+                continue
+            candidate = record
+            weight = selection_weight(record.difficulty, self.level)
+            if source.random() * self._bounds[bucket] <= weight:
+                return record
+        return candidate
+
+    def sample_many(self, count: int, rng: random.Random | None = None) -> list[WordRecord]:
+        """Draw ``count`` words independently with replacement."""
+
+        drawn = (self.sample(rng) for _ in range(max(count, 0)))
+        return [record for record in drawn if record is not None]
+
+
+class ProbeDistractorIndex:
+    """Distractors for one direction, read from random rowid windows."""
+
+    def __init__(self, deck: ProbeDeck, direction: Direction, window: int = 8, max_probes: int = 4):
+        """Create the index for a concrete direction.
+
+        Parameters:
+            deck: Deck to read windows from.
+            direction: Direction whose answer language is sampled.
+            window: Consecutive rows read per probe.
+            max_probes: Windows read before settling for other parts of speech.
+        """
+
+        if direction == Direction.MIXED:
+            raise ValueError("Distractor pools need a concrete direction")
+        self.deck = deck
+        self.window = window
+        self.max_probes = max_probes
+        self._field = "vietnamese" if direction == Direction.ENG_TO_VN else "english"
+
+    def answer_for(self, word: WordRecord) -> str:
+        """Return the answer text a word has in this direction."""
+
+        return str(getattr(word, self._field))
+
+    def sample(self, word: WordRecord, count: int = 3, rng: random.Random | None = None) -> list[str]:
+        """Sample distinct distractors, preferring the word's part of speech.
+
+        Reads up to ``max_probes`` windows of ``window`` rows; stops early
+        once enough same-part texts were found.
+        """
+
+        source = rng or random
+        part = _part_key(word.part_of_speech)
+        excluded = {_answer_key(self.answer_for(word))}
+        same: list[str] = []
+        other: list[str] = []
+        for _ in range(self.max_probes):
+            for record in self.deck.window(source, self.window):
+                text = self.answer_for(record)
+                key = _answer_key(text)
+                if not key or key in excluded:
+                    continue
+                excluded.add(key)
+                (same if _part_key(record.part_of_speech) == part else other).append(text)
+            if len(same) >= count:
+                break
+        return (same + other)[:count]
+
+
+class ProbeDistractors:
+    """``DistractorPools`` counterpart for a ``ProbeDeck``."""
+
+    def __init__(self, deck: ProbeDeck):
+        """Create indexes for both concrete directions."""
+
+        self._indexes = {
+            direction: ProbeDistractorIndex(deck, direction)
+            for direction in (Direction.ENG_TO_VN, Direction.VN_TO_ENG)
+        }
+
+    def for_direction(self, direction: Direction) -> ProbeDistractorIndex:
+        """Return the index used for a concrete direction."""
+
+        return self._indexes[direction]
+
+
+class ProbeDeck:
+    """A deck that reads words on demand instead of loading the table.
+
+    Exposes the parts of ``Deck`` the flashcard service uses. Memory is the
+    histogram plus at most ``cache_size`` records, whatever the deck size.
+    Records read from the database are passed through ``pending`` so
+    answers still waiting in the stats buffer are reflected.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        pending: Callable[[WordRecord], WordRecord] = lambda record: record,
+        cache_size: int = 4096,
+    ):
+        """Read the histogram and id range of the session's database.
+
+        Parameters:
+            db: Session used for probes.
+            pending: Applies buffered answers to a freshly read record.
+            cache_size: Recently drawn records kept for re-weighting.
+        """
+
+        self.db = db
+        self.pending = pending
+        self.cache_size = max(cache_size, 1)
+        self.histogram = BucketHistogram(repo.difficulty_histogram(db))
+        self.id_range = repo.word_id_range(db)
+        self.distractors = ProbeDistractors(self)
+        self._cache: OrderedDict[int, WordRecord] = OrderedDict()
+        self._samplers: dict[int, BucketSampler] = {}
+
+    def __len__(self) -> int:
+        """Return the number of words in the database."""
+
+        return len(self.histogram)
+
+    @property
+    def records(self) -> list[WordRecord]:
+        """Return the cached records; never the whole deck."""
+
+        return list(self._cache.values())
+
+    def get(self, word_id: object) -> Optional[WordRecord]:
+        """Return the cached record for a word id, if present."""
+
+        return self._cache.get(word_id)
+
+    def sampler_for(self, difficulty: int) -> BucketSampler:
+        """Return the sampler for a difficulty level, creating it once."""
+
+        level = clamp_level(difficulty)
+        sampler = self._samplers.get(level)
+        if sampler is None:
+            sampler = self._samplers[level] = BucketSampler(self, level)
+        return sampler
+
+    def active_sampler(self, difficulty: int) -> Optional[BucketSampler]:
+        """Return the sampler for a level only if it has already been created."""
+
+        return self._samplers.get(clamp_level(difficulty))
+
+    def apply(self, record: WordRecord) -> None:
+        """Record a word's new statistics in the cache and histogram."""
+
+        previous = self._cache.get(record.id)
+        if previous is None:
+            self.histogram.add(record)
+        else:
+            self.histogram.move(previous, record)
+        self._remember(record)
+
+    def add(self, record: WordRecord) -> None:
+        """Count a newly inserted word."""
+
+        self.apply(record)
+
+    def _remember(self, record: WordRecord) -> WordRecord:
+        """Cache a record as most recently used, evicting the oldest."""
+
+        self._cache[record.id] = record
+        self._cache.move_to_end(record.id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return record
+
+    def resolve(self, record: WordRecord) -> WordRecord:
+        """Return the session's copy of a word read from the database, caching it."""
+
+        cached = self._cache.get(record.id)
+        return self._remember(cached if cached is not None else self.pending(record))
+
+    def probe(self, bucket: int, rng: random.Random) -> Optional[WordRecord]:
+        """Return a random word of a bucket, or None if the bucket is empty."""
+
+        low, high = self.histogram.lows[bucket], self.histogram.highs[bucket]
+        if low is None or high is None:
+            return None
+        record = (repo.word_record_in_bucket(self.db, bucket, rng.randint(low, high))
+                  or repo.word_record_in_bucket(self.db, bucket, low))
+        return self.resolve(record) if record is not None else None
+
+    def window(self, rng: random.Random, size: int) -> list[WordRecord]:
+        """Return up to ``size`` consecutive words starting at a random rowid."""
+
+        if self.id_range is None:
+            return []
+        start = rng.randint(*self.id_range)
+        records = repo.word_records_from(self.db, start, size)
+        if len(records) < size:
+            records += repo.word_records_from(self.db, self.id_range[0], size - len(records))
+        cached = self._cache.get
+        return [cached(record.id) or record for record in records]
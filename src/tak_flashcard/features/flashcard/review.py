@@ -0,0 +1,147 @@
+"""Due-first card order for spaced-repetition review sessions."""
+
+from __future__ import annotations
+
+import heapq
+import time
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from tak_flashcard.config import STATS_FLUSH_EVERY, STATS_FLUSH_SECONDS
+from tak_flashcard.core.srs import ReviewState, quality_for, review
+from tak_flashcard.db import repo
+from tak_flashcard.db.records import WordRecord
+
+
+class ReviewQueue:
+    """Hand out due words first, then up to ``new_limit`` unseen words.
+
+    Each pick is one seek on the ``review_schedule.due`` index (or, for new
+    words, on the words rowid after the last introduced id), and each answer
+    reschedules exactly one row. Rescheduled rows are buffered and written
+    in one executemany on the same count and time windows as the answer
+    statistics. Words handed out but not yet answered, and answered but not
+    yet written, are excluded from the next pick so prefetched cards never
+    repeat a word. A word handed out but dropped unseen is given back with
+    ``release``: a due word becomes eligible again, and a new word is handed
+    out again before the rowid cursor moves on.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        new_limit: int,
+        clock: Callable[[], float] = time.time,
+        flush_every: int = STATS_FLUSH_EVERY,
+        flush_seconds: float = STATS_FLUSH_SECONDS,
+    ):
+        """Create a queue for one session.
+
+        Parameters:
+            db: Session used for picks and writes.
+            new_limit: Maximum number of never-reviewed words to introduce.
+            clock: Wall-clock time source; schedules are Unix timestamps.
+            flush_every: Number of buffered reschedules that forces a write.
+            flush_seconds: Maximum age of the oldest buffered reschedule.
+        """
+
+        self.db = db
+        self.new_left = max(new_limit, 0)
+        self.flush_every = max(flush_every, 1)
+        self.flush_seconds = flush_seconds
+        self._clock = clock
+        self._handed_out: dict[int, tuple[WordRecord, Optional[ReviewState]]] = {}
+        self._released_new: list[tuple[int, WordRecord]] = []
+        self._pending: dict[int, ReviewState] = {}
+        self._oldest: float | None = None
+        self._cursor = repo.last_scheduled_word_id(db)
+
+    def __len__(self) -> int:
+        """Return the number of reschedules waiting to be written."""
+
+        return len(self._pending)
+
+    def next(self) -> Optional[WordRecord]:
+        """Return the next word to review, or None when nothing is left today."""
+
+        exclude = self._handed_out.keys() | self._pending.keys()
+        found = repo.next_due_review(self.db, int(self._clock()), exclude)
+        if found is not None:
+            record, state = found
+            self._handed_out[record.id] = (record, state)
+            return record
+        if not self.new_left:
+            return None
+        if self._released_new:
+            _word_id, record = heapq.heappop(self._released_new)
+        else:
+            record = repo.next_new_word(self.db, self._cursor)
+            if record is None:
+                return None
+            self._cursor = record.id
+        self.new_left -= 1
+        self._handed_out[record.id] = (record, None)
+        return record
+
+    def release(self, word_id: int) -> None:
+        """Take back a word that was handed out but will not be shown."""
+
+        entry = self._handed_out.pop(word_id, None)
+        if entry is None:
+            return
+        record, state = entry
+        if state is None:
+            heapq.heappush(self._released_new, (record.id, record))
+            self.new_left += 1
+
+    def answer(self, word_id: int, is_correct: bool) -> ReviewState:
+        """Reschedule a word after an answer.
+
+        Returns:
+            The word's new schedule, buffered until the next flush.
+        """
+
+        entry = self._handed_out.pop(word_id, None)
+        if word_id in self._pending:
+            current = self._pending[word_id]
+        else:
+            current = entry[1] if entry is not None else None
+        now = self._clock()
+        state = review(current, word_id, quality_for(is_correct), now)
+        self._pending[word_id] = state
+        if self._oldest is None:
+            self._oldest = now
+        return state
+
+    def due(self) -> bool:
+        """Return whether the buffered reschedules should be written now."""
+
+        if not self._pending:
+            return False
+        if len(self._pending) >= self.flush_every:
+            return True
+        return self._oldest is not None and self._clock() - self._oldest >= self.flush_seconds
+
+    def flush(self) -> int:
+        """Write and commit all buffered reschedules.
+
+        Returns:
+            The number of rows written.
+        """
+
+        if not self._pending:
+            return 0
+        states = list(self._pending.values())
+        repo.upsert_review_states(self.db, states)
+        self.db.commit()
+        self._pending.clear()
+        self._oldest = None
+        return len(states)
+
+    def flush_if_due(self) -> int:
+        """Flush only when the count or time window has closed."""
+
+        if self.due():
+            return self.flush()
+        return 0
@@ -0,0 +1,320 @@
+"""Headless driver that plays a flashcard session against an answer source.
+
+Nothing here imports a GUI toolkit: the runner talks to a
+``FlashcardController`` and asks a pluggable ``AnswerSource`` for every
+answer, so the same session logic serves the terminal, scripts and load
+tests.
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Protocol, TextIO
+
+from tak_flashcard.constants import Direction, Mode
+from tak_flashcard.core.scheduler import CountdownTimer
+from tak_flashcard.core.scoring import PENALTY_POINTS
+from tak_flashcard.features.flashcard.controller import FlashcardController
+from tak_flashcard.features.flashcard.states import AnswerResult, ShowAnswerConfig, ShowAnswerOutcome
+
+# Answer text that asks for the answer to be revealed instead of submitted.
+REVEAL = "?"
+# Console inputs that end the session.
+QUIT_INPUTS = {"q", "quit", "exit"}
+
+
+class Card(NamedTuple):
+    """One question as handed to an answer source."""
+
+    number: int
+    prompt: str
+    choices: list[str]
+    direction: Direction
+    answer: str
+
+
+class AnswerSource(Protocol):
+    """Supplies answers for the cards of a headless session."""
+
+    def answer(self, card: Card) -> Optional[str]:
+        """Return a choice's text, ``REVEAL``, or None to stop the session."""
+
+    def result(self, card: Card, result: AnswerResult) -> None:
+        """Receive the outcome of a submitted answer."""
+
+    def revealed(self, card: Card, outcome: ShowAnswerOutcome) -> None:
+        """Receive the outcome of a reveal request."""
+
+
+def resolve_answer(card: Card, text: str) -> str:
+    """Turn typed input into an answer: a 1-based choice number picks that choice.
+
+    Any other text, including ``REVEAL``, is returned stripped and unchanged.
+    """
+
+    text = text.strip()
+    if text.isdigit() and 1 <= int(text) <= len(card.choices):
+        return card.choices[int(text) - 1]
+    return text
+
+
+class ConsoleAnswers:
+    """Ask a person at a terminal, printing each card and its outcome."""
+
+    def __init__(self, stdin: TextIO = sys.stdin, stdout: TextIO = sys.stdout):
+        """Create the source.
+
+        Parameters:
+            stdin: Stream answers are read from, one line per answer.
+            stdout: Stream cards and feedback are written to.
+        """
+
+        self.stdin = stdin
+        self.stdout = stdout
+
+    def _print(self, text: str = "") -> None:
+        """Write one line to the output stream."""
+
+        print(text, file=self.stdout, flush=True)
+
+    def answer(self, card: Card) -> Optional[str]:
+        """Show the card and read a choice number, answer text, ``?`` or ``q``."""
+
+        self._print()
+        self._print(f"[{card.number}] {card.prompt}")
+        for index, choice in enumerate(card.choices, start=1):
+            self._print(f"  {index}. {choice}")
+        self.stdout.write(f"answer (1-{len(card.choices)}, {REVEAL} to show, q to quit)> ")
+        self.stdout.flush()
+        line = self.stdin.readline()
+        if not line or line.strip().lower() in QUIT_INPUTS:
+            return None
+        return resolve_answer(card, line)
+
+    def result(self, card: Card, result: AnswerResult) -> None:
+        """Print whether the answer was correct and the new score."""
+
+        if result.is_correct:
+            self._print(f"Correct! ({result.delta:+d}) Score: {result.new_score}")
+        else:
+            self._print(f"Incorrect. Correct answer: {result.correct_answer} "
+                        f"({result.delta:+d}) Score: {result.new_score}")
+
+    def revealed(self, card: Card, outcome: ShowAnswerOutcome) -> None:
+        """Print the revealed answer, or why it was not shown."""
+
+        if not outcome.allowed:
+            self._print("Show answer unavailable")
+            return
+        details = [f"{outcome.score_delta} pts"] if outcome.score_delta else []
+        if outcome.time_penalty:
+            details.append(f"-{outcome.time_penalty}s")
+        info = f" ({', '.join(details)})" if details else ""
+        self._print(f"Answer: {card.answer}{info}")
+
+
+class ScriptedAnswers:
+    """Answer from a fixed sequence of inputs, stopping when it runs out."""
+
+    def __init__(self, inputs: Iterable[str]):
+        """Create the source.
+
+        Parameters:
+            inputs: One input per card: a choice number, answer text or
+                ``REVEAL``. A reveal consumes an input and the same card is
+                answered by the next one.
+        """
+
+        self._inputs: Iterator[str] = iter(inputs)
+
+    def answer(self, card: Card) -> Optional[str]:
+        """Return the next scripted input, or None once exhausted."""
+
+        text = next(self._inputs, None)
+        return resolve_answer(card, text) if text is not None else None
+
+    def result(self, card: Card, result: AnswerResult) -> None:
+        """Ignore results."""
+
+    def revealed(self, card: Card, outcome: ShowAnswerOutcome) -> None:
+        """Ignore reveals."""
+
+
+class SimulatedLearner:
+    """Answer correctly with a fixed probability, otherwise pick a wrong choice."""
+
+    def __init__(self, accuracy: float = 0.7, rng: Optional[random.Random] = None,
+                 think_seconds: float = 0.0):
+        """Create the learner.
+
+        Parameters:
+            accuracy: Probability of choosing the correct answer.
+            rng: Random source; a fresh unseeded one when omitted.
+            think_seconds: Delay before each answer, to model answer latency.
+        """
+
+        self.accuracy = accuracy
+        self.rng = rng or random.Random()
+        self.think_seconds = think_seconds
+
+    def answer(self, card: Card) -> Optional[str]:
+        """Return the correct answer or a random distractor."""
+
+        if self.think_seconds > 0:
+            time.sleep(self.think_seconds)
+        wrong = [choice for choice in card.choices if choice != card.answer]
+        if not wrong or self.rng.random() < self.accuracy:
+            return card.answer
+        return self.rng.choice(wrong)
+
+    def result(self, card: Card, result: AnswerResult) -> None:
+        """Ignore results."""
+
+    def revealed(self, card: Card, outcome: ShowAnswerOutcome) -> None:
+        """Ignore reveals."""
+
+
+@dataclass
+class SessionSummary:
+    """Outcome of a headless session."""
+
+    mode: Mode
+    answered: int
+    correct: int
+    score: int
+    revealed: int
+    seconds: float
+    timed_out: bool = False
+
+    @property
+    def accuracy(self) -> float:
+        """Return the share of answered cards that were correct."""
+
+        return self.correct / self.answered if self.answered else 0.0
+
+
+class SessionRunner:
+    """Play one session from start to finish without a user interface.
+
+    Speed mode runs on the same ``CountdownTimer`` as the GUI; the runner
+    ticks it between cards instead of from an event loop.
+    """
+
+    def __init__(self, controller: FlashcardController, source: AnswerSource,
+                 clock: Callable[[], float] = time.perf_counter):
+        """Create a runner.
+
+        Parameters:
+            controller: Controller whose session is played.
+            source: Supplies the answers.
+            clock: Time source for the summary's duration.
+        """
+
+        self.controller = controller
+        self.source = source
+        self._clock = clock
+        self._answered = 0
+
+    def run(
+        self,
+        mode: Mode,
+        direction: Direction,
+        difficulty: int,
+        question_count: Optional[int] = None,
+        time_limit: Optional[int] = None,
+        max_cards: Optional[int] = None,
+        show_config: Optional[ShowAnswerConfig] = None,
+        wrong_penalty: int = PENALTY_POINTS,
+        part_of_speech: Optional[str] = None,
+    ) -> SessionSummary:
+        """Start a session, answer cards until it ends, and summarize it.
+
+        Parameters:
+            mode: Study mode.
+            direction: Translation direction.
+            difficulty: Difficulty level from 1 to 5.
+            question_count: Cards in a Testing session.
+            time_limit: Seconds in a Speed session.
+            max_cards: Stop after this many cards in any mode.
+            show_config: Show-answer rules; the defaults when omitted.
+            wrong_penalty: Points deducted for a wrong answer.
+            part_of_speech: Part of speech to drill in Weak mode.
+
+        Returns:
+            The session summary; the session has ended and its statistics
+            are flushed.
+        """
+
+        started = self._clock()
+        self._answered = 0
+        timed_out = False
+        timer: Optional[CountdownTimer] = None
+        state = self.controller.start(
+            mode, direction, difficulty, show_config or ShowAnswerConfig(),
+            question_count if mode == Mode.TESTING else None,
+            time_limit if mode == Mode.SPEED else None,
+            wrong_penalty,
+            part_of_speech,
+        )
+        if mode == Mode.SPEED and time_limit:
+            timer = CountdownTimer(time_limit, lambda _remaining: None, lambda: None)
+            timer.start()
+        try:
+            while not self.controller.finished():
+                if max_cards is not None and state.asked >= max_cards:
+                    break
+                if timer is not None:
+                    timer.tick()
+                    if timer.remaining <= 0:
+                        timed_out = True
+                        break
+                if self.controller.next_card() is None:
+                    break
+                if not self._play_card(timer):
+                    break
+        finally:
+            if timer is not None:
+                timer.stop()
+            self.controller.end()
+        return SessionSummary(
+            mode=mode,
+            answered=self._answered,
+            correct=state.correct,
+            score=state.score,
+            revealed=state.show_used,
+            seconds=self._clock() - started,
+            timed_out=timed_out,
+        )
+
+    def _play_card(self, timer: Optional[CountdownTimer]) -> bool:
+        """Ask the source about the current card until it answers or quits.
+
+        Returns:
+            False when the source stopped the session.
+        """
+
+        state = self.controller.service.state
+        direction = state.current_direction or state.direction
+        word = state.current_word
+        card = Card(
+            number=state.asked,
+            prompt=state.current_prompt,
+            choices=list(state.current_choices),
+            direction=direction,
+            answer=word.vietnamese if direction == Direction.ENG_TO_VN else word.english,
+        )
+        while True:
+            answer = self.source.answer(card)
+            if answer is None:
+                return False
+            if answer != REVEAL:
+                self.source.result(card, self.controller.submit(answer))
+                self._answered += 1
+                return True
+            outcome = self.controller.reveal()
+            if timer is not None and outcome.time_penalty:
+                timer.deduct(outcome.time_penalty)
+            self.source.revealed(card, outcome)
@@ -3,38 +3,197 @@
 from __future__ import annotations
 
 import random
+import threading
+import time
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
-from tak_flashcard.constants import Direction, Mode
+from tak_flashcard.config import (
+    OUT_OF_CORE_MIN_WORDS,
+    PREFETCH_DEPTH,
+    SRS_NEW_PER_SESSION,
+    WEAK_SET_RESERVE,
+    WEAK_SET_SIZE,
+)
+from tak_flashcard.constants import DIRECTION_CODES, MODE_CODES, Direction, Mode
+from tak_flashcard.core.difficulty import difficulty_score
 from tak_flashcard.core.scoring import PENALTY_POINTS, apply_scoring
+from tak_flashcard.core.sampler import WordSampler
 from tak_flashcard.core.selectors import select_next_word
 from tak_flashcard.db import repo
-from tak_flashcard.db.models import Word
+from tak_flashcard.db.records import ReviewEvent, WordRecord
+from tak_flashcard.db.writer import StatsBuffer
+from tak_flashcard.features.flashcard.deck import Deck, load_deck
+from tak_flashcard.features.flashcard.distractors import DistractorPools
+from tak_flashcard.features.flashcard.prefetch import CardPrefetcher, PreparedCard
+from tak_flashcard.features.flashcard.probe import ProbeDeck, ProbeDistractors
+from tak_flashcard.features.flashcard.review import ReviewQueue
 from tak_flashcard.features.flashcard.states import (
     AnswerResult,
     FlashcardState,
     ShowAnswerConfig,
     ShowAnswerOutcome,
 )
+from tak_flashcard.features.flashcard.weak import WeakWordSet
+
+
+def answer_text(word: WordRecord, direction: Direction) -> str:
+    """Return the text that answers a word's card in a concrete direction."""
+
+    return str(word.vietnamese if direction == Direction.ENG_TO_VN else word.english)
+
+
+def score_answer(state: FlashcardState, is_correct: bool, correct_answer: str) -> AnswerResult:
+    """Apply an answer's points to the session state and describe the outcome."""
+
+    scoring = apply_scoring(state.score, is_correct, penalty_points=state.wrong_answer_penalty)
+    state.score = scoring.total
+    if is_correct:
+        state.correct += 1
+    return AnswerResult(
+        is_correct=is_correct,
+        correct_answer=correct_answer,
+        new_score=state.score,
+        delta=scoring.delta,
+    )
+
+
+def use_show_answer(state: FlashcardState) -> ShowAnswerOutcome:
+    """Charge one show-answer use to the session if its settings allow it."""
+
+    config = state.show_config
+    if not config.enabled:
+        return ShowAnswerOutcome(False, 0, None, 0)
+    if config.max_uses is not None and state.show_used >= config.max_uses:
+        return ShowAnswerOutcome(False, 0, 0, 0)
+    penalty = config.score_penalty
+    state.score -= penalty
+    state.show_used += 1
+    remaining_uses = None
+    if config.max_uses is not None:
+        remaining_uses = max(config.max_uses - state.show_used, 0)
+    return ShowAnswerOutcome(
+        allowed=True,
+        score_delta=-penalty,
+        remaining_uses=remaining_uses,
+        time_penalty=max(config.time_penalty, 0),
+    )
+
+
+def review_event(state: FlashcardState, direction: Direction, is_correct: bool) -> ReviewEvent:
+    """Describe the answer to a session's current card for the review log."""
+
+    shown_at = state.current_shown_at
+    latency = time.monotonic() - shown_at if shown_at is not None else 0.0
+    return ReviewEvent(
+        word_id=state.current_word.id,
+        session_id=state.session_id,
+        answered_at=int(time.time()),
+        latency_ms=int(latency * 1000),
+        direction=DIRECTION_CODES[direction],
+        mode=MODE_CODES[state.mode],
+        correct=int(is_correct),
+    )
 
 
 class FlashcardService:
-    """Manage flashcard session lifecycle and logic."""
+    """Manage flashcard session lifecycle and logic.
 
-    def __init__(self, db: Session):
-        """Create service bound to a database session."""
+    Upcoming cards are prepared ahead of time by a ``CardPrefetcher``. Its
+    worker shares ``_lock`` with the session, which is held whenever the
+    deck, samplers or session state change. Weak-words sessions draw from a
+    ``WeakWordSet`` instead of the whole deck, and review sessions follow
+    the spaced-repetition schedule of a ``ReviewQueue``. Databases with at least
+    ``OUT_OF_CORE_MIN_WORDS`` words are read through a ``ProbeDeck`` instead
+    of being loaded.
+    """
+
+    def __init__(self, db: Session, out_of_core: Optional[bool] = None):
+        """Create service bound to a database session.
+
+        Parameters:
+            db: Session the service reads and writes through.
+            out_of_core: Force (True) or forbid (False) probe-based selection;
+                None decides by deck size each time the words are loaded.
+        """
 
         self.db = db
-        self.words: list[Word] = []
+        self.out_of_core = out_of_core
+        self.deck: Deck | ProbeDeck = Deck([], 0)
         self.state: Optional[FlashcardState] = None
+        self.stats = StatsBuffer(db)
+        self.weak: Optional[WeakWordSet] = None
+        self.reviews: Optional[ReviewQueue] = None
+        self._lock = threading.RLock()
+        self.prefetch = CardPrefetcher(
+            self._prepare_card, self._lock, PREFETCH_DEPTH, discard=self._release_card)
+
+    @property
+    def words(self) -> list[WordRecord]:
+        """Return the records of the loaded deck."""
+
+        return self.deck.records
+
+    @property
+    def distractors(self) -> DistractorPools | ProbeDistractors:
+        """Return the distractor pools of the loaded deck."""
+
+        return self.deck.distractors
 
     def load_words(self) -> None:
-        """Load all words into memory."""
+        """Attach the session deck.
+
+        Small databases use the cached in-memory deck, reloading only rows
+        changed since last time; large ones get a fresh ``ProbeDeck``.
+        """
+
+        out_of_core = self.out_of_core
+        if out_of_core is None:
+            out_of_core = repo.get_word_count(self.db) >= OUT_OF_CORE_MIN_WORDS
+        if out_of_core:
+            self.stats.flush()
+            self.deck = ProbeDeck(self.db, self._with_pending)
+        else:
+            self.deck = load_deck(self.db)
+
+    def _with_pending(self, record: WordRecord) -> WordRecord:
+        """Apply answers still in the stats buffer to a record read from the database."""
+
+        display, correct = self.stats.pending_for(record.id)
+        if not display:
+            return record
+        display_count = record.display_count + display
+        correct_count = record.correct_count + correct
+        return record._replace(display_count=display_count, correct_count=correct_count,
+                               difficulty=difficulty_score(display_count, correct_count))
+
+    def sampler_for(self, difficulty: int) -> WordSampler[WordRecord]:
+        """Return the session sampler for a difficulty level, building it once."""
+
+        return self.deck.sampler_for(difficulty)
+
+    def _session_sampler(self) -> Optional[WordSampler[WordRecord]]:
+        """Return the sampler cards are currently drawn from."""
+
+        if self.weak is not None:
+            return self.weak.sampler
+        return self.sampler_for(self.state.difficulty) if self.state else None
+
+    def _active_sampler(self) -> Optional[WordSampler[WordRecord]]:
+        """Return the session sampler only if it has already been built."""
+
+        if self.weak is not None:
+            return self.weak.sampler
+        return self.deck.active_sampler(self.state.difficulty) if self.state else None
+
+    def _load_weak_set(self) -> None:
+        """Read the hardest words, after flushing answers not yet written."""
 
-        self.words = repo.list_words(self.db)
+        self.stats.flush()
+        self.weak.load(lambda limit, part: repo.hardest_word_records(self.db, limit, part),
+                       self.deck.get)
 
     def start_session(
         self,
@@ -45,47 +204,103 @@ class FlashcardService:
         question_limit: Optional[int] = None,
         time_limit: Optional[int] = None,
         wrong_penalty: int = PENALTY_POINTS,
+        part_of_speech: Optional[str] = None,
     ) -> FlashcardState:
-        """Initialize a new session and return its state."""
-
-        self.load_words()
-        self.state = FlashcardState(
-            mode=mode,
-            direction=direction,
-            difficulty=difficulty,
-            question_limit=question_limit,
-            time_limit=time_limit,
-            show_config=show_config,
-            current_word=None,
-            score=0,
-            asked=0,
-            correct=0,
-            started_at=datetime.utcnow(),
-            finished=False,
-            wrong_answer_penalty=wrong_penalty,
-        )
+        """Initialize a new session and return its state.
+
+        ``part_of_speech`` restricts a ``Mode.WEAK`` session to one part of
+        speech; other modes draw from the whole deck.
+        """
+
+        self.prefetch.stop()
+        self.flush_stats(force=True)
+        with self._lock:
+            session_id = repo.increment_counter(self.db, repo.SESSION_SEQUENCE_KEY)
+            self.db.commit()
+            self.load_words()
+            self.weak = None
+            self.reviews = None
+            if mode == Mode.REVIEW:
+                self.reviews = ReviewQueue(self.db, SRS_NEW_PER_SESSION)
+            elif mode == Mode.WEAK:
+                self.weak = WeakWordSet(WEAK_SET_SIZE, WEAK_SET_RESERVE,
+                                        difficulty, part_of_speech or None)
+                self._load_weak_set()
+            self.state = FlashcardState(
+                mode=mode,
+                direction=direction,
+                difficulty=difficulty,
+                question_limit=question_limit,
+                time_limit=time_limit,
+                show_config=show_config,
+                current_word=None,
+                score=0,
+                asked=0,
+                correct=0,
+                started_at=datetime.utcnow(),
+                finished=False,
+                wrong_answer_penalty=wrong_penalty,
+                session_id=session_id,
+            )
+        self.prefetch.start()
         return self.state
 
-    def _pick_word(self) -> Optional[Word]:
-        """Select the next word respecting direction and difficulty."""
+    def _prepare_card(self) -> Optional[PreparedCard]:
+        """Resolve the next card's word, direction, choices and prompt.
 
-        if not self.words:
-            return None
-        if self.state is None:
+        Runs on the prefetch worker as well as inline, always under ``_lock``.
+        """
+
+        if not len(self.deck) or self.state is None:
             return None
+        if self.weak is not None and self.weak.needs_reload():
+            # Deferred from the answer path so the query runs on the worker.
+            self._load_weak_set()
         if self.state.direction == Direction.MIXED:
             direction = random.choice(
                 [Direction.ENG_TO_VN, Direction.VN_TO_ENG])
         else:
             direction = self.state.direction
-        word = select_next_word(self.words, self.state.difficulty, direction)
-        if word:
-            self.state.current_word = word
-            self.state.current_direction = direction
-            self.state.current_choices = self._build_choices(word, direction)
-        return word
+        if self.reviews is not None:
+            word = self.reviews.next()
+            word = self.deck.resolve(word) if word is not None else None
+        else:
+            word = select_next_word(
+                self.words,
+                self.state.difficulty,
+                direction,
+                sampler=self._session_sampler(),
+            )
+        if word is None:
+            return None
+        prompt = word.english if direction == Direction.ENG_TO_VN else word.vietnamese
+        return PreparedCard(word, direction, str(prompt),
+                            self._build_choices(word, direction))
+
+    def _release_card(self, card: PreparedCard) -> None:
+        """Give a dropped card's word back to the review queue it came from."""
+
+        if self.reviews is not None:
+            self.reviews.release(card.word.id)
+
+    def _pick_word(self) -> Optional[WordRecord]:
+        """Take the next prepared card and make it the current one."""
+
+        if self.state is None:
+            return None
+        card = self.prefetch.take()
+        if card is None:
+            return None
+        with self._lock:
+            # The card may predate an answer to the same word; use the live record.
+            self.state.current_word = self.deck.get(card.word.id) or card.word
+        self.state.current_direction = card.direction
+        self.state.current_choices = card.choices
+        self.state.current_prompt = card.prompt
+        self.state.current_shown_at = time.monotonic()
+        return self.state.current_word
 
-    def _build_choices(self, word: Word, direction: Direction) -> list[str]:
+    def _build_choices(self, word: WordRecord, direction: Direction) -> list[str]:
         """Build shuffled multiple-choice options for the current question.
 
         Parameters:
@@ -94,40 +309,22 @@ class FlashcardService:
 
         Returns:
             A shuffled list containing the correct answer and up to three
-            distinct distractors from other words in the dataset.
+            distinct distractors drawn from the session distractor pool.
         """
 
-        if direction == Direction.ENG_TO_VN:
-            correct_answer = str(word.vietnamese)
-            candidate_pool = {
-                str(item.vietnamese)
-                for item in self.words
-                if str(item.vietnamese).strip()
-            }
-        else:
-            correct_answer = str(word.english)
-            candidate_pool = {
-                str(item.english)
-                for item in self.words
-                if str(item.english).strip()
-            }
-
-        candidate_pool.discard(correct_answer)
-        candidate_list = list(candidate_pool)
-        distractor_count = min(3, len(candidate_list))
-        distractors = random.sample(candidate_list, distractor_count)
-
-        choices = [correct_answer, *distractors]
+        pool = self.distractors.for_direction(direction)
+        correct_answer = pool.answer_for(word)
+        choices = [correct_answer, *pool.sample(word, 3)]
         random.shuffle(choices)
         return choices
 
-    def next_card(self) -> Optional[Word]:
+    def next_card(self) -> Optional[WordRecord]:
         """Advance to the next card and update asked counter."""
 
         if self.state is None:
             return None
         if self.state.question_limit and self.state.asked >= self.state.question_limit:
-            self.state.finished = True
+            self.end_session()
             return None
         word = self._pick_word()
         if word:
@@ -140,50 +337,81 @@ class FlashcardService:
         if self.state is None or self.state.current_word is None:
             return None
         active_direction = self.state.current_direction or self.state.direction
-        correct_answer = self.state.current_word.vietnamese if active_direction == Direction.ENG_TO_VN else self.state.current_word.english
+        correct_answer = answer_text(self.state.current_word, active_direction)
         is_correct = answer.strip().lower() == correct_answer.strip().lower()
-        repo.update_word_stats(self.db, self.state.current_word.id, is_correct)
-        scoring = apply_scoring(
-            self.state.score,
-            is_correct,
-            penalty_points=self.state.wrong_answer_penalty,
-        )
-        self.state.score = scoring.total
-        if is_correct:
-            self.state.correct += 1
+        with self._lock:
+            self.stats.record(self.state.current_word.id, is_correct,
+                              review_event(self.state, active_direction, is_correct))
+            if self.reviews is not None:
+                self.reviews.answer(self.state.current_word.id, is_correct)
+                self.reviews.flush_if_due()
+            self._apply_answer(self.state.current_word, is_correct)
+        result = score_answer(self.state, is_correct, correct_answer)
         if self.state.question_limit and self.state.asked >= self.state.question_limit:
-            self.state.finished = True
-        self.db.commit()
-        return AnswerResult(
-            is_correct=is_correct,
-            correct_answer=correct_answer,
-            new_score=self.state.score,
-            delta=scoring.delta,
-        )
+            self.end_session()
+        return result
+
+    def _apply_answer(self, word: WordRecord, is_correct: bool) -> None:
+        """Replace a word's record with its post-answer statistics."""
+
+        current = self.deck.get(word.id)
+        if current is None:
+            return
+        updated = current.answered(is_correct)
+        active = self._active_sampler()
+        old_weight = active.weight_of(word.id) if active else 0.0
+        old_total = active.total_weight if active else 0.0
+        self.deck.apply(updated)
+        if self.state is not None:
+            self.state.current_word = updated
+        if self.reviews is not None:
+            # Review cards follow the schedule, not the sampler weights.
+            return
+        if self.weak is not None:
+            if self.weak.update(updated) or self.weak.needs_reload():
+                # Queued cards may hold a word that left the set, or will once
+                # the prefetch worker reloads it in _prepare_card.
+                self.prefetch.start()
+                return
+        if active is not None:
+            self.prefetch.reweight(word.id, old_weight, active.weight_of(word.id),
+                                   old_total, active.total_weight)
 
     def show_answer_penalty(self) -> ShowAnswerOutcome:
         """Apply a penalty for revealing an answer and report the outcome."""
 
         if self.state is None:
             return ShowAnswerOutcome(False, 0, None, 0)
-        config = self.state.show_config
-        if not config.enabled:
-            return ShowAnswerOutcome(False, 0, None, 0)
-        if config.max_uses is not None and self.state.show_used >= config.max_uses:
-            return ShowAnswerOutcome(False, 0, 0, 0)
-        penalty = config.score_penalty
-        self.state.score -= penalty
-        self.state.show_used += 1
-        remaining_uses = None
-        if config.max_uses is not None:
-            remaining_uses = max(config.max_uses - self.state.show_used, 0)
-        time_penalty = max(config.time_penalty, 0)
-        return ShowAnswerOutcome(
-            allowed=True,
-            score_delta=-penalty,
-            remaining_uses=remaining_uses,
-            time_penalty=time_penalty,
-        )
+        return use_show_answer(self.state)
+
+    def end_session(self) -> None:
+        """Mark the active session finished and flush buffered statistics."""
+
+        self.prefetch.stop()
+        if self.state is not None:
+            self.state.finished = True
+        self.flush_stats(force=True)
+
+    def flush_stats(self, force: bool = False) -> int:
+        """Flush buffered answer statistics and review schedules.
+
+        Parameters:
+            force: Flush even if the count and time windows are still open.
+
+        Returns:
+            The number of words whose statistics were written.
+        """
+
+        # The prefetch worker may be reading through the same session.
+        with self._lock:
+            if self.reviews is not None:
+                if force:
+                    self.reviews.flush()
+                else:
+                    self.reviews.flush_if_due()
+            if force:
+                return self.stats.flush()
+            return self.stats.flush_if_due()
 
     def is_finished(self) -> bool:
         """Return whether the session has reached an end condition."""
@@ -8,7 +8,7 @@ from typing import Optional
 
 from tak_flashcard.constants import Direction, Mode
 from tak_flashcard.core.scoring import PENALTY_POINTS
-from tak_flashcard.db.models import Word
+from tak_flashcard.db.records import WordRecord
 
 
 @dataclass
@@ -31,9 +31,10 @@ class FlashcardState:
     question_limit: Optional[int]
     time_limit: Optional[int]
     show_config: ShowAnswerConfig = field(default_factory=ShowAnswerConfig)
-    current_word: Optional[Word] = None
+    current_word: Optional[WordRecord] = None
     current_direction: Optional[Direction] = None
     current_choices: list[str] = field(default_factory=list)
+    current_prompt: str = ""
     score: int = 0
     asked: int = 0
     correct: int = 0
@@ -41,6 +42,8 @@ class FlashcardState:
     finished: bool = False
     show_used: int = 0
     wrong_answer_penalty: int = PENALTY_POINTS
+    session_id: int = 0
+    current_shown_at: Optional[float] = None
 
 
 @dataclass
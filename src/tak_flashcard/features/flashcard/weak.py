@@ -0,0 +1,126 @@
+"""Working set of the hardest words for the weak-words drill."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Optional
+
+from tak_flashcard.core.sampler import WordSampler
+from tak_flashcard.core.selectors import build_sampler
+from tak_flashcard.db.records import WordRecord
+
+HardnessKey = tuple[float, int, int]
+
+
+def hardness_key(record: WordRecord) -> HardnessKey:
+    """Return a key that sorts words hardest first, like the difficulty index."""
+
+    return (-record.difficulty, record.display_count, record.id)
+
+
+class WeakWordSet:
+    """The top-K hardest words, kept current as answers come in.
+
+    ``load`` reads ``size + reserve`` words hardest first through the
+    difficulty index. The first ``size`` form the working set that cards
+    are drawn from; the rest wait in a heap. When an answer makes a working
+    word easier than the hardest waiting word, the two swap places, so the
+    set stays the exact top-K without re-querying. Only words loaded from
+    the database are known to be in order, so once the hardest waiting word
+    would sort after the last loaded row the set asks to be reloaded.
+    """
+
+    def __init__(self, size: int, reserve: int, level: int, part: Optional[str] = None):
+        """Create an empty set.
+
+        Parameters:
+            size: Number of words drawn from.
+            reserve: Number of replacement words loaded behind them.
+            level: Session difficulty level used to weight the draws.
+            part: Optional part of speech to drill.
+        """
+
+        self.size = max(size, 1)
+        self.reserve = max(reserve, 0)
+        self.level = level
+        self.part = part
+        self.sampler: Optional[WordSampler[WordRecord]] = None
+        self._members: dict[int, WordRecord] = {}
+        self._waiting: list[tuple[HardnessKey, WordRecord]] = []
+        self._floor: Optional[HardnessKey] = None
+        self._exhausted = False
+        self._stale = False
+
+    def __len__(self) -> int:
+        """Return the number of words in the working set."""
+
+        return len(self._members)
+
+    def __contains__(self, word_id: object) -> bool:
+        """Return whether a word is in the working set."""
+
+        return word_id in self._members
+
+    def load(
+        self,
+        fetch: Callable[[int, Optional[str]], list[WordRecord]],
+        live: Callable[[int], Optional[WordRecord]],
+    ) -> None:
+        """Refill the set from the database.
+
+        Parameters:
+            fetch: Returns the N hardest records, e.g. ``repo.hardest_word_records``
+                bound to a session; buffered answers must be flushed first.
+            live: Returns the session's current record for an id, which may
+                be newer than the row just read.
+        """
+
+        limit = self.size + self.reserve
+        records = [live(record.id) or record for record in fetch(limit, self.part)]
+        self._exhausted = len(records) < limit
+        self._floor = hardness_key(records[-1]) if records else None
+        self._members = {record.id: record for record in records[:self.size]}
+        self._waiting = [(hardness_key(record), record) for record in records[self.size:]]
+        heapq.heapify(self._waiting)
+        self._stale = False
+        self._rebuild()
+
+    def needs_reload(self) -> bool:
+        """Return whether the set may have fallen out of top-K order."""
+
+        return self._stale
+
+    def _trusted(self, key: HardnessKey) -> bool:
+        """Return whether no unloaded word can sort before ``key``."""
+
+        return self._exhausted or (self._floor is not None and key <= self._floor)
+
+    def update(self, record: WordRecord) -> bool:
+        """Apply an answered word's new statistics.
+
+        Returns:
+            True if the set's membership changed, in which case ``sampler``
+            is a new object and previously drawn cards are stale.
+        """
+
+        if record.id not in self._members:
+            return False
+        key = hardness_key(record)
+        self._members[record.id] = record
+        if self._waiting and key > self._waiting[0][0] and self._trusted(self._waiting[0][0]):
+            _key, promoted = heapq.heapreplace(self._waiting, (key, record))
+            del self._members[record.id]
+            self._members[promoted.id] = promoted
+            self._rebuild()
+            return True
+        if not self._trusted(key):
+            # Easier than every loaded word: an unloaded word may now be harder.
+            self._stale = True
+        if self.sampler is not None:
+            self.sampler.update(record)
+        return False
+
+    def _rebuild(self) -> None:
+        """Build the sampler over the current members."""
+
+        self.sampler = build_sampler(list(self._members.values()), self.level)
@@ -11,6 +11,7 @@ Welcome to Tak Flashcard!
 - Every question is multiple choice with 4 options.
 - Eng→Vn uses 1 correct Vietnamese answer plus 3 random Vietnamese distractors.
 - Vn→Eng uses 1 correct English answer plus 3 random English distractors.
+- Distractors prefer words with the same part of speech as the answer.
 - Mixed mode applies the matching rule for whichever direction is selected on that turn.
 - Use Show Answer sparingly; it applies a penalty.
 - Track your score and accuracy in results.
@@ -2,73 +2,270 @@
 
 from __future__ import annotations
 
+import os
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk
+from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from tak_flashcard.config import APP_NAME, WINDOW_HEIGHT, WINDOW_WIDTH, ensure_data_dirs
+from tak_flashcard.config import (
+    APP_NAME,
+    BOOTSTRAP_POLL_MS,
+    MAINTENANCE_INTERVAL_SECONDS,
+    STARTUP_REPORT_ENV,
+    WINDOW_HEIGHT,
+    WINDOW_WIDTH,
+    ensure_data_dirs,
+)
 from tak_flashcard.constants import Direction, Mode
 from tak_flashcard.core.settings import Settings, SettingsManager
-from tak_flashcard.data.seed.importer import ensure_seed_data
-from tak_flashcard.db.session import SessionLocal, init_db
-from tak_flashcard.features.dictionary.service import DictionaryService
-from tak_flashcard.features.flashcard.controller import FlashcardController
-from tak_flashcard.features.flashcard.states import ShowAnswerConfig
 from tak_flashcard.gui.styles import apply_appearance_settings
-from tak_flashcard.gui.views.dictionary_view import DictionaryView
-from tak_flashcard.gui.views.flashcard_view import FlashcardSessionView, FlashcardView
-from tak_flashcard.gui.views.guide_view import GuideView
 from tak_flashcard.gui.views.home_view import HomeView
-from tak_flashcard.gui.views.settings_view import SettingsView
+from tak_flashcard.utils.fonts import FontLoader
+from tak_flashcard.utils.timing import StartupTimer
+
+if TYPE_CHECKING:
+    from tak_flashcard.features.flashcard.states import ShowAnswerConfig
+
+ViewFactory = Callable[[ttk.Frame], ttk.Frame]
+
+
+def _bootstrap_database() -> tuple[Any, Any, Any, Any]:
+    """Import the data layer, prepare the database and build the services.
+
+    Runs on a worker thread so SQLAlchemy's import, schema setup and seeding
+    overlap with the first paint of the home screen.
+
+    Returns:
+        The session, flashcard controller, dictionary service and the
+        started database maintenance thread, whose first ``optimize`` pass
+        runs immediately.
+    """
+
+    from tak_flashcard.data.seed.importer import ensure_seed_data
+    from tak_flashcard.data.seed.template import install_template
+    from tak_flashcard.db.session import get_engine, get_session_factory, init_db
+    from tak_flashcard.db.storage import MaintenanceThread
+    from tak_flashcard.features.dictionary.service import DictionaryService
+    from tak_flashcard.features.flashcard.controller import FlashcardController
+
+    # A fresh install starts from the prebuilt template when it is current;
+    # otherwise ensure_seed_data imports the vocabulary source below.
+    install_template()
+    init_db()
+    db = get_session_factory()()
+    ensure_seed_data(db)
+    # Hand the session over without an open transaction.
+    db.rollback()
+    maintenance = MaintenanceThread(get_engine(), MAINTENANCE_INTERVAL_SECONDS)
+    maintenance.start()
+    controller = FlashcardController(db)
+    # Dictionary reads write buffered answers first so counts are current.
+    dictionary = DictionaryService(db, controller.sync_stats)
+    return db, controller, dictionary, maintenance
 
 
 class FlashcardApp(tk.Tk):
-    """Main Tkinter application container."""
+    """Main Tkinter application container.
 
-    def __init__(self):
-        """Initialize the application window and views."""
+    Views are registered as factories and built the first time ``navigate``
+    targets them. The database is bootstrapped on a worker thread while the
+    home screen paints; views that need it wait until it is ready.
+    """
 
+    def __init__(self, startup: Optional[StartupTimer] = None):
+        """Initialize the application window and start the database bootstrap.
+
+        Parameters:
+            startup: Timer to record startup milestones on; created if omitted.
+        """
+
+        self.startup = startup or StartupTimer()
         super().__init__()
         ensure_data_dirs()
         self.title(APP_NAME)
         self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.style = ttk.Style(self)
         self.style.theme_use("clam")
+        self.startup.mark("window created")
 
-        init_db()
-        self.db = SessionLocal()
-        ensure_seed_data(self.db)
         self.settings_manager = SettingsManager()
-
+        self.fonts = FontLoader(self)
         apply_appearance_settings(
             self.style, self.settings_manager.settings.appearance)
 
-        self.controller = FlashcardController(self.db)
-        self.dictionary_service = DictionaryService(self.db)
+        self.db: Any = None
+        self.controller: Any = None
+        self.dictionary_service: Any = None
+        self.maintenance: Any = None
+        self._ready_callbacks: list[Callable[[], None]] = []
+        self._bootstrap_results: queue.Queue[tuple[Any, ...] | BaseException] = queue.Queue()
+        self._bootstrap_after_id: str | None = None
+        self._flush_after_id: str | None = None
 
-        container = ttk.Frame(self)
-        container.pack(fill="both", expand=True)
+        self.container = ttk.Frame(self)
+        self.container.pack(fill="both", expand=True)
         self.frames: dict[str, ttk.Frame] = {}
+        self._views: dict[str, tuple[ViewFactory, bool]] = {
+            "home": (lambda master: HomeView(master, self.navigate), False),
+            "flashcard": (self._build_flashcard_options, False),
+            "flashcard_session": (self._build_flashcard_session, True),
+            "dictionary": (self._build_dictionary, True),
+            "results": (self._build_results, True),
+            "guide": (self._build_guide, False),
+            "settings": (self._build_settings, False),
+        }
+
+        threading.Thread(target=self._run_bootstrap,
+                         name="db-bootstrap", daemon=True).start()
+        self.protocol("WM_DELETE_WINDOW", self.shutdown)
+        self.navigate("home")
+        self.startup.mark("home view built")
+        self.after_idle(self._on_first_idle)
+        self._bootstrap_after_id = self.after(BOOTSTRAP_POLL_MS, self._poll_bootstrap)
+
+    @property
+    def ready(self) -> bool:
+        """Return whether the database and services are available."""
+
+        return self.db is not None
+
+    def _build_flashcard_options(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the flashcard options screen."""
+
+        from tak_flashcard.gui.views.flashcard_view import FlashcardView
+
+        return FlashcardView(
+            master, self.start_flashcard_session, lambda: self.navigate("home"))
+
+    def _build_flashcard_session(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the flashcard session screen."""
+
+        from tak_flashcard.gui.views.flashcard_view import FlashcardSessionView
+
+        return FlashcardSessionView(
+            master, self.controller, lambda: self.navigate("flashcard"))
+
+    def _build_dictionary(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the dictionary screen."""
+
+        from tak_flashcard.gui.views.dictionary_view import DictionaryView
+
+        return DictionaryView(
+            master, self.dictionary_service, lambda: self.navigate("home"))
+
+    def _build_results(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the statistics screen."""
+
+        from tak_flashcard.features.analytics.service import AnalyticsService
+        from tak_flashcard.gui.views.results_view import ResultsView
+
+        return ResultsView(master, AnalyticsService(self.db), lambda: self.navigate("home"))
+
+    def _build_guide(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the guide screen."""
+
+        from tak_flashcard.gui.views.guide_view import GuideView
+
+        return GuideView(master, lambda: self.navigate("home"))
 
-        self.frames["home"] = HomeView(container, self.navigate)
-        self.frames["flashcard"] = FlashcardView(
-            container,
-            self.start_flashcard_session,
-            lambda: self.navigate("home"),
-        )
-        self.frames["flashcard_session"] = FlashcardSessionView(
-            container, self.controller, lambda: self.navigate("flashcard")
-        )
-        self.frames["dictionary"] = DictionaryView(
-            container, self.dictionary_service, lambda: self.navigate("home"))
-        self.frames["guide"] = GuideView(
-            container, lambda: self.navigate("home"))
-        self.frames["settings"] = SettingsView(
-            container, self.settings_manager, lambda: self.navigate("home"), self.apply_appearance)
-
-        for frame in self.frames.values():
+    def _build_settings(self, master: ttk.Frame) -> ttk.Frame:
+        """Create the settings screen."""
+
+        from tak_flashcard.gui.views.settings_view import SettingsView
+
+        return SettingsView(master, self.settings_manager, self.fonts,
+                            lambda: self.navigate("home"), self.apply_appearance)
+
+    def frame(self, key: str) -> Optional[ttk.Frame]:
+        """Return the view for ``key``, building it on first use."""
+
+        frame = self.frames.get(key)
+        if frame is None and key in self._views:
+            factory, _needs_db = self._views[key]
+            frame = factory(self.container)
             frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[key] = frame
+        return frame
 
-        self.navigate("home")
+    def _run_bootstrap(self) -> None:
+        """Worker-thread body: bootstrap the database and hand over the result."""
+
+        try:
+            self._bootstrap_results.put(_bootstrap_database())
+        except BaseException as exc:  # reported on the Tk thread
+            self._bootstrap_results.put(exc)
+
+    def _poll_bootstrap(self) -> None:
+        """Install the bootstrapped services once the worker has finished."""
+
+        try:
+            result = self._bootstrap_results.get_nowait()
+        except queue.Empty:
+            self._bootstrap_after_id = self.after(BOOTSTRAP_POLL_MS, self._poll_bootstrap)
+            return
+        self._bootstrap_after_id = None
+        if isinstance(result, BaseException):
+            messagebox.showerror(APP_NAME, f"Could not open the database:\n{result}")
+            self.destroy()
+            return
+        self.db, self.controller, self.dictionary_service, self.maintenance = result
+        self.startup.mark("database ready")
+        self.configure(cursor="")
+        self._schedule_stats_flush()
+        callbacks, self._ready_callbacks = self._ready_callbacks, []
+        for callback in callbacks:
+            callback()
+        self._maybe_report_startup()
+
+    def when_ready(self, callback: Callable[[], None]) -> None:
+        """Run ``callback`` now if the database is ready, otherwise once it is."""
+
+        if self.ready:
+            callback()
+            return
+        self.configure(cursor="watch")
+        self._ready_callbacks.append(callback)
+
+    def _on_first_idle(self) -> None:
+        """Record the first idle moment, after the home screen has painted."""
+
+        self.startup.mark("first paint")
+        self._maybe_report_startup()
+
+    def _maybe_report_startup(self) -> None:
+        """Print the timing report once both painting and bootstrap are done."""
+
+        if self.ready and self.startup.offset("first paint") is not None:
+            self.startup.mark("interactive")
+            if os.environ.get(STARTUP_REPORT_ENV):
+                self.startup.report()
+            # Warm the font cache now so the settings screen opens instantly.
+            self.fonts.load()
+
+    def _schedule_stats_flush(self) -> None:
+        """Periodically flush buffered answer statistics while idle."""
+
+        self.controller.flush()
+        self._flush_after_id = self.after(1000, self._schedule_stats_flush)
+
+    def shutdown(self) -> None:
+        """Persist buffered statistics, close the database and exit."""
+
+        for after_id in (self._flush_after_id, self._bootstrap_after_id):
+            if after_id:
+                self.after_cancel(after_id)
+        self._flush_after_id = self._bootstrap_after_id = None
+        try:
+            if self.controller is not None:
+                self.controller.flush(force=True)
+        finally:
+            if self.maintenance is not None:
+                self.maintenance.stop()
+            if self.db is not None:
+                self.db.close()
+            self.destroy()
 
     def apply_appearance(self, settings: Settings) -> None:
         """Apply appearance settings to the application immediately."""
@@ -83,6 +280,7 @@ class FlashcardApp(tk.Tk):
         time_limit: int,
         show_config: ShowAnswerConfig,
         wrong_penalty: int,
+        part_of_speech: Optional[str] = None,
     ) -> None:
         """Start a flashcard session and navigate to the dedicated session view.
 
@@ -94,10 +292,13 @@ class FlashcardApp(tk.Tk):
             time_limit: Desired time limit for speed mode.
             show_config: Settings for show-answer penalties.
             wrong_penalty: Configured penalty for wrong answers.
+            part_of_speech: Part of speech to drill in weak-words mode.
         """
 
-        session_frame = self.frames.get("flashcard_session")
-        if isinstance(session_frame, FlashcardSessionView):
+        def begin() -> None:
+            """Start the session once the database is available."""
+
+            session_frame = self.frame("flashcard_session")
             session_frame.begin_session(
                 mode,
                 direction,
@@ -106,26 +307,42 @@ class FlashcardApp(tk.Tk):
                 time_limit,
                 show_config,
                 wrong_penalty,
+                part_of_speech,
             )
             self.navigate("flashcard_session")
 
+        self.when_ready(begin)
+
     def navigate(self, key: str) -> None:
-        """Show the requested frame or exit."""
+        """Show the requested frame, building it on first use, or exit."""
 
         if key == "exit":
-            self.destroy()
+            self.shutdown()
             return
-        frame = self.frames.get(key)
-        if frame:
-            if key == "dictionary" and isinstance(frame, DictionaryView):
-                frame.refresh()
-            frame.tkraise()
+        if key not in self._views:
+            return
+        _factory, needs_db = self._views[key]
+        if needs_db and not self.ready:
+            self.when_ready(lambda: self.navigate(key))
+            return
+        frame = self.frame(key)
+        if key == "dictionary":
+            frame.refresh()
+        elif key == "results":
+            # Write buffered answers so the summaries include them.
+            self.controller.flush(force=True)
+            frame.refresh()
+        frame.tkraise()
+
 
+def run(startup: Optional[StartupTimer] = None) -> None:
+    """Start the Tkinter main loop.
 
-def run() -> None:
-    """Start the Tkinter main loop."""
+    Parameters:
+        startup: Timer started by the entry point, so import time is included.
+    """
 
-    app = FlashcardApp()
+    app = FlashcardApp(startup)
     app.mainloop()
 
 
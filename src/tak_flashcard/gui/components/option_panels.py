@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
+from typing import Optional
 
 from tak_flashcard.constants import (
     DEFAULT_QUESTION_COUNT,
@@ -13,6 +14,7 @@ from tak_flashcard.constants import (
     DEFAULT_TIME_LIMIT,
     DEFAULT_WRONG_ANSWER_PENALTY,
     DIFFICULTY_LEVELS,
+    PARTS_OF_SPEECH,
     Direction,
     Mode,
 )
@@ -42,6 +44,7 @@ class FlashcardOptions(ttk.Frame):
         self.speed_penalty_choice = tk.StringVar(value="score")
         self.wrong_answer_penalty = tk.IntVar(
             value=DEFAULT_WRONG_ANSWER_PENALTY)
+        self.part_of_speech = tk.StringVar(value="")
 
         self._build_widgets()
 
@@ -78,6 +81,12 @@ class FlashcardOptions(ttk.Frame):
         ttk.Entry(self.question_frame, textvariable=self.question_count).pack(
             fill="x", padx=4, pady=2)
 
+        self.weak_frame = ttk.Frame(mode_opts)
+        ttk.Label(self.weak_frame,
+                  text="Part of speech (Weak, blank = all)").pack(anchor=tk.W)
+        ttk.Combobox(self.weak_frame, textvariable=self.part_of_speech,
+                     values=("", *PARTS_OF_SPEECH)).pack(fill="x", padx=4, pady=2)
+
         self.endless_choice_frame = ttk.Frame(mode_opts)
         ttk.Label(self.endless_choice_frame, text="Endless show penalty type").pack(
             anchor=tk.W)
@@ -169,7 +178,9 @@ class FlashcardOptions(ttk.Frame):
         for i in range(2):
             self.rowconfigure(i, weight=1)
 
-    def values(self) -> tuple[Mode, Direction, int, int, int, int, int, int, int]:
+    def values(
+        self,
+    ) -> tuple[Mode, Direction, int, int, int, int, int, int, int, Optional[str]]:
         """Return the selected configuration values."""
 
         return (
@@ -182,6 +193,7 @@ class FlashcardOptions(ttk.Frame):
             int(self.show_limit.get()),
             int(self.show_time_penalty.get()),
             int(self.wrong_answer_penalty.get()),
+            self.part_of_speech.get().strip() or None,
         )
 
     def _update_mode_specific_controls(self, *_: str) -> None:
@@ -190,6 +202,7 @@ class FlashcardOptions(ttk.Frame):
         selected = Mode(self.mode.get())
         # Reset all mode-specific frames
         self.question_frame.pack_forget()
+        self.weak_frame.pack_forget()
         self.endless_choice_frame.pack_forget()
         self.speed_choice_frame.pack_forget()
         self.penalty_score_frame.pack_forget()
@@ -201,6 +214,8 @@ class FlashcardOptions(ttk.Frame):
 
         if selected == Mode.TESTING:
             self.question_frame.pack(fill="x", padx=4, pady=2)
+        elif selected == Mode.WEAK:
+            self.weak_frame.pack(fill="x", padx=4, pady=2)
 
         if selected == Mode.ENDLESS:
             self.endless_choice_frame.pack(fill="x", padx=4, pady=2)
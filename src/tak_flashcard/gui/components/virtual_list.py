@@ -0,0 +1,214 @@
+"""Virtual-scrolling Treeview that only materializes visible rows."""
+
+from __future__ import annotations
+
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Optional, Sequence
+
+from tak_flashcard.features.dictionary.sources import WordSource
+
+RowFormatter = Callable[[Any], tuple[str, tuple[Any, ...]]]
+
+
+class VirtualTreeview(ttk.Frame):
+    """Treeview whose rows come from a paged source as the user scrolls.
+
+    The tree only ever holds the rows in the viewport plus a small overscan
+    below it. Scrolling and refreshes compute the target window and apply
+    the difference against the items already shown: unchanged rows are kept,
+    edited rows are updated in place and only new rows are inserted. Large
+    diffs are applied in time-sliced chunks through ``after`` so the event
+    loop keeps running.
+    """
+
+    def __init__(
+        self,
+        master: tk.Misc,
+        columns: Sequence[tuple[str, str]],
+        formatter: RowFormatter,
+        overscan: int = 10,
+        chunk_size: int = 50,
+    ):
+        """Create the list widget.
+
+        Parameters:
+            master: Parent Tkinter widget.
+            columns: (column id, heading text) pairs.
+            formatter: Maps a source row to (item id, column values).
+            overscan: Extra rows materialized below the viewport.
+            chunk_size: Maximum tree operations applied per event-loop slice.
+        """
+
+        super().__init__(master)
+        self.formatter = formatter
+        self.overscan = overscan
+        self.chunk_size = chunk_size
+        self.source: Optional[WordSource] = None
+        self.offset = 0
+        self._visible = 20
+        self._row_height = 20
+        self._shown: list[str] = []
+        self._values: dict[str, tuple[Any, ...]] = {}
+        self._pending_ops: list[tuple[str, Any, Any]] = []
+        self._apply_after_id: Optional[str] = None
+
+        self.tree = ttk.Treeview(self, columns=[col for col, _ in columns],
+                                 show="headings", height=self._visible)
+        for col, text in columns:
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=150, anchor=tk.W)
+        self.scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill="y")
+        self.tree.pack(side=tk.LEFT, fill="both", expand=True)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda _e: self.scroll_by(-3))
+        self.tree.bind("<Button-5>", lambda _e: self.scroll_by(3))
+        self.tree.bind("<Prior>", lambda _e: self.scroll_by(-self._visible))
+        self.tree.bind("<Next>", lambda _e: self.scroll_by(self._visible))
+
+    def set_source(self, source: WordSource, keep_offset: bool = False) -> None:
+        """Show rows from a new source.
+
+        Parameters:
+            source: Paged row source to display.
+            keep_offset: Keep the scroll position, e.g. when refreshing.
+        """
+
+        self.source = source
+        if not keep_offset:
+            self.offset = 0
+        self.render()
+
+    def refresh(self) -> None:
+        """Re-read the current window and apply only the changed rows."""
+
+        if self.source is None:
+            return
+        self.source.invalidate()
+        self.render()
+
+    def scroll_by(self, rows: int) -> None:
+        """Scroll the viewport by a number of rows."""
+
+        self._scroll_to(self.offset + rows)
+
+    def _scroll_to(self, offset: int) -> None:
+        """Move the viewport so the row at ``offset`` is at the top."""
+
+        total = self.source.count() if self.source else 0
+        clamped = max(0, min(offset, max(total - self._visible, 0)))
+        if clamped != self.offset:
+            self.offset = clamped
+            self.render()
+
+    def _on_scrollbar(self, action: str, value: str, unit: str | None = None) -> None:
+        """Translate scrollbar commands into row offsets."""
+
+        total = self.source.count() if self.source else 0
+        if action == "moveto":
+            self._scroll_to(int(float(value) * total))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll_by(int(value) * step)
+
+    def _on_wheel(self, event: tk.Event) -> str:
+        """Scroll on mouse wheel events (Windows and macOS)."""
+
+        delta = event.delta
+        if abs(delta) >= 120:
+            delta //= 40
+        self.scroll_by(-delta)
+        return "break"
+
+    def _on_resize(self, event: tk.Event) -> None:
+        """Recompute how many rows fit and re-render if it changed."""
+
+        visible = max(int(event.height // self._row_height) - 1, 1)
+        if visible != self._visible:
+            self._visible = visible
+            self.tree.configure(height=visible)
+            self.render()
+
+    def render(self) -> None:
+        """Fetch the target window and schedule the diff against the tree."""
+
+        if self.source is None:
+            return
+        if self._apply_after_id is not None:
+            # Finish the previous diff so the tree matches what _diff assumes.
+            self.after_cancel(self._apply_after_id)
+            self._apply_after_id = None
+            self._apply_ops(len(self._pending_ops))
+        total = self.source.count()
+        self.offset = max(0, min(self.offset, max(total - self._visible, 0)))
+        rows = self.source.fetch(self.offset, self._visible + self.overscan)
+        target = [self.formatter(row) for row in rows]
+        self._update_scrollbar(total)
+        self._pending_ops = self._diff(target)
+        self._apply_chunk()
+
+    def _update_scrollbar(self, total: int) -> None:
+        """Reflect the viewport position on the scrollbar."""
+
+        if total <= 0:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        first = self.offset / total
+        last = min((self.offset + self._visible) / total, 1.0)
+        self.scrollbar.set(first, last)
+
+    def _diff(self, target: list[tuple[str, tuple[Any, ...]]]) -> list[tuple[str, Any, Any]]:
+        """Compute tree operations turning the shown rows into ``target``."""
+
+        wanted = {iid for iid, _ in target}
+        ops: list[tuple[str, Any, Any]] = [
+            ("delete", iid, None) for iid in self._shown if iid not in wanted]
+        order = [iid for iid in self._shown if iid in wanted]
+        for index, (iid, values) in enumerate(target):
+            if iid not in self._values:
+                ops.append(("insert", index, (iid, values)))
+                order.insert(index, iid)
+                continue
+            if order[index] != iid:
+                ops.append(("move", index, iid))
+                order.remove(iid)
+                order.insert(index, iid)
+            if self._values[iid] != values:
+                ops.append(("update", iid, values))
+        self._shown = [iid for iid, _ in target]
+        self._values = dict(target)
+        return ops
+
+    def _apply_chunk(self) -> None:
+        """Apply up to ``chunk_size`` pending operations, then yield."""
+
+        self._apply_after_id = None
+        self._apply_ops(self.chunk_size)
+        if self._pending_ops:
+            self._apply_after_id = self.after(1, self._apply_chunk)
+
+    def _apply_ops(self, limit: int) -> None:
+        """Apply up to ``limit`` pending tree operations in order."""
+
+        batch = self._pending_ops[:limit]
+        del self._pending_ops[:limit]
+        for op, first, second in batch:
+            if op == "delete":
+                if self.tree.exists(first):
+                    self.tree.delete(first)
+            elif op == "insert":
+                iid, values = second
+                if self.tree.exists(iid):
+                    self.tree.item(iid, values=values)
+                    self.tree.move(iid, "", first)
+                else:
+                    self.tree.insert("", first, iid=iid, values=values)
+            elif op == "move":
+                if self.tree.exists(second):
+                    self.tree.move(second, "", first)
+            elif self.tree.exists(first):
+                self.tree.item(first, values=second)
@@ -4,58 +4,174 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable
+from typing import Callable, Optional
 
+from tak_flashcard.db.models import Word
+from tak_flashcard.features.dictionary.search_worker import SearchWorker
 from tak_flashcard.features.dictionary.service import DictionaryService
+from tak_flashcard.features.dictionary.sources import WordSource
+from tak_flashcard.gui.components.virtual_list import VirtualTreeview
+
+SEARCH_DEBOUNCE_MS = 250
+SEARCH_POLL_MS = 30
+SORT_ORDERS = {"English A-Z": "english", "Hardest first": "difficulty"}
+
+
+def _format_row(word: Word) -> tuple[str, tuple[str, str, str, str]]:
+    """Map a word to its tree item id and displayed column values."""
+
+    return str(word.id), (
+        word.english, word.vietnamese, word.part_of_speech or "", f"{word.difficulty:.2f}")
 
 
 class DictionaryView(ttk.Frame):
-    """View to browse and search vocabulary."""
+    """View to browse and search vocabulary.
+
+    Typing searches live: keystrokes are debounced, queries run on a
+    background worker with its own session, and the view polls the worker's
+    result queue with ``after`` so the event loop never waits on SQLite.
+    """
 
     def __init__(self, master: tk.Misc, service: DictionaryService, on_back: Callable[[], None]):
         """Initialize dictionary view with service and navigation."""
 
         super().__init__(master, padding=10)
         self.service = service
+        self._active_query: Optional[str] = None
+        self._worker: Optional[SearchWorker] = None
+        self._debounce_id: Optional[str] = None
+        self._poll_id: Optional[str] = None
+        self._keep_offset = False
         search_frame = ttk.Frame(self)
         ttk.Label(search_frame, text="Search").pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
+        self.search_var.trace_add("write", self._on_query_changed)
         entry = ttk.Entry(search_frame, textvariable=self.search_var)
         entry.pack(side=tk.LEFT, fill="x", expand=True, padx=4)
+        entry.bind("<Return>", lambda _e: self.perform_search())
         ttk.Button(search_frame, text="Go", command=self.perform_search).pack(
             side=tk.LEFT, padx=4)
+        ttk.Label(search_frame, text="Sort").pack(side=tk.LEFT, padx=(8, 0))
+        self.sort_var = tk.StringVar(value=next(iter(SORT_ORDERS)))
+        sort_box = ttk.Combobox(search_frame, textvariable=self.sort_var,
+                                values=list(SORT_ORDERS), state="readonly", width=14)
+        sort_box.pack(side=tk.LEFT, padx=4)
+        sort_box.bind("<<ComboboxSelected>>", lambda _e: self._on_sort_changed())
         ttk.Button(search_frame, text="Back", command=on_back).pack(
             side=tk.LEFT, padx=4)
         search_frame.pack(fill="x", pady=6)
 
-        self.tree = ttk.Treeview(self, columns=(
-            "english", "vietnamese", "pos", "difficulty"), show="headings")
-        for col, text in [
+        self.list = VirtualTreeview(self, [
             ("english", "English"),
             ("vietnamese", "Vietnamese"),
             ("pos", "Part of Speech"),
             ("difficulty", "Difficulty"),
-        ]:
-            self.tree.heading(col, text=text)
-            self.tree.column(col, width=150, anchor=tk.W)
-        self.tree.pack(fill="both", expand=True)
-        self.refresh()
+        ], _format_row)
+        self.tree = self.list.tree
+        self.list.pack(fill="both", expand=True)
+        self.status_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self.status_var).pack(anchor=tk.W)
 
     def refresh(self) -> None:
-        """Load all words into the tree view."""
+        """Re-read the current listing, updating only rows that changed."""
+
+        if self._active_query is None:
+            self._active_query = ""
+            self.list.set_source(self._browse_source())
+            return
+        if self._active_query:
+            self._start_search(self._active_query, keep_offset=True)
+        else:
+            self.list.refresh()
 
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for word in self.service.all_words():
-            self.tree.insert("", tk.END, values=(
-                word.english, word.vietnamese, word.part_of_speech, f"{word.difficulty:.2f}"))
+    def _browse_source(self) -> WordSource:
+        """Return the unfiltered listing in the selected sort order."""
+
+        return self.service.browse_source(SORT_ORDERS[self.sort_var.get()])
+
+    def _on_sort_changed(self) -> None:
+        """Re-list all words in the new order; search results keep relevance order."""
+
+        if not self._active_query:
+            self.list.set_source(self._browse_source())
 
     def perform_search(self) -> None:
-        """Search and update the list."""
+        """Search immediately, skipping the debounce delay."""
+
+        self._cancel_debounce()
+        self._start_search(self.search_var.get().strip())
+
+    def _on_query_changed(self, *_args: object) -> None:
+        """Restart the debounce timer on every keystroke."""
+
+        self._cancel_debounce()
+        self._debounce_id = self.after(SEARCH_DEBOUNCE_MS, self._debounced_search)
 
+    def _debounced_search(self) -> None:
+        """Run the search once typing has paused."""
+
+        self._debounce_id = None
         query = self.search_var.get().strip()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for word in self.service.search(query):
-            self.tree.insert("", tk.END, values=(
-                word.english, word.vietnamese, word.part_of_speech, f"{word.difficulty:.2f}"))
+        if query != self._active_query:
+            self._start_search(query)
+
+    def _cancel_debounce(self) -> None:
+        """Drop a pending debounced search."""
+
+        if self._debounce_id is not None:
+            self.after_cancel(self._debounce_id)
+            self._debounce_id = None
+
+    def _start_search(self, query: str, keep_offset: bool = False) -> None:
+        """Show all words for an empty query or hand the query to the worker."""
+
+        self._active_query = query
+        self._keep_offset = keep_offset
+        if not query:
+            if self._worker is not None:
+                self._worker.cancel()
+            self._stop_polling()
+            self.status_var.set("")
+            self.list.set_source(self._browse_source())
+            return
+        if self._worker is None:
+            self._worker = self.service.create_search_worker()
+        self._worker.submit(query)
+        self.status_var.set("Searching…")
+        if self._poll_id is None:
+            self._poll_id = self.after(SEARCH_POLL_MS, self._poll_results)
+
+    def _poll_results(self) -> None:
+        """Apply the worker's newest result, or keep polling until it arrives."""
+
+        self._poll_id = None
+        if self._worker is None:
+            return
+        result = self._worker.poll()
+        if result is None:
+            self._poll_id = self.after(SEARCH_POLL_MS, self._poll_results)
+            return
+        if result.error:
+            self.status_var.set(f"Search failed: {result.error}")
+            return
+        self.status_var.set(
+            f"{len(result.ids)} matches ({result.elapsed * 1000:.0f} ms)")
+        self.list.set_source(self.service.id_source(result.ids),
+                             keep_offset=self._keep_offset)
+
+    def _stop_polling(self) -> None:
+        """Cancel the result polling callback."""
+
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    def destroy(self) -> None:
+        """Stop background work before the widget is destroyed."""
+
+        self._cancel_debounce()
+        self._stop_polling()
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+        super().destroy()
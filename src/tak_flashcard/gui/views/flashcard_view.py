@@ -26,7 +26,7 @@ class FlashcardView(ttk.Frame):
         self,
         master: tk.Misc,
         on_start_session: Callable[
-            [Mode, Direction, int, int, int, ShowAnswerConfig, int], None
+            [Mode, Direction, int, int, int, ShowAnswerConfig, int, Optional[str]], None
         ],
         on_back: Callable[[], None],
     ):
@@ -80,6 +80,7 @@ class FlashcardView(ttk.Frame):
             show_limit,
             time_penalty,
             wrong_answer_penalty,
+            part_of_speech,
         ) = self.options.values()
         self.status_var.set(
             f"Starting {mode.name.title()} | {direction.name} | Difficulty {difficulty}"
@@ -106,6 +107,7 @@ class FlashcardView(ttk.Frame):
             time_limit,
             show_config,
             wrong_penalty,
+            part_of_speech,
         )
 
 
@@ -161,6 +163,7 @@ class FlashcardSessionView(ttk.Frame):
         time_limit: int,
         show_config: ShowAnswerConfig,
         wrong_penalty: int,
+        part_of_speech: Optional[str] = None,
     ) -> None:
         """Start a new session and render the first card."""
 
@@ -175,6 +178,7 @@ class FlashcardSessionView(ttk.Frame):
             q_limit,
             t_limit,
             wrong_penalty,
+            part_of_speech,
         )
         self.status_var.set(
             f"Mode: {mode.name.title()} | Direction: {direction.name} | Score: 0"
@@ -197,17 +201,7 @@ class FlashcardSessionView(ttk.Frame):
             self._stop_timer()
             return
         state = self.controller.service.state
-        direction = (
-            state.current_direction
-            if state and state.current_direction
-            else (state.direction if state else Direction.ENG_TO_VN)
-        )
-        prompt = (
-            str(card.english)
-            if direction == Direction.ENG_TO_VN
-            else str(card.vietnamese)
-        )
-        self.card.set_question(prompt)
+        self.card.set_question(state.current_prompt if state else str(card.english))
         self.card.set_choices(state.current_choices if state else [])
         self._update_show_button_state()
         self._resume_timer()
@@ -281,6 +275,7 @@ class FlashcardSessionView(ttk.Frame):
         """Stop the timer and return to the settings view."""
 
         self._stop_timer()
+        self.controller.end()
         self.on_back_to_settings()
 
     def _update_show_button_state(self) -> None:
@@ -367,7 +362,7 @@ class FlashcardSessionView(ttk.Frame):
 
         state = self.controller.service.state
         if state:
-            state.finished = True
+            self.controller.end()
             self.status_var.set(f"Time's up! Score: {state.score}")
         self.card.set_question("Time's up! Session ended.")
         self.card.disable_all()
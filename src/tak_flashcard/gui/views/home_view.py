@@ -20,6 +20,7 @@ class HomeView(ttk.Frame):
         for name, key in [
             ("Flashcard", "flashcard"),
             ("Dictionary", "dictionary"),
+            ("Statistics", "results"),
             ("Guide", "guide"),
             ("Settings", "settings"),
             ("Exit", "exit"),
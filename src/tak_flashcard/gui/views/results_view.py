@@ -1,23 +1,104 @@
-"""Results view placeholder."""
+"""Statistics screen built from the learner analytics report."""
 
 from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable
+from typing import Callable, Sequence
+
+from tak_flashcard.features.analytics.report import Accuracy, LearnerReport
+from tak_flashcard.features.analytics.service import AnalyticsService
+
+# Width in characters of the longest histogram bar.
+BAR_WIDTH = 40
+
+
+def _table(master: tk.Misc, columns: Sequence[tuple[str, str, int]]) -> ttk.Treeview:
+    """Create a read-only Treeview with (key, heading, width) columns."""
+
+    tree = ttk.Treeview(master, columns=[key for key, _, _ in columns], show="headings")
+    for key, heading, width in columns:
+        tree.heading(key, text=heading)
+        tree.column(key, width=width, anchor="w" if key in ("label", "bar") else "e")
+    tree.pack(fill="both", expand=True)
+    return tree
+
+
+def _fill(tree: ttk.Treeview, rows: Sequence[Sequence[object]]) -> None:
+    """Replace a table's rows."""
+
+    tree.delete(*tree.get_children())
+    for row in rows:
+        tree.insert("", "end", values=list(row))
+
+
+def _accuracy_row(row: Accuracy) -> tuple[object, ...]:
+    """Format an accuracy line as table values."""
+
+    return row.label, row.answers, row.correct, f"{row.rate:.1%}"
+
+
+ACCURACY_COLUMNS = [("label", "Group", 220), ("answers", "Answers", 90),
+                    ("correct", "Correct", 90), ("rate", "Accuracy", 90)]
 
 
 class ResultsView(ttk.Frame):
-    """Show summary of a completed session."""
+    """Show accuracy breakdowns, streaks and the learning curve."""
 
-    def __init__(self, master: tk.Misc, summary: str, on_back: Callable[[], None]):
-        """Create results view with provided summary text."""
+    def __init__(self, master: tk.Misc, service: AnalyticsService, on_back: Callable[[], None]):
+        """Create the statistics view; call ``refresh`` to load the report.
+
+        Parameters:
+            master: Parent widget.
+            service: Analytics service providing the report.
+            on_back: Callback returning to the previous screen.
+        """
 
         super().__init__(master, padding=12)
-        ttk.Label(self, text="Results", font=(
+        self.service = service
+        ttk.Label(self, text="Statistics", font=(
             "Arial", 16, "bold")).pack(pady=8)
-        text = tk.Text(self, wrap="word", height=12)
-        text.insert("1.0", summary)
-        text.configure(state="disabled")
-        text.pack(fill="both", expand=True)
+        self.summary = ttk.Label(self, text="")
+        self.summary.pack(pady=4)
+
+        notebook = ttk.Notebook(self)
+        notebook.pack(fill="both", expand=True)
+        tabs = {}
+        for name in ("Overview", "Parts of speech", "Difficulty", "Learning curve"):
+            tabs[name] = ttk.Frame(notebook, padding=6)
+            notebook.add(tabs[name], text=name)
+        self.overview = _table(tabs["Overview"], ACCURACY_COLUMNS + [("latency", "Mean time", 90)])
+        self.parts = _table(tabs["Parts of speech"], ACCURACY_COLUMNS)
+        self.buckets = _table(tabs["Difficulty"], [
+            ("range", "Difficulty", 110), ("words", "Words", 90), ("bar", "", 420)])
+        self.curve = _table(tabs["Learning curve"], [
+            ("day", "Day", 110), ("answers", "Answers", 90), ("rate", "Accuracy", 90),
+            ("rolling", f"{service.window_days}-day", 90), ("running", "Overall", 90)])
         ttk.Button(self, text="Back", command=on_back).pack(pady=6)
+
+    def refresh(self) -> None:
+        """Reload the report and redraw every table."""
+
+        self.show(self.service.report())
+
+    def show(self, report: LearnerReport) -> None:
+        """Render a report."""
+
+        streaks = report.streaks
+        self.summary.configure(text=(
+            f"{report.total.answers} answers | accuracy {report.total.rate:.1%} | "
+            f"streak {streaks.current} day(s), longest {streaks.longest}"))
+        overview = [report.total] + report.by_direction + report.by_mode
+        _fill(self.overview, [
+            _accuracy_row(row) + (f"{row.mean_latency_ms / 1000:.1f} s" if row.latency_ms else "",)
+            for row in overview])
+        _fill(self.parts, [_accuracy_row(row) for row in report.by_part])
+        most = max((bucket.words for bucket in report.buckets), default=0) or 1
+        _fill(self.buckets, [
+            (f"{bucket.low:.2f}-{bucket.high:.2f}", bucket.words,
+             "█" * round(BAR_WIDTH * bucket.words / most))
+            for bucket in report.buckets])
+        _fill(self.curve, [
+            (point.day.isoformat(), point.answers, f"{point.correct / point.answers:.1%}",
+             f"{point.rolling_rate:.1%}", f"{point.running_rate:.1%}")
+            for point in reversed(report.curve)])
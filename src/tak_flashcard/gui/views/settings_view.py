@@ -7,14 +7,18 @@ from tkinter import ttk
 from typing import Callable, Optional
 
 from tak_flashcard.core.settings import Settings, SettingsManager
-from tak_flashcard.utils.fonts import get_available_fonts
+from tak_flashcard.utils.fonts import FontLoader
 
 
 class SettingsView(ttk.Frame):
     """UI to edit and save user settings."""
 
-    def __init__(self, master: tk.Misc, manager: SettingsManager, on_back: Callable[[], None], on_apply: Optional[Callable[[Settings], None]] = None):
-        """Create settings view with settings manager."""
+    def __init__(self, master: tk.Misc, manager: SettingsManager, fonts: FontLoader, on_back: Callable[[], None], on_apply: Optional[Callable[[Settings], None]] = None):
+        """Create settings view with settings manager.
+
+        The font list starts with the current font and is filled in once
+        ``fonts`` has loaded the installed families.
+        """
 
         super().__init__(master, padding=12)
         self.manager = manager
@@ -28,10 +32,10 @@ class SettingsView(ttk.Frame):
         # Font selector
         ttk.Label(appearance_frame, text="Font").pack(anchor=tk.W, pady=(4, 0))
         self.font_var = tk.StringVar(value=self.settings.appearance.font_name)
-        available_fonts = get_available_fonts()
         font_combo = ttk.Combobox(
-            appearance_frame, textvariable=self.font_var, values=available_fonts, state="readonly")
+            appearance_frame, textvariable=self.font_var, values=[self.font_var.get()], state="readonly")
         font_combo.pack(fill="x")
+        fonts.load(lambda families: font_combo.configure(values=families))
 
         # Font size selector (in pixels)
         ttk.Label(appearance_frame, text="Font Size (pixels)").pack(
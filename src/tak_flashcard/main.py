@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from tak_flashcard.gui.app import run
+from tak_flashcard.utils.timing import StartupTimer
 
 
 def main() -> None:
-    """Launch the GUI application."""
+    """Launch the GUI application, timing startup from this point."""
 
-    run()
+    startup = StartupTimer()
+    from tak_flashcard.gui.app import run
+
+    startup.mark("gui imported")
+    run(startup)
 
 
 if __name__ == "__main__":
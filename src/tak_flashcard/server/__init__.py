@@ -0,0 +1 @@
+"""Local HTTP/JSON server for shared flashcard sessions."""
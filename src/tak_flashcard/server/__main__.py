@@ -0,0 +1,6 @@
+"""Run the session server: ``python -m tak_flashcard.server``."""
+
+from tak_flashcard.server.app import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,452 @@
+"""Asyncio HTTP/JSON server multiplexing many learners' flashcard sessions.
+
+Endpoints (all bodies are JSON):
+
+- ``POST /sessions`` starts a session: ``mode``, ``direction``,
+  ``difficulty``, ``question_count``, ``time_limit``, ``wrong_penalty`` and
+  ``show`` (``enabled``, ``score_penalty``, ``max_uses``, ``time_penalty``).
+- ``POST /sessions/<id>/next`` draws the next card.
+- ``POST /sessions/<id>/submit`` checks ``{"answer": ...}``.
+- ``POST /sessions/<id>/reveal`` shows the answer, with its penalty.
+- ``POST /sessions/<id>/finish`` closes the session and returns its totals.
+- ``GET /stats`` reports p50/p99 latency per endpoint and writer backlog.
+
+Card selection runs on the event loop against the shared snapshot; only
+database writes leave it, through a ``BoundedExecutor`` with one worker.
+Sessions without a request for ``SERVER_SESSION_IDLE_SECONDS`` are closed,
+and the shared snapshot is re-read on the writer every
+``SERVER_SNAPSHOT_REFRESH_SECONDS`` so new sessions see current statistics.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from tak_flashcard.config import (
+    SERVER_HOST,
+    SERVER_MAX_PENDING_WRITES,
+    SERVER_PORT,
+    SERVER_SESSION_ID_BLOCK,
+    SERVER_SESSION_IDLE_SECONDS,
+    SERVER_SNAPSHOT_REFRESH_SECONDS,
+    SERVER_WRITE_BATCH,
+    STATS_FLUSH_SECONDS,
+)
+from tak_flashcard.constants import (
+    DEFAULT_DIFFICULTY_LEVEL,
+    DEFAULT_DIRECTION,
+    DEFAULT_FLASHCARD_MODE,
+    DEFAULT_QUESTION_COUNT,
+    DEFAULT_TIME_LIMIT,
+    Direction,
+    Mode,
+)
+from tak_flashcard.core.scoring import PENALTY_POINTS
+from tak_flashcard.features.flashcard.manager import SessionManager, SessionWriter
+from tak_flashcard.features.flashcard.service import answer_text
+from tak_flashcard.features.flashcard.states import FlashcardState, ShowAnswerConfig
+from tak_flashcard.server.http import HttpError, Request, encode_response, read_request
+from tak_flashcard.utils.timing import LatencyStats
+
+SESSION_ACTIONS = ("next", "submit", "reveal", "finish")
+
+logger = logging.getLogger(__name__)
+
+
+class BoundedExecutor:
+    """Thread pool that admits at most ``max_pending`` jobs at a time.
+
+    Callers beyond the limit wait in ``run`` for a slot, which pushes back on
+    whoever produces the work instead of queueing it without bound.
+    """
+
+    def __init__(self, max_pending: int, workers: int = 1):
+        """Create the pool.
+
+        Parameters:
+            max_pending: Jobs running or queued at once.
+            workers: Worker threads; one keeps SQLite writes serialized.
+        """
+
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="db-writer")
+        self._slots = asyncio.Semaphore(max(max_pending, 1))
+
+    @property
+    def saturated(self) -> bool:
+        """Return whether every slot is taken."""
+
+        return self._slots.locked()
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` on the pool once a slot is free and return its result."""
+
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def shutdown(self) -> None:
+        """Wait for running jobs and stop the worker threads."""
+
+        self._pool.shutdown(wait=True)
+
+
+def _state_payload(state: FlashcardState) -> dict[str, Any]:
+    """Describe a session's progress for a response."""
+
+    return {
+        "mode": state.mode.value,
+        "direction": state.direction.value,
+        "difficulty": state.difficulty,
+        "asked": state.asked,
+        "correct": state.correct,
+        "score": state.score,
+        "revealed": state.show_used,
+        "finished": state.finished,
+    }
+
+
+def _option(body: dict[str, Any], key: str, kind: Callable[[Any], Any], default: Any) -> Any:
+    """Read an optional request field, converting it or failing with 400."""
+
+    value = body.get(key)
+    if value is None:
+        return default
+    try:
+        return kind(value)
+    except (TypeError, ValueError, OverflowError) as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid {key}: {value!r}") from exc
+
+
+class FlashcardServer:
+    """Route HTTP requests to a ``SessionManager`` and batch its writes."""
+
+    def __init__(
+        self,
+        manager: SessionManager,
+        writer: SessionWriter,
+        write_batch: int = SERVER_WRITE_BATCH,
+        max_pending_writes: int = SERVER_MAX_PENDING_WRITES,
+        flush_seconds: float = STATS_FLUSH_SECONDS,
+        refresh_seconds: float = SERVER_SNAPSHOT_REFRESH_SECONDS,
+    ):
+        """Create the server.
+
+        Parameters:
+            manager: Sessions being served.
+            writer: Writer for answers and session numbers; used only on the executor.
+            write_batch: Buffered answers that trigger a write.
+            max_pending_writes: Writes allowed in flight before submits wait.
+            flush_seconds: Longest time an answer stays unwritten.
+            refresh_seconds: Interval between snapshot refreshes.
+        """
+
+        self.manager = manager
+        self.writer = writer
+        self.write_batch = max(write_batch, 1)
+        self.flush_seconds = flush_seconds
+        self.refresh_seconds = refresh_seconds
+        self.executor = BoundedExecutor(max_pending_writes)
+        self.latency = LatencyStats()
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._reserving: Optional[asyncio.Future[None]] = None
+        self._flusher: Optional[asyncio.Task[None]] = None
+        self._refresher: Optional[asyncio.Task[None]] = None
+
+    def _spawn(self, coroutine: Awaitable[Any]) -> None:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _reserve_session_ids(self) -> asyncio.Future[None]:
+        """Start reserving another block of session numbers unless one is already on its way."""
+
+        if self._reserving is None or self._reserving.done():
+            self._reserving = asyncio.ensure_future(
+                self.executor.run(self.writer.reserve_session_ids))
+        return self._reserving
+
+    async def _session_id(self) -> int:
+        """Return a review-log session number, refilling the reservation in the background.
+
+        The next block is requested once half of the current one is used, so
+        starts only wait on the writer when sessions open faster than it can
+        commit; concurrent waiters share one reservation.
+        """
+
+        while True:
+            session_id = self.writer.reserved_session_id()
+            if session_id is not None:
+                if self.writer.reserved_session_ids < self.writer.session_id_block // 2:
+                    self._reserve_session_ids()
+                return session_id
+            await asyncio.shield(self._reserve_session_ids())
+
+    async def flush(self) -> int:
+        """Write every buffered answer; returns the number of words updated.
+
+        Answers of an earlier failed write are still held by the writer and
+        go out with this one.
+        """
+
+        answers = self.manager.take_answers()
+        if not answers and not self.writer.pending:
+            return 0
+        started = time.perf_counter()
+        updated = await self.executor.run(self.writer.write, answers)
+        self.latency.add("write", time.perf_counter() - started)
+        return updated
+
+    async def _flush_periodically(self) -> None:
+        """Write buffered answers at least every ``flush_seconds`` and close idle sessions."""
+
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            self.manager.evict_idle()
+            try:
+                await self.flush()
+            except Exception:
+                # The writer keeps a failed batch and retries it on the next tick.
+                logger.exception("Writing buffered answers failed")
+
+    async def refresh_snapshot(self) -> bool:
+        """Re-read the vocabulary on the writer and start new sessions on it.
+
+        Returns:
+            Whether the snapshot changed.
+        """
+
+        snapshot = await self.executor.run(self.writer.updated_snapshot, self.manager.snapshot)
+        return self.manager.use_snapshot(snapshot)
+
+    async def _refresh_periodically(self) -> None:
+        """Refresh the shared snapshot every ``refresh_seconds``."""
+
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await self.refresh_snapshot()
+            except Exception:
+                logger.exception("Refreshing the vocabulary snapshot failed")
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as exc:
+                    writer.write(encode_response(exc.status, {"error": exc.message}, False))
+                    break
+                if request is None:
+                    break
+                started = time.perf_counter()
+                name, status, payload = await self.dispatch(request)
+                writer.write(encode_response(status, payload, request.keep_alive))
+                await writer.drain()
+                self.latency.add(name, time.perf_counter() - started)
+                if not request.keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            logger.exception("Connection handler failed")
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Request) -> tuple[str, HTTPStatus, Any]:
+        """Route a request and return (endpoint name, status, JSON payload)."""
+
+        parts = [part for part in request.path.split("/") if part]
+        name = "unknown"
+        try:
+            if parts == ["stats"] and request.method == "GET":
+                return "stats", HTTPStatus.OK, self.stats()
+            if parts == ["sessions"] and request.method == "POST":
+                name = "start"
+                return name, HTTPStatus.CREATED, await self.start(request.json())
+            if len(parts) == 3 and parts[0] == "sessions" and parts[2] in SESSION_ACTIONS:
+                name = parts[2]
+                if request.method != "POST":
+                    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED)
+                return name, HTTPStatus.OK, await self.session_action(
+                    parts[1], name, request.json())
+            raise HttpError(HTTPStatus.NOT_FOUND, f"No route for {request.method} {request.path}")
+        except HttpError as exc:
+            return name, exc.status, {"error": exc.message}
+        except Exception:
+            logger.exception("Request %s %s failed", request.method, request.path)
+            return name, HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Internal server error"}
+
+    async def start(self, body: dict[str, Any]) -> dict[str, Any]:
+        """Open a session from a start request."""
+
+        mode = _option(body, "mode", Mode, DEFAULT_FLASHCARD_MODE)
+        show = body.get("show") or {}
+        if not isinstance(show, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "show must be an object")
+        show_config = ShowAnswerConfig(
+            enabled=bool(show.get("enabled", True)),
+            score_penalty=_option(show, "score_penalty", int, 0),
+            max_uses=_option(show, "max_uses", int, None),
+            time_penalty=_option(show, "time_penalty", int, 0),
+        )
+        direction = _option(body, "direction", Direction, DEFAULT_DIRECTION)
+        difficulty = _option(body, "difficulty", int, DEFAULT_DIFFICULTY_LEVEL)
+        question_count = _option(body, "question_count", int, DEFAULT_QUESTION_COUNT)
+        time_limit = _option(body, "time_limit", int, DEFAULT_TIME_LIMIT)
+        wrong_penalty = _option(body, "wrong_penalty", int, PENALTY_POINTS)
+        session_id = await self._session_id()
+        try:
+            session = self.manager.start(
+                mode, direction, difficulty, show_config,
+                question_count, time_limit, wrong_penalty, session_id)
+        except ValueError as exc:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(exc)) from exc
+        return {"session": session.token, "state": _state_payload(session.state)}
+
+    async def session_action(self, token: str, action: str, body: dict[str, Any]) -> dict[str, Any]:
+        """Run ``next``, ``submit``, ``reveal`` or ``finish`` on a session."""
+
+        try:
+            state = self.manager.get(token).state
+        except KeyError as exc:
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown session {token}") from exc
+        if action == "next":
+            word = self.manager.next_card(token)
+            card = None
+            if word is not None:
+                card = {"number": state.asked, "prompt": state.current_prompt,
+                        "choices": state.current_choices,
+                        "direction": state.current_direction.value}
+            return {"card": card, "state": _state_payload(state)}
+        if action == "submit":
+            answer = body.get("answer")
+            if not isinstance(answer, str):
+                raise HttpError(HTTPStatus.BAD_REQUEST, "answer must be a string")
+            result = self.manager.submit(token, answer)
+            if result is None:
+                raise HttpError(HTTPStatus.CONFLICT, "No card is waiting for an answer")
+            await self._after_submit()
+            return {"correct": result.is_correct, "correct_answer": result.correct_answer,
+                    "delta": result.delta, "state": _state_payload(state)}
+        if action == "reveal":
+            word, direction = state.current_word, state.current_direction
+            outcome = self.manager.reveal(token)
+            payload = {"allowed": outcome.allowed, "score_delta": outcome.score_delta,
+                       "remaining_uses": outcome.remaining_uses,
+                       "time_penalty": outcome.time_penalty, "state": _state_payload(state)}
+            if outcome.allowed:
+                payload["answer"] = answer_text(word, direction)
+            return payload
+        return {"state": _state_payload(self.manager.finish(token))}
+
+    async def _after_submit(self) -> None:
+        """Start a write once a batch is full, waiting only if the writer is saturated."""
+
+        if self.manager.pending < self.write_batch:
+            return
+        if self.executor.saturated:
+            await self.flush()
+        else:
+            self._spawn(self.flush())
+
+    def stats(self) -> dict[str, Any]:
+        """Return server-side latency percentiles and backlog figures."""
+
+        return {
+            "sessions": len(self.manager),
+            "words": len(self.manager.snapshot),
+            "pending_answers": self.manager.pending,
+            "endpoints": self.latency.summary(),
+        }
+
+    async def serve(self, host: str, port: int,
+                    ready: Optional[Callable[[str, int], None]] = None,
+                    stop: Optional[asyncio.Event] = None) -> None:
+        """Listen until ``stop`` is set (or forever), then write everything buffered.
+
+        Parameters:
+            host: Interface to bind.
+            port: Port to bind; 0 picks a free one.
+            ready: Called with the bound address once listening.
+            stop: Event that shuts the server down.
+        """
+
+        await self._reserve_session_ids()
+        server = await asyncio.start_server(self.handle_connection, host, port,
+                                            limit=64 * 1024, backlog=4096)
+        bound_host, bound_port = server.sockets[0].getsockname()[:2]
+        if ready is not None:
+            ready(bound_host, bound_port)
+        self._flusher = asyncio.ensure_future(self._flush_periodically())
+        self._refresher = asyncio.ensure_future(self._refresh_periodically())
+        try:
+            async with server:
+                await (stop or asyncio.Event()).wait()
+        finally:
+            self._flusher.cancel()
+            self._refresher.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+            await self.flush()
+            self.executor.shutdown()
+            self.writer.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command-line parser for the server."""
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tak_flashcard.server",
+        description="Serve flashcard sessions over HTTP/JSON.")
+    parser.add_argument("--host", default=SERVER_HOST,
+                        help="interface to bind; 0.0.0.0 serves the whole LAN")
+    parser.add_argument("--port", type=int, default=SERVER_PORT, help="0 picks a free port")
+    parser.add_argument("--db", type=Path,
+                        help="database file; the application database when omitted")
+    parser.add_argument("--write-batch", type=int, default=SERVER_WRITE_BATCH)
+    parser.add_argument("--max-pending-writes", type=int, default=SERVER_MAX_PENDING_WRITES)
+    parser.add_argument("--idle-seconds", type=float, default=SERVER_SESSION_IDLE_SECONDS,
+                        help="close sessions without a request for this long")
+    return parser
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Build the server from parsed arguments and serve until interrupted."""
+
+    from tak_flashcard.cli import open_database
+    from tak_flashcard.features.flashcard.manager import VocabularySnapshot
+
+    db = open_database(args.db)
+    snapshot = VocabularySnapshot.load(db)
+    db.rollback()
+    manager = SessionManager(snapshot, idle_seconds=args.idle_seconds)
+    server = FlashcardServer(manager, SessionWriter(db, SERVER_SESSION_ID_BLOCK),
+                             args.write_batch, args.max_pending_writes)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    def announce(host: str, port: int) -> None:
+        """Print the address so scripts can connect."""
+
+        print(f"Serving {len(snapshot)} words on http://{host}:{port}", flush=True)
+
+    await server.serve(args.host, args.port, announce, stop)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run the session server from the command line."""
+
+    asyncio.run(_run(build_parser().parse_args(argv)))
@@ -0,0 +1,105 @@
+"""Minimal HTTP/1.1 request parsing and JSON responses over asyncio streams.
+
+Just enough HTTP for a LAN JSON API: one request per message with a
+``Content-Length`` body, persistent connections, and no chunked encoding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Any, NamedTuple, Optional
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 64 * 1024
+
+
+class HttpError(Exception):
+    """A request that must be answered with an error status."""
+
+    def __init__(self, status: HTTPStatus, message: str = ""):
+        """Create the error with the status to send and a message for the body."""
+
+        super().__init__(message or status.phrase)
+        self.status = status
+        self.message = message or status.phrase
+
+
+class Request(NamedTuple):
+    """One parsed HTTP request."""
+
+    method: str
+    path: str
+    headers: dict[str, str]
+    body: bytes
+
+    @property
+    def keep_alive(self) -> bool:
+        """Return whether the client wants the connection kept open."""
+
+        return self.headers.get("connection", "").lower() != "close"
+
+    def json(self) -> dict[str, Any]:
+        """Return the body parsed as a JSON object; an empty body is ``{}``.
+
+        Raises:
+            HttpError: If the body is not a JSON object.
+        """
+
+        if not self.body:
+            return {}
+        try:
+            payload = json.loads(self.body)
+        except ValueError as exc:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a JSON object")
+        return payload
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Read one request, or return None when the client closed the connection.
+
+    Raises:
+        HttpError: If the request is malformed or too large.
+    """
+
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _version = line.decode("latin-1").split()
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line") from exc
+    headers: dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE)
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as exc:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length") from exc
+    if length < 0 or length > MAX_BODY_BYTES:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+    body = await reader.readexactly(length) if length else b""
+    return Request(method.upper(), target.split("?", 1)[0], headers, body)
+
+
+def encode_response(status: HTTPStatus, payload: Any, keep_alive: bool = True) -> bytes:
+    """Serialize a JSON response with its status line and headers."""
+
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return head.encode("latin-1") + body
@@ -1,22 +1,191 @@
-"""Font discovery and management utilities."""
+"""Font discovery and management utilities.
+
+Enumerating font families can take hundreds of milliseconds on systems with
+large font collections, so the result is cached on disk next to the user
+settings. The cache is keyed by a fingerprint of the system font
+directories and is reused across launches until a directory changes.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import queue
+import sys
+import threading
 import tkinter as tk
 import tkinter.font as tk_font
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from tak_flashcard.config import FONT_CACHE_PATH
+
+CACHE_FORMAT = 1
+
+
+def _font_directories() -> list[Path]:
+    """Return the directories fontconfig and the platform scan for fonts."""
+
+    home = Path.home()
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR", r"C:\Windows")
+        local = os.environ.get("LOCALAPPDATA", str(home / "AppData" / "Local"))
+        return [Path(windir) / "Fonts", Path(local) / "Microsoft" / "Windows" / "Fonts"]
+    if sys.platform == "darwin":
+        return [Path("/System/Library/Fonts"), Path("/Library/Fonts"), home / "Library" / "Fonts"]
+    data_home = Path(os.environ.get("XDG_DATA_HOME", str(home / ".local" / "share")))
+    return [
+        Path("/usr/share/fonts"),
+        Path("/usr/local/share/fonts"),
+        data_home / "fonts",
+        home / ".fonts",
+    ]
 
 
-def get_available_fonts() -> list[str]:
+def _directory_stamps(directory: Path) -> Iterator[str]:
+    """Yield modification stamps for a font directory and its subdirectories.
+
+    Adding or removing a font changes the mtime of the directory holding it,
+    which is the same signal fontconfig uses to invalidate its own caches.
     """
-    Discover all available fonts on the system.
+
+    try:
+        yield f"{directory}:{directory.stat().st_mtime_ns}"
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _directory_stamps(Path(entry.path))
+    except OSError:
+        return
+
+
+def font_fingerprint() -> str:
+    """Return a digest identifying the current set of installed fonts."""
+
+    digest = hashlib.sha1(f"{CACHE_FORMAT}:{sys.platform}:{tk.TkVersion}".encode())
+    for directory in _font_directories():
+        for stamp in _directory_stamps(directory):
+            digest.update(stamp.encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def read_font_cache(path: Path = FONT_CACHE_PATH, fingerprint: Optional[str] = None) -> Optional[list[str]]:
+    """Return cached font families if the cache matches the fingerprint.
+
+    Parameters:
+        path: Cache file location.
+        fingerprint: Expected fingerprint; computed when omitted.
 
     Returns:
-        A sorted list of system font names.
+        The cached families, or None when missing, unreadable or stale.
+    """
+
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("fingerprint") != (fingerprint or font_fingerprint()):
+        return None
+    families = payload.get("families")
+    return list(families) if isinstance(families, list) else None
+
+
+def write_font_cache(families: list[str], fingerprint: str, path: Path = FONT_CACHE_PATH) -> None:
+    """Atomically replace the font cache file."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps({"fingerprint": fingerprint, "families": families}),
+                         encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _enumerate_fonts(root: tk.Misc) -> list[str]:
+    """Query Tk for font families through ``root``.
+
+    Tcl interpreters are bound to the thread that created them, so this must
+    run on the Tk thread.
     """
-    root = tk.Tk()
-    root.withdraw()
+
+    return sorted(set(tk_font.families(root)))
+
+
+def _write_font_cache_quietly(families: list[str], fingerprint: str, path: Path) -> None:
+    """Write the font cache, ignoring an unwritable location."""
+
     try:
-        fonts = sorted(tk_font.families())
-    finally:
-        root.destroy()
-    return fonts
+        write_font_cache(families, fingerprint, path)
+    except OSError:
+        pass
+
+
+class FontLoader:
+    """Load font families without blocking the Tk event loop.
+
+    The directory fingerprint and the cache file are read on a worker thread
+    and the result is polled from the Tk thread with ``after``, as the app
+    does for its database bootstrap. Only a stale cache costs a Tk query on
+    the Tk thread; the rebuilt cache is written on another worker.
+    """
+
+    def __init__(self, root: tk.Misc, cache_path: Path = FONT_CACHE_PATH, poll_ms: int = 50):
+        """Create a loader that schedules its callbacks on ``root``.
+
+        Parameters:
+            root: Tk widget used for the query and for scheduling.
+            cache_path: Location of the on-disk font cache.
+            poll_ms: Interval between checks for the worker's result.
+        """
+
+        self.root = root
+        self.cache_path = cache_path
+        self.poll_ms = poll_ms
+        self.families: Optional[list[str]] = None
+        self._callbacks: list[Callable[[list[str]], None]] = []
+        self._results: queue.Queue[tuple[str, Optional[list[str]]]] = queue.Queue()
+        self._started = False
+
+    def load(self, on_ready: Optional[Callable[[list[str]], None]] = None) -> None:
+        """Start loading if needed and call ``on_ready`` with the families.
+
+        Parameters:
+            on_ready: Called on the Tk thread once the families are known;
+                immediately when they already are.
+        """
+
+        if self.families is not None:
+            if on_ready is not None:
+                on_ready(self.families)
+            return
+        if on_ready is not None:
+            self._callbacks.append(on_ready)
+        if self._started:
+            return
+        self._started = True
+        threading.Thread(target=self._read_cache, name="font-cache", daemon=True).start()
+        self.root.after(self.poll_ms, self._poll)
+
+    def _read_cache(self) -> None:
+        """Worker-thread body: fingerprint the font directories and read the cache."""
+
+        fingerprint = font_fingerprint()
+        self._results.put((fingerprint, read_font_cache(self.cache_path, fingerprint)))
+
+    def _poll(self) -> None:
+        """Deliver the worker's result, enumerating through Tk if the cache was stale."""
+
+        try:
+            fingerprint, families = self._results.get_nowait()
+        except queue.Empty:
+            self.root.after(self.poll_ms, self._poll)
+            return
+        if families is None:
+            families = _enumerate_fonts(self.root)
+            threading.Thread(target=_write_font_cache_quietly,
+                             args=(families, fingerprint, self.cache_path),
+                             name="font-cache-write", daemon=True).start()
+        self.families = families
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(families)
@@ -0,0 +1,41 @@
+"""Text normalization helpers."""
+
+from __future__ import annotations
+
+import unicodedata
+
+# Letters that carry no combining mark in NFD but should still fold.
+_EXTRA_FOLDS = str.maketrans({"đ": "d", "Đ": "D"})
+
+
+def normalize_text(text: str | None) -> str:
+    """Return NFC-normalized, lower-cased text with diacritics kept.
+
+    Parameters:
+        text: Text to normalize; None is treated as empty.
+
+    Returns:
+        The normalized text, e.g. ``"Đường"`` -> ``"đường"``.
+    """
+
+    if not text:
+        return ""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def fold_text(text: str | None) -> str:
+    """Lower-case text and strip diacritics, e.g. ``"Đường"`` -> ``"duong"``.
+
+    Parameters:
+        text: Text to fold; None is treated as empty.
+
+    Returns:
+        The folded, NFC-normalized text.
+    """
+
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFD", text.translate(_EXTRA_FOLDS))
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char))
+    return unicodedata.normalize("NFC", stripped).lower()
@@ -0,0 +1,99 @@
+"""Lightweight timing of application startup phases and operation latencies."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import deque
+from typing import Callable, Optional, Sequence, TextIO
+
+
+class StartupTimer:
+    """Record named milestones relative to a common starting point."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """Start timing now.
+
+        Parameters:
+            clock: Monotonic time source in seconds.
+        """
+
+        self._clock = clock
+        self.started = clock()
+        self.marks: list[tuple[str, float]] = []
+
+    def mark(self, label: str) -> float:
+        """Record a milestone and return its offset in seconds."""
+
+        offset = self._clock() - self.started
+        self.marks.append((label, offset))
+        return offset
+
+    def offset(self, label: str) -> Optional[float]:
+        """Return the offset of the first milestone with ``label``, if any."""
+
+        for name, offset in self.marks:
+            if name == label:
+                return offset
+        return None
+
+    def as_dict(self) -> dict[str, float]:
+        """Return milestone offsets in milliseconds, keyed by label."""
+
+        return {label: round(offset * 1000, 1) for label, offset in self.marks}
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        """Write one line per milestone with its offset and the step before it."""
+
+        previous = 0.0
+        stream.write("startup timing:\n")
+        for label, offset in self.marks:
+            stream.write(f"  {offset * 1000:8.1f} ms  (+{(offset - previous) * 1000:7.1f})  {label}\n")
+            previous = offset
+        stream.flush()
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Return the sample at ``fraction`` (0-1) of an ascending sequence, or 0.0 if empty."""
+
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class LatencyStats:
+    """Recent latency samples per operation, summarized as percentiles."""
+
+    def __init__(self, window: int = 100_000):
+        """Create empty statistics.
+
+        Parameters:
+            window: Most recent samples kept per operation.
+        """
+
+        self.window = window
+        self.counts: dict[str, int] = {}
+        self._samples: dict[str, deque[float]] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        """Record one operation's duration."""
+
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(seconds)
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return count, p50, p99 and max in milliseconds per operation."""
+
+        report = {}
+        for name, samples in sorted(self._samples.items()):
+            ordered = sorted(samples)
+            report[name] = {
+                "count": self.counts[name],
+                "p50_ms": round(percentile(ordered, 0.50) * 1000, 3),
+                "p99_ms": round(percentile(ordered, 0.99) * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return report
@@ -0,0 +1,45 @@
+"""Shared fixtures: a fresh file database per test."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from tak_flashcard.db import repo  # noqa: E402
+from tak_flashcard.db.session import create_sqlite_engine, init_db  # noqa: E402
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Return an engine on an empty, fully migrated database."""
+
+    engine = create_sqlite_engine(tmp_path / "test.db")
+    init_db(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """Return a session configured like the application's."""
+
+    session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def words(db):
+    """Insert a few words and return their ids in English order."""
+
+    repo.bulk_insert_words(db, [
+        {"english": english, "vietnamese": vietnamese, "part_of_speech": "noun"}
+        for english, vietnamese in [("cat", "con mèo"), ("dog", "con chó"), ("fish", "con cá")]
+    ])
+    db.commit()
+    return [word.id for word in repo.list_words(db)]
@@ -0,0 +1,46 @@
+"""Tests for dictionary reads alongside a running flashcard session."""
+
+from __future__ import annotations
+
+from tak_flashcard.constants import Direction, Mode
+from tak_flashcard.features.dictionary.service import DictionaryService
+from tak_flashcard.features.flashcard.controller import FlashcardController
+from tak_flashcard.features.flashcard.states import ShowAnswerConfig
+
+
+def _answer_one(controller: FlashcardController) -> int:
+    """Answer one card correctly and return its word id."""
+
+    controller.start(Mode.ENDLESS, Direction.ENG_TO_VN, 3, ShowAnswerConfig(), None, None)
+    word = controller.next_card()
+    controller.submit(word.vietnamese)
+    return word.id
+
+
+def _counts(service: DictionaryService) -> dict[int, int]:
+    """Return display counts by word id as the dictionary shows them."""
+
+    return {word.id: word.display_count for word in service.all_words()}
+
+
+def test_dictionary_sees_answers_flushed_by_the_timer(db, words):
+    controller = FlashcardController(db)
+    service = DictionaryService(db, controller.sync_stats)
+    assert set(_counts(service).values()) == {0}
+
+    word_id = _answer_one(controller)
+    # The app's periodic flush writes the answer before the dictionary reads.
+    controller.flush(force=True)
+
+    assert _counts(service)[word_id] == 1
+
+
+def test_dictionary_flushes_buffered_answers(db, words):
+    controller = FlashcardController(db)
+    service = DictionaryService(db, controller.sync_stats)
+    _counts(service)
+
+    word_id = _answer_one(controller)
+
+    assert _counts(service)[word_id] == 1
+    assert len(controller.service.stats) == 0
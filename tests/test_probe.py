@@ -0,0 +1,56 @@
+"""Tests for out-of-core card selection."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+
+from tak_flashcard.core.difficulty import DIFFICULTY_BUCKETS, difficulty_bucket, selection_weight
+from tak_flashcard.db import repo
+from tak_flashcard.features.flashcard.probe import ProbeDeck
+
+WORDS_PER_BUCKET = 10
+# The hardest buckets, where weights at levels 1-2 differ most within a bucket.
+BUCKETS = range(DIFFICULTY_BUCKETS - 3, DIFFICULTY_BUCKETS)
+
+
+def _difficulties() -> list[float]:
+    """Return evenly spread difficulties, ``WORDS_PER_BUCKET`` per bucket of ``BUCKETS``."""
+
+    step = 1.0 / (DIFFICULTY_BUCKETS * WORDS_PER_BUCKET)
+    first = BUCKETS[0] * WORDS_PER_BUCKET
+    return [(index + 0.5) * step for index in range(first, first + len(BUCKETS) * WORDS_PER_BUCKET)]
+
+
+@pytest.fixture
+def graded_deck(db):
+    """Return a deck whose buckets each hold one contiguous run of ids.
+
+    Without id gaps inside a bucket every rowid probe is uniform, so the
+    draws should follow the per-word weights exactly.
+    """
+
+    repo.bulk_insert_words(db, [
+        {"english": f"word{index}", "vietnamese": f"từ{index}", "part_of_speech": "noun",
+         "difficulty": difficulty}
+        for index, difficulty in enumerate(_difficulties())
+    ])
+    db.commit()
+    return ProbeDeck(db)
+
+
+@pytest.mark.parametrize("level", [1, 5])
+def test_bucket_draws_follow_word_weights(graded_deck, level):
+    sampler = graded_deck.sampler_for(level)
+    rng = random.Random(level)
+    draws = 10_000
+    drawn = Counter(difficulty_bucket(sampler.sample(rng).difficulty) for _ in range(draws))
+
+    expected: Counter[int] = Counter()
+    for difficulty in _difficulties():
+        expected[difficulty_bucket(difficulty)] += selection_weight(difficulty, level)
+    total = sum(expected.values())
+    for bucket in BUCKETS:
+        assert drawn[bucket] / draws == pytest.approx(expected[bucket] / total, abs=0.015)
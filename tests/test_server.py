@@ -0,0 +1,49 @@
+"""Tests for the session server's batched writes."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from tak_flashcard.db import repo
+from tak_flashcard.db.models import Review, Word
+from tak_flashcard.features.flashcard.manager import SessionManager, SessionWriter, VocabularySnapshot
+from tak_flashcard.server.app import FlashcardServer
+
+
+def test_failed_write_is_retried_without_double_counting(engine, db, words, monkeypatch):
+    snapshot = VocabularySnapshot.load(db)
+    db.rollback()
+    writer_db = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    server = FlashcardServer(SessionManager(snapshot), SessionWriter(writer_db, 8))
+    append_reviews = repo.append_reviews
+
+    def failing_append(*args, **kwargs):
+        """Fail once, like a locked database would."""
+
+        monkeypatch.setattr(repo, "append_reviews", append_reviews)
+        raise RuntimeError("disk full")
+
+    async def scenario() -> None:
+        """Answer three cards, fail the first write, then retry."""
+
+        token = (await server.start({"mode": "endless"}))["session"]
+        for _ in range(3):
+            await server.session_action(token, "next", {})
+            await server.session_action(token, "submit", {"answer": "wrong"})
+        monkeypatch.setattr(repo, "append_reviews", failing_append)
+        with pytest.raises(RuntimeError):
+            await server.flush()
+        assert server.writer.pending == 3
+        await server.flush()
+        server.executor.shutdown()
+
+    asyncio.run(scenario())
+    writer_db.close()
+
+    assert db.scalar(select(func.sum(Word.display_count))) == 3
+    assert db.scalar(select(func.sum(Word.correct_count))) == 0
+    assert db.scalar(select(func.count()).select_from(Review)) == 3
@@ -0,0 +1,43 @@
+"""Tests for the write-behind statistics buffer."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import func, select
+
+from tak_flashcard.db import repo
+from tak_flashcard.db.models import Review, Word
+from tak_flashcard.db.records import ReviewEvent
+from tak_flashcard.db.writer import StatsBuffer
+
+
+def _event(word_id: int, correct: bool) -> ReviewEvent:
+    """Return a review-log entry for one answer."""
+
+    return ReviewEvent(word_id=word_id, session_id=1, answered_at=1_700_000_000,
+                       latency_ms=500, direction=0, mode=0, correct=int(correct))
+
+
+def test_failed_flush_is_retried_exactly_once(db, words, monkeypatch):
+    buffer = StatsBuffer(db, flush_every=100, flush_seconds=float("inf"))
+    buffer.record(words[0], True, _event(words[0], True))
+
+    append_reviews = repo.append_reviews
+
+    def failing_append(*args, **kwargs):
+        """Fail once, like a locked database would."""
+
+        monkeypatch.setattr(repo, "append_reviews", append_reviews)
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(repo, "append_reviews", failing_append)
+    with pytest.raises(RuntimeError):
+        buffer.flush()
+    assert len(buffer) == 1
+
+    assert buffer.flush() == 1
+    word = db.get(Word, words[0])
+    db.refresh(word)
+    assert (word.display_count, word.correct_count) == (1, 1)
+    assert db.scalar(select(func.count()).select_from(Review)) == 1
+    assert len(buffer) == 0